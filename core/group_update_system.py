@@ -55,6 +55,7 @@ def control_center(event):
     # Unlike main trees, groups can't do this via GroupTreeEvent because it
     # should be called only when a group is edited by user
     elif type(event) is ev.UndoEvent:
+        us.UpdateTree.invalidate_topology()
         for gt in BlTrees().sv_group_trees:
             GroupUpdateTree.get(gt).is_updated = False
 
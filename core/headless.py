@@ -0,0 +1,110 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Synchronous evaluation of trees without the timer and without any UI work.
+It's intended for scripts running in background mode (`blender -b`). Usage:
+
+    from sverchok.core.headless import evaluate_file
+    for result in evaluate_file("/path/to/file.blend"):
+        print(result.tree_name, result.total_time, result.errors)
+        verts = result.outputs["Box", "Vertices"]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Optional
+
+import bpy
+import sverchok.core.tasks as ts
+from sverchok.core.sv_custom_exceptions import SvNoDataError
+from sverchok.core.socket_data import get_output_socket_data
+from sverchok.core.update_system import UpdateTree, TIME_KEY, ERROR_KEY
+from sverchok.utils.handle_blender_data import BlTrees
+
+if TYPE_CHECKING:
+    from sverchok.node_tree import SverchCustomTree as SvTree
+
+
+class TreeEvaluation:
+    """Result of evaluation of a tree"""
+    def __init__(self, tree_name: str):
+        """:node_times: execution time of evaluated nodes
+        :errors: errors of nodes which failed
+        :outputs: data of output sockets by node and socket names
+        :total_time: time of the whole evaluation"""
+        self.tree_name = tree_name
+        self.node_times: dict[str, float] = dict()
+        self.errors: dict[str, str] = dict()
+        self.outputs: dict[tuple[str, str], Any] = dict()
+        self.total_time = 0.
+
+    def __repr__(self):
+        return f"<TreeEvaluation {self.tree_name} nodes={len(self.node_times)} " \
+               f"errors={len(self.errors)} time={self.total_time:.3f}s>"
+
+
+def evaluate_tree(tree: SvTree, outputs: Iterable[tuple[str, str]] = None,
+                  force=True) -> TreeEvaluation:
+    """Evaluates the tree synchronously and returns timings and output data
+    :outputs: node and socket names which data should be returned, if None
+    data of all outputs of evaluated nodes is returned. The data is not
+    copied, it should not be modified
+    :force: if True all nodes are evaluated otherwise only outdated ones"""
+    if force:
+        UpdateTree.reset_tree(tree)
+
+    # only evaluated nodes will get new time
+    for node in tree.nodes:
+        if TIME_KEY in node:
+            del node[TIME_KEY]
+
+    result = TreeEvaluation(tree.name)
+    start = perf_counter()
+    for _ in UpdateTree.main_update(tree, update_interface=False):
+        pass
+    result.total_time = perf_counter() - start
+
+    # the tree is already up to date
+    ts.tasks.discard(tree)
+
+    for node in tree.nodes:
+        if (time := node.get(TIME_KEY)) is not None:
+            result.node_times[node.name] = time
+        if error := node.get(ERROR_KEY):
+            result.errors[node.name] = error
+
+    if outputs is None:
+        outputs = [(n, s.name) for n in result.node_times for s in tree.nodes[n].outputs]
+    for node_name, socket_name in outputs:
+        data = _output_data(tree.nodes[node_name], socket_name)
+        if data is not None:
+            result.outputs[node_name, socket_name] = data
+    return result
+
+
+def evaluate_file(file_path: str, tree_names: Iterable[str] = None,
+                  outputs: Iterable[tuple[str, str]] = None) -> Iterator[TreeEvaluation]:
+    """Opens the file and evaluates its trees one by one. Data of previous
+    trees is kept until the next file is opened.
+    :tree_names: names of trees to evaluate, all main trees by default"""
+    bpy.ops.wm.open_mainfile(filepath=file_path)
+    if tree_names is None:
+        trees = list(BlTrees().sv_main_trees)
+    else:
+        trees = [bpy.data.node_groups[n] for n in tree_names]
+    for tree in trees:
+        yield evaluate_tree(tree, outputs)
+
+
+def _output_data(node, socket_name) -> Optional[Any]:
+    try:
+        return get_output_socket_data(node, socket_name)
+    except SvNoDataError:
+        return None
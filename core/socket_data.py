@@ -18,12 +18,24 @@
 
 """For internal usage of the sockets module"""
 
-from collections import UserDict
+import hashlib
+import io
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import zlib
+from collections import UserDict, OrderedDict, defaultdict
 from itertools import chain
+from operator import itemgetter
 from traceback import format_list, extract_stack
 from typing import NewType, Optional, Literal
 
+import numpy as np
+
 from bpy.types import NodeSocket
+import sverchok.settings as settings
 from sverchok.core.sv_custom_exceptions import SvNoDataError
 from sverchok.utils.logging import debug
 from sverchok.utils.handle_blender_data import BlTrees
@@ -153,10 +165,220 @@ class DebugMemory(UserDict):
             return f"{start}...{end}"
 
 
+def estimate_size(data) -> int:
+    """Approximate number of bytes occupied by socket data. Arrays report
+    their buffer size. Lists are measured recursively, but lists of flat
+    sequences (vertices, edges, polygons) are supposed to be homogeneous, so
+    only their first item is measured to keep the estimation cheap"""
+    if isinstance(data, np.ndarray):
+        # views do not own their buffers but keep them alive
+        return max(sys.getsizeof(data), data.nbytes)
+    if isinstance(data, (list, tuple)):
+        size = sys.getsizeof(data)
+        if not data:
+            return size
+        first = data[0]
+        if isinstance(first, (list, tuple)) and (not first or not isinstance(first[0], (list, tuple, np.ndarray))):
+            return size + len(data) * estimate_size(first)
+        if not isinstance(first, (list, tuple, np.ndarray)):
+            return size + len(data) * sys.getsizeof(first)
+        return size + sum(estimate_size(d) for d in data)
+    return sys.getsizeof(data)
+
+
+class LimitedMemory(UserDict):
+    """Socket data storage with memory budget. Size of every value is
+    estimated when it is set. When total size exceeds the limit the least
+    recently used values are pickled, compressed and moved to disk. They are
+    loaded back when they are requested again. Input and output sockets can
+    keep the same object, such values are counted and spilled only once.
+    Values which can't be pickled are kept in memory."""
+
+    def __init__(self, data, limit: int):
+        """:limit: memory budget in bytes"""
+        self.data = data
+        self.limit = limit
+
+        self._key_obj: dict[SockId, int] = dict()  # socket id -> object id
+        self._obj_keys: dict[int, set[SockId]] = defaultdict(set)
+        self._obj_sizes: dict[int, int] = dict()
+        self._lru: OrderedDict[int, None] = OrderedDict()  # ids of spillable objects, first is the oldest
+        self._pinned: set[int] = set()  # unpicklable objects, they are not in the LRU order
+        self._size = 0
+
+        self._spilled: dict[SockId, str] = dict()  # socket id -> file path
+        self._path_keys: dict[str, set[SockId]] = defaultdict(set)
+        self._directory: Optional[str] = None
+        self._file_index = 0
+
+        for key, value in self.data.items():
+            self._account(key, value)
+        self._evict()
+
+    @property
+    def size(self) -> int:
+        """Estimated size of data kept in memory"""
+        return self._size
+
+    @property
+    def spilled_number(self) -> int:
+        """Number of values moved to disk"""
+        return len(self._spilled)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __getitem__(self, key):
+        if key in self.data:
+            obj_id = self._key_obj[key]
+            if obj_id in self._lru:
+                self._lru.move_to_end(obj_id)
+            return self.data[key]
+        elif key in self._spilled:
+            return self._load(key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._discard(key)
+        self.data[key] = value
+        self._account(key, value)
+        self._evict()
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._discard(key)
+
+    def __contains__(self, key):
+        return key in self.data or key in self._spilled
+
+    def __iter__(self):
+        yield from self.data
+        yield from self._spilled
+
+    def __len__(self):
+        return len(self.data) + len(self._spilled)
+
+    def clear(self):
+        self.data.clear()
+        self._key_obj.clear()
+        self._obj_keys.clear()
+        self._obj_sizes.clear()
+        self._lru.clear()
+        self._pinned.clear()
+        self._size = 0
+        self._spilled.clear()
+        self._path_keys.clear()
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def _account(self, key, value):
+        obj_id = id(value)
+        self._key_obj[key] = obj_id
+        self._obj_keys[obj_id].add(key)
+        if obj_id not in self._obj_sizes:
+            size = estimate_size(value)
+            self._obj_sizes[obj_id] = size
+            self._size += size
+        if obj_id not in self._pinned:
+            self._lru[obj_id] = None
+            self._lru.move_to_end(obj_id)
+
+    def _discard(self, key):
+        if key in self.data:
+            del self.data[key]
+            obj_id = self._key_obj.pop(key)
+            keys = self._obj_keys[obj_id]
+            keys.discard(key)
+            if not keys:
+                del self._obj_keys[obj_id]
+                self._size -= self._obj_sizes.pop(obj_id)
+                self._lru.pop(obj_id, None)
+                self._pinned.discard(obj_id)
+        elif key in self._spilled:
+            path = self._spilled.pop(key)
+            keys = self._path_keys[path]
+            keys.discard(key)
+            if not keys:
+                del self._path_keys[path]
+                self._remove_file(path)
+
+    def _evict(self):
+        """Move the oldest values to disk until the data fits the limit.
+        The last used value is never moved"""
+        if self._size <= self.limit or not self._lru:
+            return
+        newest = next(reversed(self._lru))
+        while self._size > self.limit and self._lru:
+            oldest = next(iter(self._lru))
+            if oldest == newest:
+                break
+            self._spill(oldest)
+
+    def _spill(self, obj_id):
+        keys = self._obj_keys[obj_id]
+        value = self.data[next(iter(keys))]
+        try:
+            dump = zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL), 1)
+        except Exception:
+            self._pinned.add(obj_id)
+            del self._lru[obj_id]
+            return
+
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix='sverchok_socket_data_')
+        self._file_index += 1
+        path = os.path.join(self._directory, f"{self._file_index}.pkl.z")
+        with open(path, 'wb') as file:
+            file.write(dump)
+
+        for key in list(keys):
+            self._discard(key)
+            self._spilled[key] = path
+            self._path_keys[path].add(key)
+        debug(f"Socket data moved to disk: {path}")
+
+    def _load(self, key):
+        path = self._spilled[key]
+        with open(path, 'rb') as file:
+            value = pickle.loads(zlib.decompress(file.read()))
+        # all sockets which shared the object should share it again
+        for k in list(self._path_keys[path]):
+            self._discard(k)
+            self.data[k] = value
+            self._account(k, value)
+        self._evict()
+        return value
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
 socket_data_cache: dict[SockId, list] = dict()
 # socket_data_cache = DebugMemory(socket_data_cache)
 
 
+def set_cache_limit(limit_mb: int):
+    """Set memory budget of the socket data cache in megabytes.
+    Zero means that the cache is not limited"""
+    global socket_data_cache
+    if limit_mb:
+        if isinstance(socket_data_cache, LimitedMemory):
+            socket_data_cache.limit = limit_mb * 2**20
+            socket_data_cache._evict()
+        else:
+            socket_data_cache = LimitedMemory(socket_data_cache, limit_mb * 2**20)
+    elif isinstance(socket_data_cache, LimitedMemory):
+        data = {k: socket_data_cache[k] for k in list(socket_data_cache)}
+        socket_data_cache.clear()
+        socket_data_cache = data
+
+
 def sv_deep_copy(lst):
     """return deep copied data of list/tuple structure"""
     # faster than builtin deep copy for us.
@@ -164,14 +386,211 @@ def sv_deep_copy(lst):
     # we should be able to specify vectors here to get them create
     # or stop destroying them when in vector socket.
     if isinstance(lst, (list, tuple)):
-        if lst and not isinstance(lst[0], (list, tuple)):
-            return lst[:]
+        if lst:
+            first = lst[0]
+            if not isinstance(first, (list, tuple)):
+                return lst[:]
+            # tuples of numbers (vertices) are immutable, copying them is waste
+            if isinstance(lst, list) and _is_flat_tuples(lst):
+                return lst[:]
         return [sv_deep_copy(l) for l in lst]
     return lst
 
 
+def _is_flat_tuples(lst) -> bool:
+    """True if all items of the list are not empty tuples which first values
+    are not lists or tuples, deep copy would return such items as they are"""
+    if set(map(type, lst)) != {tuple}:
+        return False
+    try:
+        value_types = set(map(type, map(itemgetter(0), lst)))
+    except IndexError:
+        return False
+    return not any(issubclass(t, (list, tuple)) for t in value_types)
+
+
+class CowList(list):
+    """Copy-on-write view of socket data. It shares nested lists with the
+    data of an output socket. A nested list is copied only when it is taken
+    from the view by index, or all of them are copied when the view is
+    iterated or changed, so the original data can't be modified via the
+    view. Nested lists are views themselves, so the parts of data which a
+    node does not read are never copied.
+
+    Some C functions read items of lists directly. Concatenation and
+    repetition are overridden to copy the items first, but assigning the
+    view to a slice of another list (`lst[:] = view`) shares the items of
+    the original data, use `list(view)` instead."""
+    __slots__ = ('_own',)
+
+    def __init__(self, data=()):
+        super().__init__(data)
+        self._own = None  # indexes of copied items, True if all are copied
+
+    def __getitem__(self, index):
+        item = super().__getitem__(index)
+        if type(index) is slice:
+            return cow_copy(item)
+        own = self._own
+        if own is True:
+            return item
+        if index < 0:
+            index += len(self)
+        if own is None:
+            own = self._own = set()
+        elif index in own:
+            return item
+        if isinstance(item, (list, tuple)):
+            item = cow_copy(item)
+            super().__setitem__(index, item)
+        own.add(index)
+        return item
+
+    def __iter__(self):
+        if self._own is not True:
+            self._copy_items()
+        return super().__iter__()
+
+    def __radd__(self, other):
+        # `list + view` would take items of the view bypassing __getitem__
+        if self._own is not True:
+            self._copy_items()
+        return list.__add__(other, self) if isinstance(other, list) else NotImplemented
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def _copy_items(self):
+        own = self._own or ()
+        set_item = super().__setitem__
+        for i, item in enumerate(super().__iter__()):
+            if i not in own and isinstance(item, (list, tuple)):
+                set_item(i, cow_copy(item))
+        self._own = True
+
+
+def _copy_items_before(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args):
+        if self._own is not True:
+            self._copy_items()
+        return method(self, *args)
+    wrapper.__name__ = name
+    return wrapper
+
+
+# all methods which change the list or expose its items bypassing __getitem__
+for _name in ['__setitem__', '__delitem__', '__iadd__', '__imul__', '__add__',
+              '__mul__', '__rmul__', '__reversed__', 'append', 'extend',
+              'insert', 'pop', 'remove', 'clear', 'sort', 'reverse', 'copy']:
+    setattr(CowList, _name, _copy_items_before(_name))
+
+
+def cow_copy(data):
+    """Alternative to sv_deep_copy which does not copy nested lists until
+    they are read"""
+    if isinstance(data, (list, tuple)):
+        if not data:
+            return [] if isinstance(data, list) else data
+        first = data[0]
+        if not isinstance(first, (list, tuple)):
+            return data[:]
+        if isinstance(data, list) and _is_flat_tuples(data):
+            return data[:]
+        if isinstance(data, CowList):
+            data = list.copy(data)  # take items as they are
+        return CowList(data)
+    return data
+
+
+copy_data = sv_deep_copy
+
+
+def set_copy_on_write(enabled: bool):
+    """Switch the way how data of linked input sockets is copied"""
+    global copy_data
+    copy_data = cow_copy if enabled else sv_deep_copy
+
+
+socket_fingerprints: dict[SockId, Optional[bytes]] = dict()
+_VALUE_TYPES = {int, float, bool, str, tuple, type(None),
+                np.int32, np.int64, np.float32, np.float64, np.bool_}
+# objects of these modules are compared by their pickled state
+_MODEL_MODULES = ('sverchok.utils.curve.', 'sverchok.utils.surface.', 'sverchok.utils.field.')
+
+
+def data_fingerprint(data) -> Optional[bytes]:
+    """Digest of socket data. Arrays are hashed by their buffers, lists
+    by their structure, values and types of values, curves, surfaces and
+    fields by their pickled state and solids by their BREP. Returns None if
+    the data has objects which can't be compared by value (matrices,
+    dictionaries, curves with Python functions etc.)"""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        _update_digest(digest, data)
+    except (TypeError, pickle.PicklingError, AttributeError):
+        return None
+    return digest.digest()
+
+
+def _update_digest(digest, data):
+    """Raises TypeError if the data can't be compared by value"""
+    if isinstance(data, np.ndarray):
+        if data.dtype.hasobject:
+            raise TypeError
+        digest.update(f"array{data.shape}{data.dtype.str}".encode())
+        digest.update(np.ascontiguousarray(data).data)
+    elif isinstance(data, (list, tuple)):
+        if data and isinstance(data[0], (list, np.ndarray)):
+            digest.update(f"{type(data).__name__}{len(data)}[".encode())
+            for d in data:
+                _update_digest(digest, d)
+            digest.update(b"]")
+        else:
+            # it's too expensive to check items of tuples (vertices),
+            # the pickler fails if they are not pickleable
+            if set(map(type, data)) <= _VALUE_TYPES:
+                digest.update(_dumps(data))
+            else:  # curves, solids etc.
+                digest.update(f"{type(data).__name__}{len(data)}(".encode())
+                for d in data:
+                    _update_digest(digest, d)
+                digest.update(b")")
+    elif type(data) in _VALUE_TYPES:
+        digest.update(_dumps(data))
+    elif type(data).__module__.startswith(_MODEL_MODULES):
+        digest.update(_dumps(data))  # the class is pickled by its name
+    elif hasattr(data, 'exportBrepToString'):  # FreeCAD shape
+        digest.update(b"brep")
+        digest.update(data.exportBrepToString().encode())
+    else:
+        raise TypeError
+
+
+def _dumps(data) -> memoryview:
+    """Pickles the data without references to repeated objects, so equal
+    data always gives the same bytes. Pickle keeps types of values"""
+    file = io.BytesIO()
+    pickler = pickle.Pickler(file, pickle.HIGHEST_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(data)
+    return file.getbuffer()
+
+
+def sv_update_fingerprint(socket) -> bool:
+    """Calculates fingerprint of socket data and keeps it.
+    Returns False only if the data is the same as during previous call"""
+    data = socket_data_cache.get(socket.socket_id)
+    fingerprint = None if data is None else data_fingerprint(data)
+    previous = socket_fingerprints.get(socket.socket_id)
+    socket_fingerprints[socket.socket_id] = fingerprint
+    return fingerprint is None or fingerprint != previous
+
+
 def sv_forget_socket(socket):
     """deletes socket data from cache"""
+    socket_fingerprints.pop(socket.socket_id, None)
     try:
         del socket_data_cache[socket.socket_id]
     except KeyError:
@@ -191,7 +610,7 @@ def sv_get_socket(socket, deepcopy=True):
     """
     data = socket_data_cache.get(socket.socket_id)
     if data is not None:
-        return sv_deep_copy(data) if deepcopy else data
+        return copy_data(data) if deepcopy else data
     else:
         raise SvNoDataError(socket)
 
@@ -215,7 +634,19 @@ def clear_all_socket_cache():
     Reset socket cache for all node-trees.
     """
     socket_data_cache.clear()
+    socket_fingerprints.clear()
+
+
+settings.set_socket_cache_limit = set_cache_limit
+settings.set_copy_on_write = set_copy_on_write
+
+
+def register():
+    set_cache_limit(settings.get_param('socket_cache_limit', 0))
+    set_copy_on_write(settings.get_param('socket_data_cow', False))
 
 
 def unregister():
     clear_all_socket_cache()
+    set_cache_limit(0)
+    set_copy_on_write(False)
@@ -1,4 +1,7 @@
 import gc
+import heapq
+from enum import IntEnum
+from itertools import count
 from time import time
 from functools import partial, cached_property, cache
 from typing import TYPE_CHECKING, Optional, Generator
@@ -14,21 +17,68 @@ if TYPE_CHECKING:
     from sverchok.node_tree import SverchCustomTree as SvTree
 
 
+class Priority(IntEnum):
+    """Order in which tasks are executed, lower is first"""
+    ANIMATION = 0  # animated tree during animation playback
+    EDITOR = 1  # the tree is opened in a node editor
+    VIEWER = 2  # the tree has viewer nodes
+    BACKGROUND = 3
+
+
+class QueueLatency:
+    """Statistics of time which tasks of a tree spent in the queue"""
+    def __init__(self):
+        self.number = 0
+        self.last = 0.
+        self.max = 0.
+        self.total = 0.
+
+    def add(self, latency: float):
+        self.number += 1
+        self.last = latency
+        self.max = max(self.max, latency)
+        self.total += latency
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.number if self.number else 0.
+
+    def __repr__(self):
+        return f"<QueueLatency mean={self.mean * 1000:.0f}ms " \
+               f"max={self.max * 1000:.0f}ms number={self.number}>"
+
+
 class Tasks:
     """
     It keeps tasks which should be executed and executes the on demand.
-    1. Execute tasks
+    1. Execute tasks in order of their priority, a started task is postponed
+       when a task with higher priority is added
     2. Time the whole execution
     3. Display the progress in the UI
     """
-    _todo: set['Task']
+    _todo: dict[str, tuple['Task', float]]
+    _queue: list[tuple[Priority, int, 'Task']]
     _current: Optional['Task']
 
+    MIN_BUDGET = 1 / 30  # keeps UI responsive
+    MAX_BUDGET = 0.15  # max timer frequency
+    SCENE_BUDGET = 10
+
     def __init__(self):
-        """:_todo: list of tasks to run
-        :_current: task which was started to execute"""
-        self._todo = set()
+        """:_todo: tree_id: task to run and time when it was added
+        :_queue: heap of tasks sorted by their priority, can have outdated
+        records of already executed or discarded tasks
+        :_current: task which was started to execute
+        :_frame_time: average time between calls of the run method, it's
+        the time Blender spends to handle events and redraw UI
+        :latency: queue latency statistics per tree name"""
+        self._todo = dict()
+        self._queue = []
+        self._order = count()
         self._current = None
+        self._frame_time = self.MIN_BUDGET
+        self._last_run: Optional[float] = None
+        self.latency: dict[str, QueueLatency] = dict()
 
     def __bool__(self):
         """Has anything to do?"""
@@ -45,19 +95,42 @@ class Tasks:
                 return
 
         # print(f"Add {task=}")
-        self._todo.add(task)
+        if task.tree.tree_id in self._todo:
+            return
+        self._todo[task.tree.tree_id] = task, time()
+        heapq.heappush(self._queue, (task.priority, next(self._order), task))
+
+    def discard(self, tree: 'SvTree'):
+        """Remove the task of given tree from the queue if it was not started"""
+        self._todo.pop(tree.tree_id, None)
+        if not self._todo:
+            self._queue.clear()
+
+    @property
+    def time_budget(self) -> float:
+        """How long tasks can be executed before the control is returned to
+        Blender. It's equal to the time Blender needs to redraw its UI so
+        Sverchok takes about half of time of each frame"""
+        if self.current.is_scene_update:
+            return self.SCENE_BUDGET
+        return min(max(self._frame_time, self.MIN_BUDGET), self.MAX_BUDGET)
 
     @profile(section="UPDATE")
     def run(self):
         """Run given tasks to update trees and report execution process in the
         header of a node tree editor"""
-        # 0.15 is max timer frequency
-        max_duration = 10 if self.current.is_scene_update else 0.15
+        start_time = time()
+        if self._last_run is not None:
+            self._frame_time += ((start_time - self._last_run) - self._frame_time) * 0.3
+        max_duration = self.time_budget
         duration = 0
 
         while self.current:
             if duration > max_duration:
+                self._last_run = time()
                 return
+            if self._is_outranked():
+                self._postpone()
             # print(f"Run task: {self.current}")
             duration += self.current.run(max_duration-duration)
             if self.current.last_node:
@@ -66,11 +139,13 @@ class Tasks:
             if self.current.is_exhausted:
                 self._next()
 
+        self._last_run = None
         self._finish()
 
     def cancel(self):
         """Remove all tasks in the queue and abort current one"""
         self._todo.clear()
+        self._queue.clear()
         if self._current:
             try:
                 self._current.throw(CancelError)
@@ -87,11 +162,45 @@ class Tasks:
             return self._current
         elif self._todo:
             self._start()
-            self._current = self._todo.pop()
+            self._current = self._pop()
             return self._current
         else:
             return None
 
+    def _is_outranked(self) -> bool:
+        """Is there a task with higher priority than the current one?
+        If the tree of the current task is queued again it is not postponed"""
+        current = self.current
+        if current.tree.tree_id in self._todo:
+            return False
+        while self._queue:
+            _, _, task = self._queue[0]
+            if self._todo.get(task.tree.tree_id, (None, None))[0] is task:
+                return task.priority < current.priority
+            heapq.heappop(self._queue)  # outdated record
+        return False
+
+    def _postpone(self):
+        """Puts the current task back to the queue and switches to the task
+        with the highest priority. The generator of the task keeps its state"""
+        self._report_progress()
+        task, self._current = self._current, None
+        self.add(task)
+        self._current = self._pop()
+        del self._main_area
+
+    def _pop(self) -> 'Task':
+        """Returns the task with the highest priority and records how long it
+        was waiting in the queue"""
+        while True:
+            _, _, task = heapq.heappop(self._queue)
+            # the tree can have another task if this one was discarded
+            todo_task, add_time = self._todo.get(task.tree.tree_id, (None, None))
+            if todo_task is task:
+                del self._todo[task.tree.tree_id]
+                self.latency.setdefault(task.tree.name, QueueLatency()).add(time() - add_time)
+                return task
+
     def _start(self):
         """Preprocessing before executing the whole queue of events"""
         self._start_time
@@ -101,7 +210,7 @@ class Tasks:
         """Should be called to switch to next tasks when current is exhausted
         It made some cleanups after the previous task"""
         self._report_progress()
-        self._current = self._todo.pop() if self._todo else None
+        self._current = self._pop() if self._todo else None
         del self._main_area
 
     def _finish(self):
@@ -130,7 +239,7 @@ class Tasks:
     @cached_property
     def _main_area(self) -> Optional:
         """Searching appropriate area index for reporting update progress"""
-        if not self.current:
+        if not self.current or bpy.context.screen is None:  # headless mode
             return
         for area in bpy.context.screen.areas:
             if area.ui_type == 'SverchCustomTreeType':
@@ -152,7 +261,7 @@ class Tasks:
             self._main_area.header_text_set(text)
 
     def __repr__(self):
-        return f"<Tasks current={self._current} todo={self._todo}>"
+        return f"<Tasks current={self._current} todo={[t for t, _ in self._todo.values()]}>"
 
 
 tasks = Tasks()
@@ -178,11 +287,13 @@ class Task:
         :_updater: generator which should update given tree
         :is_exhausted: the status of the generator - read only
         :last_node: last node which going to be processed by the generator
-        - read only"""
+        - read only
+        :priority: tasks with lower priority are executed first - read only"""
         self.tree: SvTree = tree
         self.is_scene_update: bool = is_scene_update
         self.is_exhausted = False
         self.last_node = None
+        self.priority = self._priority()
 
         self._updater: Generator = updater
         self.__hash__ = cache(self.__hash__)
@@ -203,6 +314,22 @@ class Task:
             self.is_exhausted = True
             return duration
 
+    def _priority(self) -> Priority:
+        """The priority is defined when the task is created"""
+        screen = bpy.context.screen
+        if screen is None:  # during rendering
+            return Priority.ANIMATION if self.is_scene_update else Priority.BACKGROUND
+        if screen.is_animation_playing and self.tree.sv_animate:
+            return Priority.ANIMATION
+        for area in screen.areas:
+            if area.ui_type == 'SverchCustomTreeType':
+                path = area.spaces[0].path
+                if path and path[0].node_tree == self.tree:
+                    return Priority.EDITOR
+        if any(type(n).__module__.startswith('sverchok.nodes.viz') for n in self.tree.nodes):
+            return Priority.VIEWER
+        return Priority.BACKGROUND
+
     def throw(self, error: CancelError):
         """Should be used to cansel tree execution. Updater should add
         the error to current node and abort the execution"""
@@ -216,7 +343,7 @@ class Task:
         return hash(self.tree.tree_id)
 
     def __repr__(self):
-        return f"<Task: {self.tree.name}>"
+        return f"<Task: {self.tree.name} {self.priority.name}>"
 
 
 @post_load_call
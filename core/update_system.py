@@ -1,17 +1,21 @@
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
 from copy import copy
 from functools import lru_cache
 from graphlib import TopologicalSorter
 from itertools import chain
+import threading
 from time import perf_counter
-from typing import TYPE_CHECKING, Optional, Generator, Iterable
+from typing import TYPE_CHECKING, Optional, Generator, Iterable, Callable, Any
 
 from bpy.types import Node, NodeSocket, NodeTree, NodeLink
 import sverchok.core.events as ev
 import sverchok.core.tasks as ts
 from sverchok.core.sv_custom_exceptions import CancelError, SvNoDataError
 from sverchok.core.socket_conversions import conversions
+from sverchok.core.socket_data import sv_update_fingerprint
 from sverchok.utils.profile import profile
+from sverchok.utils import tracing
 from sverchok.utils.logging import log_error
 from sverchok.utils.tree_walk import bfs_walk
 
@@ -23,6 +27,8 @@ UPDATE_KEY = "US_is_updated"
 ERROR_KEY = "US_error"
 TIME_KEY = "US_time"
 
+_executor: Optional[ThreadPoolExecutor] = None
+
 
 def control_center(event):
     """
@@ -95,8 +101,16 @@ class SearchTree:
     _to_socks: dict[NodeSocket, set[NodeSocket]]
     _links: set[tuple[NodeSocket, NodeSocket]]
     _sock_node: dict[NodeSocket, Node]
+    _raw_nodes: set[Node]
+    _raw_links: set[tuple[NodeSocket, NodeSocket]]
+    _special_nodes: set[tuple[Node, bool, Optional[str]]]
 
     def __init__(self, tree: NodeTree):
+        """:_raw_nodes: nodes of the tree without frames
+        :_raw_links: not muted links of the tree before removing reroutes,
+        wifi and muted nodes
+        :_special_nodes: reroutes, wifi and muted nodes with their statuses.
+        Links of these nodes can't be changed incrementally"""
         self._tree = tree
         self._from_nodes = {
             n: set() for n in tree.nodes if n.bl_idname != 'NodeFrame'}
@@ -118,6 +132,10 @@ class SearchTree:
             for sock in chain(node.inputs, node.outputs):
                 self._sock_node[sock] = node
 
+        self._raw_nodes = set(self._from_nodes)
+        self._raw_links = set(self._links)
+        self._special_nodes = self._get_special_nodes(tree)
+
         self._remove_reroutes()
         self._remove_wifi_nodes()
         self._remove_muted_nodes()
@@ -188,6 +206,78 @@ class SearchTree:
                 raise error
             node.process()
 
+    def _update_topology(self, tree: NodeTree) -> Optional[set['SvNode']]:
+        """Applies changes of nodes and links of the tree to the existing
+        structure without its full rebuilding. Returns nodes which should be
+        updated according to the changes or None if the changes can't be
+        applied incrementally and the structure should be rebuilt"""
+        if self._special_nodes != self._get_special_nodes(tree):
+            return None
+        nodes = {n for n in tree.nodes if n.bl_idname != 'NodeFrame'}
+        links = {(li.from_socket, li.to_socket): li for li in tree.links if not li.is_muted}
+        added_nodes = nodes - self._raw_nodes
+        removed_nodes = self._raw_nodes - nodes
+        if len(added_nodes) + len(removed_nodes) > len(nodes) // 2 + 1:
+            return None  # probably undo event, all nodes have new hashes
+        new_links = links.keys() - self._raw_links
+        removed_links = self._raw_links - links.keys()
+
+        special = {n for n, *_ in self._special_nodes}
+        for from_s, to_s in removed_links:
+            if self._sock_node[from_s] in special or self._sock_node[to_s] in special:
+                return None
+        for from_s, to_s in new_links:
+            link = links[from_s, to_s]
+            if link.from_node in special or link.to_node in special:
+                return None
+
+        # the same rule as in UpdateTree._update_difference
+        linked_outputs = {from_s for from_s, _ in new_links if self._to_socks.get(from_s)}
+        changed_nodes = set(added_nodes)
+        for from_s, to_s in removed_links:
+            if (to_node := self._sock_node[to_s]) not in removed_nodes:
+                changed_nodes.add(to_node)
+        if removed_nodes:
+            # deleted nodes can't be read, their sockets are taken from the structure
+            removed_socks = defaultdict(list)
+            for sock, node in self._sock_node.items():
+                if node in removed_nodes:
+                    removed_socks[node].append(sock)
+            for node in removed_nodes:
+                self._remove_node(node, removed_socks[node])
+            self._sock_node = {s: n for s, n in self._sock_node.items()
+                               if n not in removed_nodes}
+        for from_s, to_s in removed_links:
+            # links of removed nodes are already removed
+            if self._from_sock.get(to_s) == from_s:
+                self._remove_link(from_s, to_s)
+        for node in added_nodes:
+            self._from_nodes[node] = set()
+            self._to_nodes[node] = set()
+            for sock in chain(node.inputs, node.outputs):
+                self._sock_node[sock] = node
+        for from_s, to_s in new_links:
+            link = links[from_s, to_s]
+            # sockets can be added to existing nodes
+            self._sock_node[from_s] = link.from_node
+            self._sock_node[to_s] = link.to_node
+            self._add_link(from_s, to_s)
+            if from_s in linked_outputs:  # output data is already calculated
+                changed_nodes.add(link.to_node)
+            else:
+                # protect from if not self.outputs[0].is_linked: return
+                changed_nodes.add(link.from_node)
+
+        self._tree = tree
+        self._raw_nodes = nodes
+        self._raw_links = set(links)
+        return changed_nodes
+
+    @staticmethod
+    def _get_special_nodes(tree: NodeTree) -> set[tuple[Node, bool, Optional[str]]]:
+        return {(n, n.mute, getattr(n, 'var_name', None)) for n in tree.nodes
+                if n.mute or n.bl_idname == 'NodeReroute' or hasattr(n, 'var_name')}
+
     def _remove_reroutes(self):
         for r in self._tree.nodes:
             if r.bl_idname != "NodeReroute":
@@ -322,25 +412,24 @@ class SearchTree:
             self._from_nodes[to_node].discard(from_node)
             self._to_nodes[from_node].discard(to_node)
 
-    def _remove_node(self, node: Node):
-        """Remove node with all its links"""
-        for in_s in node.inputs:
-            if from_s := self._from_sock.get(in_s):
-                self._to_socks[from_s].discard(in_s)
+    def _remove_node(self, node: Node, sockets: Optional[Iterable[NodeSocket]] = None):
+        """Remove node with all its links. Sockets of a deleted node should be
+        given, the node itself is not read then"""
+        if sockets is None:
+            sockets = chain(node.inputs, node.outputs)
+        for sock in sockets:
+            if from_s := self._from_sock.pop(sock, None):  # input socket
+                self._to_socks[from_s].discard(sock)
                 if not self._to_socks[from_s]:
                     del self._to_socks[from_s]
-                self._links.discard((from_s, in_s))
-                del self._from_sock[in_s]
+                self._links.discard((from_s, sock))
+            if to_ss := self._to_socks.pop(sock, None):  # output socket
+                for to_s in to_ss:
+                    self._from_sock.pop(to_s, None)
+                    self._links.discard((sock, to_s))
         for from_n in self._from_nodes[node]:
             self._to_nodes[from_n].discard(node)
         del self._from_nodes[node]
-
-        for out_s in node.outputs:
-            if to_ss := self._to_socks.get(out_s):
-                for to_s in to_ss:
-                    del self._from_sock[to_s]
-                    self._links.discard((out_s, to_s))
-                del self._to_socks[out_s]
         for to_n in self._to_nodes[node]:
             self._from_nodes[to_n].discard(node)
         del self._to_nodes[node]
@@ -404,14 +493,22 @@ class UpdateTree(SearchTree):
 
             if refresh_tree:
                 # update topology
+                changed_nodes = None
                 if not _tree.is_updated:
-                    old = _tree
-                    _tree = old.copy(tree)
+                    if _tree.is_topology_reliable:
+                        changed_nodes = _tree._update_topology(tree)
+                    if changed_nodes is None:
+                        old = _tree
+                        _tree = old.copy(tree)
+                    else:
+                        _tree._sort_nodes.cache_clear()
+                        _tree._revision += 1
 
                 # update outdated nodes list
                 if _tree._outdated_nodes is not None:
                     if not _tree.is_updated:
-                        changed_nodes = _tree._update_difference(old)
+                        if changed_nodes is None:
+                            changed_nodes = _tree._update_difference(old)
 
                         # disconnected input sockets can remember previous data
                         # a node can be laizy and don't recalculate output
@@ -454,7 +551,12 @@ class UpdateTree(SearchTree):
 
         # print(f"UPDATE NODES {event.type=}, {event.tree.name=}")
         up_tree = cls.get(tree, refresh_tree=True)
-        if update_nodes:
+        if update_nodes and getattr(tree, 'sv_parallel', False):
+            try:
+                yield from up_tree._parallel_update()
+            except CancelError:
+                pass
+        elif update_nodes:
             walker = up_tree._walk()
             # walker = up_tree._debug_color(walker)
             try:
@@ -487,6 +589,13 @@ class UpdateTree(SearchTree):
         else:
             cls._tree_catch.clear()
 
+    @classmethod
+    def invalidate_topology(cls):
+        """Should be called when Blender data of trees was reloaded (undo). In
+        this case topology of all trees will be rebuilt from scratch"""
+        for tree in cls._tree_catch.values():
+            tree.is_topology_reliable = False
+
     def copy(self, new_tree: NodeTree) -> 'UpdateTree':
         """They copy will be with new topology if original tree was changed
         since instancing of the first tree. Other attributes copied as is.
@@ -506,21 +615,29 @@ class UpdateTree(SearchTree):
     def __init__(self, tree: NodeTree):
         """Should not use be used directly, only via the get class method
         :is_updated: Should be False if topology of the tree was changed
+        :is_topology_reliable: Should be False if the tree topology can't be
+        updated incrementally and should be rebuilt
         :is_animation_updated: Should be False animation dependent nodes should
         be updated
         :is_scene_updated: Should be False if scene dependent nodes should be
         updated
         :_outdated_nodes: Keeps nodes which properties were changed or which
         have errors. Can be None when what means that all nodes are outdated
+        :_changed_input_nodes: Keeps nodes which input data was changed since
+        their last execution. It's used only when nodes with unchanged input
+        data are skipped
         :_copy_attrs: list of attributes which should be copied by the copy
         method"""
         super().__init__(tree)
         self._tree_catch[tree.tree_id] = self
 
         self.is_updated = True  # False if topology was changed
+        self.is_topology_reliable = True
+        self._revision = 0  # changes when topology is updated incrementally
         self.is_animation_updated = True
         self.is_scene_updated = True
         self._outdated_nodes: Optional[set[SvNode]] = None  # None means outdated all
+        self._changed_input_nodes: set[SvNode] = set()
 
         # https://stackoverflow.com/a/68550238
         self._sort_nodes = lru_cache(maxsize=1)(self.__sort_nodes)
@@ -530,6 +647,7 @@ class UpdateTree(SearchTree):
             'is_animation_updated',
             'is_scene_updated',
             '_outdated_nodes',
+            '_changed_input_nodes',
         ]
 
     def _animation_nodes(self) -> set['SvNode']:
@@ -558,26 +676,175 @@ class UpdateTree(SearchTree):
         state. It checks after yielding the error status of the node. If the
         node has error it goes into outdated_nodes. It uses cached walker, so
         it works more efficient when outdated nodes are the same between the
-        method calls."""
-
-        # walk all nodes in the tree
-        if self._outdated_nodes is None:
-            outdated = None
-            self._outdated_nodes = set()
-        # walk triggered nodes and error nodes from previous updates
-        else:
-            outdated = frozenset(self._outdated_nodes)
-            self._outdated_nodes.clear()
+        method calls. If skipping nodes with unchanged input data is on, it
+        compares output data of executed nodes with their previous data and
+        does not yield next nodes if the data is the same."""
+        outdated = self._pop_outdated()
+        skip_unchanged = getattr(self._tree, 'sv_skip_unchanged', False)
 
         for node, other_socks in self._sort_nodes(outdated):
             # execute node only if all previous nodes are updated
             if all(n.get(UPDATE_KEY, True) for sock in other_socks if (n := self._sock_node.get(sock))):
+                if skip_unchanged and self._is_unchanged(node, outdated):
+                    if tracing.tracer is not None:
+                        tracing.tracer.add(tracing.SKIPPED, node.id_data.name, node.name, perf_counter())
+                    continue
                 yield node, other_socks
                 if node.get(ERROR_KEY, False):
                     self._outdated_nodes.add(node)
+                if skip_unchanged:
+                    self._compare_outputs(node)
             else:
                 node[UPDATE_KEY] = False
 
+    def _is_unchanged(self, node: 'SvNode', outdated: Optional[frozenset['SvNode']]) -> bool:
+        """Returns True if the node was successfully updated before, and it's
+        not outdated, and its input data was not changed since then"""
+        return outdated is not None \
+            and node not in outdated \
+            and node not in self._changed_input_nodes \
+            and node.get(UPDATE_KEY, False)
+
+    def _compare_outputs(self, node: 'SvNode'):
+        """Should be called after node execution. If output data of the node
+        was changed its next nodes are marked as changed"""
+        self._changed_input_nodes.discard(node)
+        # fingerprints of all sockets should be updated
+        if any([sv_update_fingerprint(s) for s in node.outputs]):
+            self._changed_input_nodes.update(self._to_nodes.get(node, []))
+
+    def _parallel_update(self) -> Generator['SvNode', None, None]:
+        """Updates outdated nodes. Nodes which implement the sv_thread_task
+        method are computed in a pool of threads as soon as all their previous
+        nodes are updated, other nodes are executed in the main thread. The
+        threads get only functions which do not touch Blender data, input
+        data, output data and statistics of all nodes are handled in the main
+        thread. It yields nodes executed in the main thread and nodes which
+        are waited for, so the update can be suspended and canceled. If the
+        tree was changed during the suspension the update is aborted, results
+        of the threads are dropped and the whole tree becomes outdated."""
+        outdated = self._pop_outdated()
+        skip_unchanged = getattr(self._tree, 'sv_skip_unchanged', False)
+        walk = dict(self._sort_nodes(outdated))
+        sorter = TopologicalSorter(
+            {n: self._from_nodes.get(n, set()) & walk.keys() for n in walk})
+        sorter.prepare()
+        running: dict[Future, SvNode] = dict()
+        main_nodes = deque()
+        tree_id = self._tree.tree_id
+        revision = self._revision
+
+        def finish(_node):
+            if _node.get(ERROR_KEY, False):
+                self._outdated_nodes.add(_node)
+            if skip_unchanged:
+                self._compare_outputs(_node)
+            sorter.done(_node)
+
+        def finish_running(futures):
+            for future in futures:
+                _node = running.pop(future)
+                outputs, error, tid, start, end = future.result()
+                with AddStatistic(_node, start=start, end=end, tid=tid):
+                    if error is not None:
+                        raise error
+                    for name, data in outputs.items():
+                        _node.outputs[name].sv_set(data)
+                finish(_node)
+
+        def abort():
+            for future in running:
+                future.cancel()  # running functions are just forgotten
+            running.clear()
+
+        try:
+            while sorter.is_active():
+                for node in sorter.get_ready():
+                    prev_socks = walk[node]
+                    if not all(n.get(UPDATE_KEY, True) for sock in prev_socks if (n := self._sock_node.get(sock))):
+                        node[UPDATE_KEY] = False
+                        sorter.done(node)
+                    elif skip_unchanged and self._is_unchanged(node, outdated):
+                        if tracing.tracer is not None:
+                            tracing.tracer.add(tracing.SKIPPED, node.id_data.name, node.name, perf_counter())
+                        sorter.done(node)
+                    else:
+                        main_nodes.append(node)
+
+                if main_nodes:
+                    node = main_nodes[0]
+                    yield node
+                    if not self._is_walk_valid(tree_id, revision):
+                        break
+                    main_nodes.popleft()
+                    start = perf_counter()
+                    task, error = None, None
+                    try:
+                        prepare_input_data(walk[node], node.inputs)
+                        if error := node.dependency_error:
+                            raise error
+                        task = node.sv_thread_task()
+                    except Exception as e:
+                        error = e
+                    if task is None:
+                        with AddStatistic(node, start=start):
+                            if error is not None:
+                                raise error
+                            node.process()
+                        finish(node)
+                    else:
+                        running[get_executor().submit(run_thread_task, task)] = node
+                elif running:
+                    done, _ = wait(running, timeout=0.01, return_when=FIRST_COMPLETED)
+                    if done:
+                        finish_running(done)
+                    else:
+                        yield next(iter(running.values()))
+                        if not self._is_walk_valid(tree_id, revision):
+                            break
+            else:
+                return  # all nodes are updated
+        except CancelError:
+            if self._is_walk_valid(tree_id, revision):
+                # nodes which were not finished should be updated again
+                self._outdated_nodes.update(running.values())
+                self._outdated_nodes.update(main_nodes)
+            else:
+                self._outdate_all(tree_id)
+            abort()
+            raise
+
+        # nodes of the tree could be removed, they should not be touched
+        abort()
+        self._outdate_all(tree_id)
+
+    def _outdate_all(self, tree_id: str):
+        """Marks all nodes of the tree outdated without touching them"""
+        self._outdated_nodes = None
+        if (up_tree := self._tree_catch.get(tree_id)) is not None:
+            up_tree._outdated_nodes = None
+
+    def _is_walk_valid(self, tree_id: str, revision: int) -> bool:
+        """Returns False if topology of the tree was changed (including undo
+        and loading another file) since given revision"""
+        return self._tree_catch.get(tree_id) is self \
+            and self.is_updated \
+            and self.is_topology_reliable \
+            and self._revision == revision
+
+    def _pop_outdated(self) -> Optional[frozenset['SvNode']]:
+        """Returns nodes which should be updated and clears the outdated_nodes
+        storage. None means that all nodes of the tree should be updated."""
+        # walk all nodes in the tree
+        if self._outdated_nodes is None:
+            outdated = None
+            self._outdated_nodes = set()
+        # walk triggered nodes and error nodes from previous updates
+        else:
+            outdated = frozenset(self._outdated_nodes)
+            self._outdated_nodes.clear()
+        return outdated
+
     def __sort_nodes(self,
                      from_nodes: frozenset['SvNode'] = None,
                      to_nodes: frozenset['SvNode'] = None)\
@@ -621,7 +888,7 @@ class UpdateTree(SearchTree):
         nodes_to_update = self._from_nodes.keys() - old._from_nodes.keys()
         new_links = self._links - old._links
         for from_sock, to_sock in new_links:
-            if from_sock not in old._from_sock:  # socket was not connected
+            if not old._to_socks.get(from_sock):  # socket was not connected
                 # protect from if not self.outputs[0].is_linked: return
                 nodes_to_update.add(self._sock_node[from_sock])
             else:
@@ -684,36 +951,74 @@ class AddStatistic:
     # this probably can be inside the Node class as an update method
     # using context manager from contextlib has big overhead
     # https://stackoverflow.com/questions/26152934/why-the-staggering-overhead-50x-of-contextlib-and-the-with-statement-in-python
-    def __init__(self, node: 'SvNode', supress=True):
-        """:supress: if True any errors during node execution will be suppressed"""
+    def __init__(self, node: 'SvNode', supress=True, start: float = None,
+                 end: float = None, tid: int = None):
+        """:supress: if True any errors during node execution will be suppressed
+        :start: time when the node execution has started, it is needed only
+        if the node was executed outside the context manager
+        :end: time when the node execution has finished, the same as start
+        :tid: id of the thread where the node was executed, current by default"""
         self._node = node
-        self._start = perf_counter()
+        self._start = perf_counter() if start is None else start
+        self._end = end
+        self._tid = tid
         self._supress = supress
 
     def __enter__(self):
         return None
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        end = perf_counter() if self._end is None else self._end
         if exc_type is None:
             self._node[UPDATE_KEY] = True
             self._node[ERROR_KEY] = None
-            self._node[TIME_KEY] = perf_counter() - self._start
+            self._node[TIME_KEY] = end - self._start
         else:
             log_error(exc_val)
             self._node[UPDATE_KEY] = False
             self._node[ERROR_KEY] = repr(exc_val)
 
+        if tracing.tracer is not None:
+            args = None if exc_type is None else {'error': repr(exc_val)}
+            tracing.tracer.add(tracing.NODE, self._node.id_data.name, self._node.name,
+                               self._start, end, args, self._tid)
+
         if self._supress and exc_type is not None:
             if issubclass(exc_type, CancelError):
                 return False
             return issubclass(exc_type, Exception)
 
 
+def get_executor() -> ThreadPoolExecutor:
+    """Pool of threads for parallel evaluation of nodes"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix='sverchok')
+    return _executor
+
+
+def run_thread_task(task: Callable[[], dict[str, Any]]) -> tuple:
+    """Calls function of a node in a worker thread. Returns output data or an
+    error along with the thread id and time of the execution for statistics"""
+    start = perf_counter()
+    try:
+        outputs, error = task(), None
+    except Exception as e:
+        outputs, error = None, e
+    return outputs, error, threading.get_ident(), start, perf_counter()
+
+
 def prepare_input_data(prev_socks: list[Optional[NodeSocket]],
                        input_socks: list[NodeSocket]):
     """Reads data from given outputs socket make it conversion if necessary and
-    put data into input given socket"""
+    put data into input given socket. If tracing is on it records number of
+    objects and size of the data and time of conversions"""
     # this can be a socket method
+    tracer = tracing.tracer
+    if tracer is not None:
+        start = perf_counter()
+        objects, size, conversion_time = 0, 0, 0.
+
     for ps, ns in zip(prev_socks, input_socks):
         if ps is None:
             continue
@@ -725,10 +1030,21 @@ def prepare_input_data(prev_socks: list[Optional[NodeSocket]],
         else:
             # cast data
             if ps.bl_idname != ns.bl_idname:
+                conversion_start = perf_counter()
                 implicit_conversion = conversions[ns.default_conversion_name]
                 data = implicit_conversion.convert(ns, ps, data)
+                if tracer is not None:
+                    conversion_time += perf_counter() - conversion_start
 
             ns.sv_set(data)
+            if tracer is not None:
+                objects += len(data)
+                size += tracing.data_size(data)
+
+    if tracer is not None and len(input_socks):
+        node = input_socks[0].node
+        tracer.add(tracing.INPUTS, node.id_data.name, node.name, start, perf_counter(),
+                   {'objects': objects, 'bytes': size, 'conversion_ms': conversion_time * 1000})
 
 
 def update_ui(tree: NodeTree, times: Iterable[float] = None):
@@ -738,3 +1054,10 @@ def update_ui(tree: NodeTree, times: Iterable[float] = None):
     errors = (n.get(ERROR_KEY, None) for n in tree.nodes)
     times = times or (n.get(TIME_KEY, 0) for n in tree.nodes)
     tree.update_ui(errors, times)
+
+
+def unregister():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -31,7 +31,7 @@ import time
 from contextlib import contextmanager
 from itertools import chain, cycle
 from pathlib import Path
-from typing import Iterable, final, Optional
+from typing import Any, Callable, Iterable, final, Optional
 
 import bpy
 from bpy.props import StringProperty, BoolProperty, EnumProperty
@@ -209,6 +209,26 @@ class SverchCustomTree(NodeTree, SvNodeTreeCommon):
         options=set(),
     )
 
+    sv_parallel: BoolProperty(
+        name="Parallel",
+        description="Evaluate thread safe nodes of independent branches simultaneously",
+        options=set(),
+        default=False)
+    """If enabled nodes which implement `UpdateNodes.sv_thread_task` method are
+    evaluated in a pool of threads, so independent branches of the tree can be
+    computed at the same time. Other nodes are still evaluated in the main
+    thread."""
+
+    sv_skip_unchanged: BoolProperty(
+        name="Skip unchanged",
+        description="Don't update nodes if output data of previous nodes was not changed",
+        options=set(),
+        default=False)
+    """If enabled, after execution of a node its output data is compared with
+    the data of previous execution (via cheap hashes). If the data is the same
+    next nodes are not updated. This can save a lot of time when a property of
+    a node is changed but the node output is still the same."""
+
     sv_scene_update: BoolProperty(
         name="Scene update",
         description="Update upon changes in the scene",
@@ -343,6 +363,20 @@ class UpdateNodes:
         """
         pass
 
+    def sv_thread_task(self) -> Optional[Callable[[], dict[str, Any]]]:
+        """
+        Override this method to let the node be evaluated in a worker thread
+        when `SverchCustomTree.sv_parallel` option of the tree is on. It's
+        called in the main thread instead of the `process` method. It should
+        read input sockets and properties of the node and return a function
+        which computes data of output sockets without touching any Blender
+        data, including the node itself. The function should return
+        dictionary of output socket names and their data, the data is set to
+        the sockets in the main thread. If None is returned the `process`
+        method is called as usual.
+        """
+        return None
+
     def sv_update(self):
         """
         This method can be overridden in inherited classes.
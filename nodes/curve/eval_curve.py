@@ -1,4 +1,6 @@
 
+from functools import partial
+
 import numpy as np
 
 import bpy
@@ -7,6 +9,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, ensure_nesting_level
 from sverchok.utils.curve import SvCurve
+from sverchok.utils.curve.batch import evaluate_curves
 
 class SvEvalCurveNode(SverchCustomTreeNode, bpy.types.Node):
         """
@@ -63,9 +66,9 @@ class SvEvalCurveNode(SverchCustomTreeNode, bpy.types.Node):
             self.outputs.new('SvVerticesSocket', "Tangents")
             self.update_sockets(context)
 
-        def process(self):
+        def sv_thread_task(self):
             if not any(socket.is_linked for socket in self.outputs):
-                return
+                return lambda: {}
 
             curve_s = self.inputs['Curve'].sv_get()
             ts_s = self.inputs['T'].sv_get(default=[[]])
@@ -73,35 +76,49 @@ class SvEvalCurveNode(SverchCustomTreeNode, bpy.types.Node):
 
             need_tangent = self.outputs['Tangents'].is_linked
 
+            # the function can be called in a worker thread, it should not touch the node
+            return partial(self.evaluate, curve_s, ts_s, samples_s, self.eval_mode, self.join, need_tangent)
+
+        def process(self):
+            for name, data in self.sv_thread_task()().items():
+                self.outputs[name].sv_set(data)
+
+        @staticmethod
+        def evaluate(curve_s, ts_s, samples_s, eval_mode, join, need_tangent):
             curve_s = ensure_nesting_level(curve_s, 2, data_types=(SvCurve,), input_name='Curve')
             ts_s = ensure_nesting_level(ts_s, 3, input_name='T')
             samples_s = ensure_nesting_level(samples_s, 2, input_name='Samples')
 
-            verts_out = []
-            edges_out = []
-            tangents_out = []
+            params = []
             for curves, ts_i, samples_i in zip_long_repeat(curve_s, ts_s, samples_s):
-                if self.eval_mode == 'AUTO':
+                if eval_mode == 'AUTO':
                     ts_i = [None]
                 else:
                     samples_i = [None]
 
-                new_verts = []
-                new_edges = []
-                new_tangents = []
+                new_params = []
                 for curve, ts, samples in zip_long_repeat(curves, ts_i, samples_i):
-                    if self.eval_mode == 'AUTO':
+                    if eval_mode == 'AUTO':
                         t_min, t_max = curve.get_u_bounds()
                         ts = np.linspace(t_min, t_max, num=int(samples), dtype=np.float64)
                     else:
                         ts = np.array(ts)
+                    new_params.append((curve, ts))
+                params.append(new_params)
 
-                    if len(ts) == 1:
-                        v = curve.evaluate(ts[0])
-                        curve_verts = np.array([v])
-                    else:
-                        curve_verts = curve.evaluate_array(ts)
-                    curve_verts = curve_verts.tolist()
+            # all curves are evaluated at once, it's much faster for many similar curves
+            all_params = [p for new_params in params for p in new_params]
+            all_verts = iter(evaluate_curves([c for c, _ in all_params], [ts for _, ts in all_params]))
+
+            verts_out = []
+            edges_out = []
+            tangents_out = []
+            for new_params in params:
+                new_verts = []
+                new_edges = []
+                new_tangents = []
+                for curve, ts in new_params:
+                    curve_verts = next(all_verts).tolist()
                     n = len(ts)
                     curve_edges = [(i,i+1) for i in range(n-1)]
                     
@@ -110,7 +127,7 @@ class SvEvalCurveNode(SverchCustomTreeNode, bpy.types.Node):
                     if need_tangent:
                         curve_tangents = curve.tangent_array(ts).tolist()
                         new_tangents.append(curve_tangents)
-                if self.join:
+                if join:
                     verts_out.extend(new_verts)
                     edges_out.extend(new_edges)
                     tangents_out.extend(new_tangents)
@@ -119,9 +136,7 @@ class SvEvalCurveNode(SverchCustomTreeNode, bpy.types.Node):
                     edges_out.append(new_edges)
                     tangents_out.append(new_tangents)
 
-            self.outputs['Vertices'].sv_set(verts_out)
-            self.outputs['Edges'].sv_set(edges_out)
-            self.outputs['Tangents'].sv_set(tangents_out)
+            return {'Vertices': verts_out, 'Edges': edges_out, 'Tangents': tangents_out}
 
 def register():
     bpy.utils.register_class(SvEvalCurveNode)
@@ -8,7 +8,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, match_long_repeat
 from sverchok.utils.modules.eval_formula import get_variables, safe_eval
 from sverchok.utils.logging import info, exception
-from sverchok.utils.sv_noise_utils import noise_options, PERLIN_ORIGINAL
+from sverchok.utils.sv_noise_utils import noise_options, PERLIN_ORIGINAL, implementation_modes
 
 from sverchok.utils.field.vector import SvNoiseVectorField
 
@@ -31,6 +31,11 @@ class SvNoiseVectorFieldNode(SverchCustomTreeNode, bpy.types.Node):
 
     seed: IntProperty(default=0, name='Seed', update=updateNode)
 
+    implementation: EnumProperty(
+        name='Implementation', items=implementation_modes,
+        description='Choose calculation method',
+        default="Mathutils", update=updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvStringsSocket', 'Seed').prop_name = 'seed'
         self.outputs.new('SvVectorFieldSocket', 'Noise')
@@ -38,6 +43,10 @@ class SvNoiseVectorFieldNode(SverchCustomTreeNode, bpy.types.Node):
     def draw_buttons(self, context, layout):
         layout.prop(self, 'noise_type', text="Type")
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, 'implementation')
+
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
             return
@@ -51,7 +60,7 @@ class SvNoiseVectorFieldNode(SverchCustomTreeNode, bpy.types.Node):
 
             if seed == 0:
                 seed = 12345
-            field = SvNoiseVectorField(self.noise_type, seed)
+            field = SvNoiseVectorField(self.noise_type, seed, use_numpy=self.implementation == 'NumPy')
             fields_out.append(field)
 
         self.outputs['Noise'].sv_set(fields_out)
@@ -1,4 +1,6 @@
 
+from functools import partial
+
 import numpy as np
 
 import bpy
@@ -12,6 +14,7 @@ from sverchok.utils.math import from_cylindrical, from_spherical, to_cylindrical
 
 from sverchok.utils.math import coordinate_modes
 from sverchok.utils.field.scalar import SvScalarField
+from sverchok.utils.field.compiler import compile_field
 
 class SvScalarFieldEvaluateNode(SverchCustomTreeNode, bpy.types.Node):
     """
@@ -41,13 +44,23 @@ class SvScalarFieldEvaluateNode(SverchCustomTreeNode, bpy.types.Node):
     def rclick_menu(self, context, layout):
         layout.prop(self, "output_numpy")
 
-    def process(self):
+    def sv_thread_task(self):
         if not any(socket.is_linked for socket in self.outputs):
-            return
+            return lambda: {}
 
         vertices_s = self.inputs['Vertices'].sv_get()
-        vertices_s = ensure_nesting_level(vertices_s, 4)
         fields_s = self.inputs['Field'].sv_get()
+
+        # the function can be called in a worker thread, it should not touch the node
+        return partial(self.evaluate, fields_s, vertices_s, self.output_numpy)
+
+    def process(self):
+        for name, data in self.sv_thread_task()().items():
+            self.outputs[name].sv_set(data)
+
+    @staticmethod
+    def evaluate(fields_s, vertices_s, output_numpy):
+        vertices_s = ensure_nesting_level(vertices_s, 4)
         fields_s = ensure_nesting_level(fields_s, 2, data_types=(SvScalarField,))
 
         values_out = []
@@ -64,10 +77,12 @@ class SvScalarFieldEvaluateNode(SverchCustomTreeNode, bpy.types.Node):
                     xs = XYZ[:,0]
                     ys = XYZ[:,1]
                     zs = XYZ[:,2]
-                    new_values = field.evaluate_grid(xs, ys, zs) if self.output_numpy else field.evaluate_grid(xs, ys, zs).tolist()
+                    new_values = compile_field(field).evaluate_grid(xs, ys, zs)
+                    if not output_numpy:
+                        new_values = new_values.tolist()
                 values_out.append(new_values)
 
-        self.outputs['Value'].sv_set(values_out)
+        return {'Value': values_out}
 
 def register():
     bpy.utils.register_class(SvScalarFieldEvaluateNode)
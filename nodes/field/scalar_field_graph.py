@@ -8,6 +8,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat
 from sverchok.utils.sv_mesh_utils import mesh_join
 from sverchok.utils.marching_squares import make_contours
+from sverchok.utils.field.compiler import compile_field
 from sverchok.dependencies import skimage
 
 if skimage is not None:
@@ -118,7 +119,7 @@ class SvExScalarFieldGraphNode(SverchCustomTreeNode, bpy.types.Node):
             z_range = np.linspace(min_z, max_z, num=samples_z)
             xs, ys, zs = np.meshgrid(x_range, y_range, z_range, indexing='ij')
             xs, ys, zs = xs.flatten(), ys.flatten(), zs.flatten()
-            field_values = field.evaluate_grid(xs, ys, zs)
+            field_values = compile_field(field).evaluate_grid(xs, ys, zs)
             min_field = field_values.min()
             max_field = field_values.max()
             field_values = field_values.reshape((samples_xy, samples_xy, samples_z))
@@ -8,6 +8,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, repeat_last_for_length, match_long_repeat, ensure_nesting_level
 from sverchok.utils.logging import info, exception
 from sverchok.utils.field.vector import SvVectorField
+from sverchok.utils.field.compiler import compile_field
 
 class SvVectorFieldApplyNode(SverchCustomTreeNode, bpy.types.Node):
     """
@@ -84,6 +85,7 @@ class SvVectorFieldApplyNode(SverchCustomTreeNode, bpy.types.Node):
                 else:
                     coeffs = repeat_last_for_length(coeffs, len(vertices))
                     vertices = np.array(vertices)
+                    field = compile_field(field)
                     for i in range(iterations):
                         xs = vertices[:,0]
                         ys = vertices[:,1]
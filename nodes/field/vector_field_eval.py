@@ -1,4 +1,6 @@
 
+from functools import partial
+
 import numpy as np
 
 import bpy
@@ -7,6 +9,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, St
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, match_long_repeat
 from sverchok.utils.logging import info, exception
+from sverchok.utils.field.compiler import compile_field
 
 class SvVectorFieldEvaluateNode(SverchCustomTreeNode, bpy.types.Node):
     """
@@ -36,13 +39,22 @@ class SvVectorFieldEvaluateNode(SverchCustomTreeNode, bpy.types.Node):
     def rclick_menu(self, context, layout):
         layout.prop(self, "output_numpy")
 
-    def process(self):
+    def sv_thread_task(self):
         if not any(socket.is_linked for socket in self.outputs):
-            return
+            return lambda: {}
 
         vertices_s = self.inputs['Vertices'].sv_get()
         fields_s = self.inputs['Field'].sv_get()
 
+        # the function can be called in a worker thread, it should not touch the node
+        return partial(self.evaluate, fields_s, vertices_s, self.output_numpy)
+
+    def process(self):
+        for name, data in self.sv_thread_task()().items():
+            self.outputs[name].sv_set(data)
+
+    @staticmethod
+    def evaluate(fields_s, vertices_s, output_numpy):
         values_out = []
         for field, vertices in zip_long_repeat(fields_s, vertices_s):
             if len(vertices) == 0:
@@ -56,13 +68,13 @@ class SvVectorFieldEvaluateNode(SverchCustomTreeNode, bpy.types.Node):
                 xs = XYZ[:,0]
                 ys = XYZ[:,1]
                 zs = XYZ[:,2]
-                new_xs, new_ys, new_zs = field.evaluate_grid(xs, ys, zs)
+                new_xs, new_ys, new_zs = compile_field(field).evaluate_grid(xs, ys, zs)
                 new_vectors = np.dstack((new_xs[:], new_ys[:], new_zs[:]))
-                new_values = new_vectors if self.output_numpy else new_vectors[0].tolist()
+                new_values = new_vectors if output_numpy else new_vectors[0].tolist()
 
             values_out.append(new_values)
 
-        self.outputs['Vectors'].sv_set(values_out)
+        return {'Vectors': values_out}
 
 def register():
     bpy.utils.register_class(SvVectorFieldEvaluateNode)
@@ -9,6 +9,7 @@ from mathutils import Vector
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat
 from sverchok.utils.sv_mesh_utils import mesh_join
+from sverchok.utils.field.compiler import compile_field
 
 class SvVectorFieldGraphNode(SverchCustomTreeNode, bpy.types.Node):
     """
@@ -138,7 +139,7 @@ class SvVectorFieldGraphNode(SverchCustomTreeNode, bpy.types.Node):
             xs, ys, zs = np.meshgrid(x_range, y_range, z_range, indexing='ij')
             xs, ys, zs = xs.flatten(), ys.flatten(), zs.flatten()
             points = np.stack((xs, ys, zs)).T
-            rxs, rys, rzs = field.evaluate_grid(xs, ys, zs)
+            rxs, rys, rzs = compile_field(field).evaluate_grid(xs, ys, zs)
             vectors = np.stack((rxs, rys, rzs)).T
             if self.auto_scale:
                 norms = np.linalg.norm(vectors, axis=1)
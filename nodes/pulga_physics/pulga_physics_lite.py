@@ -384,6 +384,21 @@ class SvPulgaPhysicsNode(SverchCustomTreeNode, bpy.types.Node):
         default=False,
         update=updateNode)
 
+    record_step : IntProperty(name="Record Step",
+        description="Record every Nth iteration besides the ones from Iterations input, 0 to record only them",
+        default=0, min=0,
+        update=updateNode)
+
+    max_frames : IntProperty(name="Max Frames",
+        description="Keep only the last recorded iterations, 0 to keep all of them",
+        default=0, min=0,
+        update=updateNode)
+
+    frames_on_disk : BoolProperty(name="Frames on Disk",
+        description="Keep recorded iterations in memory-mapped files in the temporary folder",
+        default=False,
+        update=updateNode)
+
     def sv_init(self, context):
 
         '''create sockets'''
@@ -442,6 +457,9 @@ class SvPulgaPhysicsNode(SverchCustomTreeNode, bpy.types.Node):
         '''draw buttons on the N-panel'''
         self.draw_buttons(context, layout)
         layout.prop(self, "output_numpy", toggle=False)
+        layout.prop(self, "record_step")
+        layout.prop(self, "max_frames")
+        layout.prop(self, "frames_on_disk", toggle=False)
 
 
     def get_data(self):
@@ -474,6 +492,9 @@ class SvPulgaPhysicsNode(SverchCustomTreeNode, bpy.types.Node):
         gates_dict["Obstacles"] = si["Obstacles"].is_linked and si["Obstacles_pols"].is_linked
         gates_dict["b_box"] = si["Bounding Box"].is_linked
         gates_dict["output"] = self.output_numpy
+        gates_dict["record_step"] = self.record_step
+        gates_dict["max_frames"] = self.max_frames
+        gates_dict["frames_on_disk"] = self.frames_on_disk
         gates_dict["apply_f"] = True
 
         return gates_dict
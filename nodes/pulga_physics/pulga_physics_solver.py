@@ -189,6 +189,21 @@ class SvPulgaPhysicsSolverNode(SverchCustomTreeNode, bpy.types.Node):
         default=False,
         update=updateNode)
 
+    record_step : IntProperty(name="Record Step",
+        description="Record every Nth iteration besides the ones from Iterations input, 0 to record only them",
+        default=0, min=0,
+        update=updateNode)
+
+    max_frames : IntProperty(name="Max Frames",
+        description="Keep only the last recorded iterations, 0 to keep all of them",
+        default=0, min=0,
+        update=updateNode)
+
+    frames_on_disk : BoolProperty(name="Frames on Disk",
+        description="Keep recorded iterations in memory-mapped files in the temporary folder",
+        default=False,
+        update=updateNode)
+
     def sv_init(self, context):
 
         '''create sockets'''
@@ -229,6 +244,9 @@ class SvPulgaPhysicsSolverNode(SverchCustomTreeNode, bpy.types.Node):
         '''draw buttons on the N-panel'''
         self.draw_buttons(context, layout)
         layout.prop(self, "output_numpy", toggle=False)
+        layout.prop(self, "record_step")
+        layout.prop(self, "max_frames")
+        layout.prop(self, "frames_on_disk", toggle=False)
 
 
     def get_data(self):
@@ -249,6 +267,9 @@ class SvPulgaPhysicsSolverNode(SverchCustomTreeNode, bpy.types.Node):
         gates_dict = {}
         gates_dict["accumulate"] = self.accumulative
         gates_dict["output"] = self.output_numpy
+        gates_dict["record_step"] = self.record_step
+        gates_dict["max_frames"] = self.max_frames
+        gates_dict["frames_on_disk"] = self.frames_on_disk
 
 
         return gates_dict
@@ -23,6 +23,7 @@ from bpy.props import BoolProperty, StringProperty, IntProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, node_id, changable_sockets
+from sverchok.utils.frame_cache import FrameCache
 
 
 class SvCacheNode(SverchCustomTreeNode, bpy.types.Node):
@@ -36,6 +37,15 @@ class SvCacheNode(SverchCustomTreeNode, bpy.types.Node):
     
     cache_amount: IntProperty(default=1, min=0)
     cache_offset: IntProperty(default=1, min=0)
+    memory_budget: IntProperty(
+        name="Memory (MB)", default=256, min=0,
+        description="Memory for stored frames, least recently used frames are moved to disk (0 - no limit)")
+    use_disk: BoolProperty(
+        name="Spill to Disk", default=True,
+        description="Keep frames out of the memory budget in temporary files instead of forgetting them")
+    prefetch_frames: IntProperty(
+        name="Prefetch", default=2, min=0,
+        description="Number of next frames in direction of scrubbing to load from disk in background")
     node_dict = {}
     
     def sv_init(self, context):
@@ -46,22 +56,42 @@ class SvCacheNode(SverchCustomTreeNode, bpy.types.Node):
     def sv_draw_buttons(self, context, layout):
         layout.prop(self, "cache_offset")
 
+    def sv_draw_buttons_ext(self, context, layout):
+        self.sv_draw_buttons(context, layout)
+        layout.prop(self, "memory_budget")
+        layout.prop(self, "use_disk")
+        layout.prop(self, "prefetch_frames")
+
     def sv_update(self):
         changable_sockets(self, "Data", ["Data"])
         
+    def sv_free(self):
+        data = self.node_dict.pop(self.node_id, None)
+        if data:
+            data['cache'].clear()
+
     def process(self):
         n_id = self.node_id
         data = self.node_dict.get(n_id)
         if not data:
-            self.node_dict[n_id] = {}
+            self.node_dict[n_id] = {'cache': FrameCache(), 'last_frame': None}
             data = self.node_dict.get(n_id)
-            
+        cache = data['cache']
+        cache.memory_budget = self.memory_budget * 1024 * 1024
+        cache.use_disk = self.use_disk
+
         frame_current = bpy.context.scene.frame_current
         out_frame = frame_current - self.cache_offset
-        data[frame_current] = self.inputs[0].sv_get()
-        out_data = data.get(out_frame, [])
+        cache.put(frame_current, self.inputs[0].sv_get())
+        out_data = cache.get(out_frame, [])
         self.outputs[0].sv_set(out_data)
 
+        last_frame = data['last_frame']
+        if last_frame is not None and last_frame != frame_current and self.prefetch_frames:
+            step = 1 if frame_current > last_frame else -1
+            cache.prefetch([out_frame + step * i for i in range(1, self.prefetch_frames + 1)])
+        data['last_frame'] = frame_current
+
 def register():
     bpy.utils.register_class(SvCacheNode)
 
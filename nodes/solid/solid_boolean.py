@@ -11,6 +11,7 @@ from bpy.props import BoolProperty, EnumProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, zip_long_repeat,
                                      ensure_nesting_level, get_data_nesting_level)
+from sverchok.utils.nodes_mixins.cached_result import cache_result
 from sverchok.dependencies import FreeCAD
 
 if FreeCAD is not None:
@@ -151,6 +152,7 @@ class SvSolidBooleanNode(SverchCustomTreeNode, bpy.types.Node):
 
         return SvBoolResult(solid, edge_mask, edge_map, face_mask, face_map)
 
+    @cache_result
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
             return
@@ -6,6 +6,7 @@
 # License-Filename: LICENSE
 
 import numpy as np
+from functools import partial
 from itertools import combinations
 
 import bpy
@@ -63,16 +64,20 @@ class SvDelaunay3dMk2Node(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvStringsSocket', "Edges")
         self.outputs.new('SvStringsSocket', "Faces")
 
-    def make_edges(self, idxs):
+    @staticmethod
+    def make_edges(idxs):
         return [(i, j) for i in idxs for j in idxs if i < j]
 
-    def make_faces(self, idxs):
+    @staticmethod
+    def make_faces(idxs):
         return [(i, j, k) for i in idxs for j in idxs for k in idxs if i < j and j < k]
 
-    def get_verts(self, verts, idxs):
+    @staticmethod
+    def get_verts(verts, idxs):
         return [verts[i] for i in idxs]
 
-    def is_planar(self, verts, idxs, threshold):
+    @staticmethod
+    def is_planar(verts, idxs, threshold):
         if threshold == 0:
             return False
         a, b, c, d = [verts[i] for i in idxs]
@@ -86,7 +91,8 @@ class SvDelaunay3dMk2Node(SverchCustomTreeNode, bpy.types.Node):
         volume = np.cross(v1, v2).dot(v3) / 6
         return abs(volume) < threshold
     
-    def is_too_long(self, verts, idxs, threshold):
+    @staticmethod
+    def is_too_long(verts, idxs, threshold):
         if threshold == 0:
             return False
         verts = [np.array(verts[i]) for i in idxs]
@@ -96,14 +102,23 @@ class SvDelaunay3dMk2Node(SverchCustomTreeNode, bpy.types.Node):
                 return True
         return False
 
-    def process(self):
+    def sv_thread_task(self):
         if not any(socket.is_linked for socket in self.outputs):
-            return
+            return lambda: {}
 
         vertices_s = self.inputs['Vertices'].sv_get()
         volume_threshold_s = self.inputs['PlanarThreshold'].sv_get()
         edge_threshold_s = self.inputs['EdgeThreshold'].sv_get()
 
+        # the function can be called in a worker thread, it should not touch the node
+        return partial(self.evaluate, vertices_s, volume_threshold_s, edge_threshold_s, self.join)
+
+    def process(self):
+        for name, data in self.sv_thread_task()().items():
+            self.outputs[name].sv_set(data)
+
+    @classmethod
+    def evaluate(cls, vertices_s, volume_threshold_s, edge_threshold_s, join):
         input_level = get_data_nesting_level(vertices_s)
 
         vertices_s = ensure_nesting_level(vertices_s, 4)
@@ -122,15 +137,15 @@ class SvDelaunay3dMk2Node(SverchCustomTreeNode, bpy.types.Node):
             for vertices, volume_threshold, edge_threshold in zip_long_repeat(*params):
 
                 tri = Delaunay(np.array(vertices))
-                if self.join:
+                if join:
                     verts_new = vertices
                     edges_new = set()
                     faces_new = set()
                     for simplex_idx, simplex in enumerate(tri.simplices):
-                        if self.is_too_long(vertices, simplex, edge_threshold) or self.is_planar(vertices, simplex, volume_threshold):
+                        if cls.is_too_long(vertices, simplex, edge_threshold) or cls.is_planar(vertices, simplex, volume_threshold):
                             continue
-                        edges_new.update(set(self.make_edges(simplex)))
-                        faces_new.update(set(self.make_faces(simplex)))
+                        edges_new.update(set(cls.make_edges(simplex)))
+                        faces_new.update(set(cls.make_faces(simplex)))
                     verts_item.append(verts_new)
                     edges_item.append(list(edges_new))
                     faces_item.append(list(faces_new))
@@ -139,11 +154,11 @@ class SvDelaunay3dMk2Node(SverchCustomTreeNode, bpy.types.Node):
                     edges_new = []
                     faces_new = []
                     for simplex in tri.simplices:
-                        if self.is_too_long(vertices, simplex, edge_threshold) or self.is_planar(vertices, simplex, volume_threshold):
+                        if cls.is_too_long(vertices, simplex, edge_threshold) or cls.is_planar(vertices, simplex, volume_threshold):
                             continue
-                        verts_simplex = self.get_verts(vertices, simplex)
-                        edges_simplex = self.make_edges([0, 1, 2, 3])
-                        faces_simplex = self.make_faces([0, 1, 2, 3])
+                        verts_simplex = cls.get_verts(vertices, simplex)
+                        edges_simplex = cls.make_edges([0, 1, 2, 3])
+                        faces_simplex = cls.make_faces([0, 1, 2, 3])
                         verts_new.append(verts_simplex)
                         edges_new.append(edges_simplex)
                         faces_new.append(faces_simplex)
@@ -160,9 +175,7 @@ class SvDelaunay3dMk2Node(SverchCustomTreeNode, bpy.types.Node):
                     edges_out.extend(edges_item)
                     faces_out.extend(faces_item)
 
-        self.outputs['Vertices'].sv_set(verts_out)
-        self.outputs['Edges'].sv_set(edges_out)
-        self.outputs['Faces'].sv_set(faces_out)
+        return {'Vertices': verts_out, 'Edges': edges_out, 'Faces': faces_out}
 
 
 def register():
@@ -46,11 +46,20 @@ class SvLloyd2dNode(SverchCustomTreeNode, bpy.types.Node):
         default = 3,
         update = updateNode)
 
+    stop_tolerance : FloatProperty(
+        name = "Stop Tolerance",
+        description = "Stop iterations as soon as no site moves by more than this distance during an iteration; 0 means always do all iterations",
+        min = 0.0,
+        default = 0.0,
+        precision = 5,
+        update = updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', "Vertices")
         self.inputs.new('SvStringsSocket', 'Iterations').prop_name = 'iterations'
         self.inputs.new('SvScalarFieldSocket', 'Weights').enable_input_link_menu = False
         self.outputs.new('SvVerticesSocket', "Vertices")
+        self.outputs.new('SvStringsSocket', "Displacement")
 
     def draw_buttons(self, context, layout):
         layout.label(text="Bounds mode:")
@@ -59,6 +68,7 @@ class SvLloyd2dNode(SverchCustomTreeNode, bpy.types.Node):
     def draw_buttons_ext(self, context, layout):
         self.draw_buttons(context, layout)
         layout.prop(self, "clip", text="Clipping")
+        layout.prop(self, "stop_tolerance")
 
     def process(self):
 
@@ -78,18 +88,27 @@ class SvLloyd2dNode(SverchCustomTreeNode, bpy.types.Node):
         nested_output = input_level > 3
 
         verts_out = []
+        displacement_out = []
         for params in zip_long_repeat(verts_in, iterations_in, weights_in):
             new_verts = []
+            new_displacement = []
             for verts, iterations, weights in zip_long_repeat(*params):
+                history = []
                 iter_verts = lloyd2d(self.bound_mode, verts, iterations,
-                                clip = self.clip, weight_field = weights)
+                                clip = self.clip, weight_field = weights,
+                                stop_tolerance = self.stop_tolerance, history = history)
                 new_verts.append(iter_verts)
+                new_displacement.append(history)
             if nested_output:
                 verts_out.append(new_verts)
+                displacement_out.append(new_displacement)
             else:
                 verts_out.extend(new_verts)
+                displacement_out.extend(new_displacement)
 
         self.outputs['Vertices'].sv_set(verts_out)
+        if 'Displacement' in self.outputs:
+            self.outputs['Displacement'].sv_set(displacement_out)
 
 def register():
     bpy.utils.register_class(SvLloyd2dNode)
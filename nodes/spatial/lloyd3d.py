@@ -51,17 +51,30 @@ class SvLloyd3dNode(SverchCustomTreeNode, bpy.types.Node):
         default = 'BOX',
         update = updateNode)
 
+    stop_tolerance : FloatProperty(
+        name = "Stop Tolerance",
+        description = "Stop iterations as soon as no site moves by more than this distance during an iteration; 0 means always do all iterations",
+        min = 0.0,
+        default = 0.0,
+        precision = 5,
+        update = updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', "Sites").enable_input_link_menu = False
         self.inputs.new('SvStringsSocket', "Clipping").prop_name = 'clipping'
         self.inputs.new('SvStringsSocket', 'Iterations').prop_name = 'iterations'
         self.inputs.new('SvScalarFieldSocket', 'Weights').enable_input_link_menu = False
         self.outputs.new('SvVerticesSocket', "Sites")
+        self.outputs.new('SvStringsSocket', "Displacement")
 
     def draw_buttons(self, context, layout):
         layout.label(text="Bounds mode:")
         layout.prop(self, "bounds_mode", text='')
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, "stop_tolerance")
+
     def process(self):
 
         if not any(socket.is_linked for socket in self.outputs):
@@ -82,18 +95,27 @@ class SvLloyd3dNode(SverchCustomTreeNode, bpy.types.Node):
         nested_output = input_level > 3
 
         verts_out = []
+        displacement_out = []
         for params in zip_long_repeat(sites_in, iterations_in, clipping_in, weights_in):
             new_verts = []
+            new_displacement = []
             for sites, iterations, clipping, weights in zip_long_repeat(*params):
                 bounds = Bounds.new(self.bounds_mode, sites, clipping)
-                sites = lloyd3d_bounded(bounds, sites, iterations, weight_field = weights)
+                history = []
+                sites = lloyd3d_bounded(bounds, sites, iterations, weight_field = weights,
+                            stop_tolerance = self.stop_tolerance, history = history)
                 new_verts.append(sites)
+                new_displacement.append(history)
             if nested_output:
                 verts_out.append(new_verts)
+                displacement_out.append(new_displacement)
             else:
                 verts_out.extend(new_verts)
+                displacement_out.extend(new_displacement)
 
         self.outputs['Sites'].sv_set(verts_out)
+        if 'Displacement' in self.outputs:
+            self.outputs['Displacement'].sv_set(displacement_out)
 
 
 def register():
@@ -50,8 +50,20 @@ class SvLloydOnMeshNode(SverchCustomTreeNode, bpy.types.Node):
             default = 'SURFACE',
             update=updateNode)
 
+    stop_tolerance : FloatProperty(
+        name = "Stop Tolerance",
+        description = "Stop iterations as soon as no site moves by more than this distance during an iteration; 0 means always do all iterations",
+        min = 0.0,
+        default = 0.0,
+        precision = 5,
+        update = updateNode)
+
     def draw_buttons(self, context, layout):
         layout.prop(self, "mode")
+
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, "stop_tolerance")
     
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', "Vertices")
@@ -61,6 +73,7 @@ class SvLloydOnMeshNode(SverchCustomTreeNode, bpy.types.Node):
         self.inputs.new('SvStringsSocket', 'Thickness').prop_name = 'thickness'
         self.inputs.new('SvScalarFieldSocket', 'Weights').enable_input_link_menu = False
         self.outputs.new('SvVerticesSocket', "Sites")
+        self.outputs.new('SvStringsSocket', "Displacement")
 
     def process(self):
 
@@ -86,20 +99,30 @@ class SvLloydOnMeshNode(SverchCustomTreeNode, bpy.types.Node):
         nested_output = input_level > 3
 
         verts_out = []
+        displacement_out = []
         for params in zip_long_repeat(verts_in, faces_in, sites_in, thickness_in, iterations_in, weights_in):
             new_verts = []
+            new_displacement = []
             for verts, faces, sites, thickness, iterations, weights in zip_long_repeat(*params):
+                history = []
                 if self.mode == 'SURFACE':
-                    sites = lloyd_on_mesh(verts, faces, sites, thickness, iterations, weight_field = weights)
+                    sites = lloyd_on_mesh(verts, faces, sites, thickness, iterations, weight_field = weights,
+                                stop_tolerance = self.stop_tolerance, history = history)
                 else:
-                    sites = lloyd_in_mesh(verts, faces, sites, iterations, thickness=thickness, weight_field = weights)
+                    sites = lloyd_in_mesh(verts, faces, sites, iterations, thickness=thickness, weight_field = weights,
+                                stop_tolerance = self.stop_tolerance, history = history)
                 new_verts.append(sites)
+                new_displacement.append(history)
             if nested_output:
                 verts_out.append(new_verts)
+                displacement_out.append(new_displacement)
             else:
                 verts_out.extend(new_verts)
+                displacement_out.extend(new_displacement)
 
         self.outputs['Sites'].sv_set(verts_out)
+        if 'Displacement' in self.outputs:
+            self.outputs['Displacement'].sv_set(displacement_out)
 
 
 def register():
@@ -34,6 +34,17 @@ class SvLloydOnSphereNode(SverchCustomTreeNode, bpy.types.Node):
         default = 3,
         update = updateNode)
 
+    stop_tolerance : FloatProperty(
+        name = "Stop Tolerance",
+        description = "Stop iterations as soon as no site moves by more than this distance during an iteration; 0 means always do all iterations",
+        min = 0.0,
+        default = 0.0,
+        precision = 5,
+        update = updateNode)
+
+    def draw_buttons_ext(self, context, layout):
+        layout.prop(self, "stop_tolerance")
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', "Sites").enable_input_link_menu = False
         d = self.inputs.new('SvVerticesSocket', "Center")
@@ -44,6 +55,7 @@ class SvLloydOnSphereNode(SverchCustomTreeNode, bpy.types.Node):
         self.inputs.new('SvScalarFieldSocket', 'Weights').enable_input_link_menu = False
 
         self.outputs.new('SvVerticesSocket', "Sites")
+        self.outputs.new('SvStringsSocket', "Displacement")
 
     def process(self):
 
@@ -67,17 +79,26 @@ class SvLloydOnSphereNode(SverchCustomTreeNode, bpy.types.Node):
         nested_output = input_level > 3
 
         verts_out = []
+        displacement_out = []
         for params in zip_long_repeat(center_in, radius_in, sites_in, iterations_in, weights_in):
             new_verts = []
+            new_displacement = []
             for center, radius, sites, iterations, weights in zip_long_repeat(*params):
-                sites = lloyd_on_sphere(center, radius, sites, iterations, weights)
+                history = []
+                sites = lloyd_on_sphere(center, radius, sites, iterations, weights,
+                            stop_tolerance = self.stop_tolerance, history = history)
                 new_verts.append(sites)
+                new_displacement.append(history)
             if nested_output:
                 verts_out.append(new_verts)
+                displacement_out.append(new_displacement)
             else:
                 verts_out.extend(new_verts)
+                displacement_out.extend(new_displacement)
 
         self.outputs['Sites'].sv_set(verts_out)
+        if 'Displacement' in self.outputs:
+            self.outputs['Displacement'].sv_set(displacement_out)
 
 
 def register():
@@ -66,12 +66,21 @@ class SvLloydSolidNode(SverchCustomTreeNode, bpy.types.Node):
         default = 'VOLUME',
         update = update_sockets)
 
+    stop_tolerance : FloatProperty(
+        name = "Stop Tolerance",
+        description = "Stop iterations as soon as no site moves by more than this distance during an iteration; 0 means always do all iterations",
+        min = 0.0,
+        default = 0.0,
+        precision = 5,
+        update = updateNode)
+
     def draw_buttons(self, context, layout):
         layout.prop(self, "mode", text='')
 
     def draw_buttons_ext(self, context, layout):
         self.draw_buttons(context, layout)
         layout.prop(self, "accuracy")
+        layout.prop(self, "stop_tolerance")
 
     def sv_init(self, context):
         self.inputs.new('SvSolidSocket', "Solid")
@@ -80,6 +89,7 @@ class SvLloydSolidNode(SverchCustomTreeNode, bpy.types.Node):
         self.inputs.new('SvStringsSocket', 'Iterations').prop_name = 'iterations'
         self.inputs.new('SvScalarFieldSocket', 'Weights').enable_input_link_menu = False
         self.outputs.new('SvVerticesSocket', "Sites")
+        self.outputs.new('SvStringsSocket', "Displacement")
         self.update_sockets(context)
 
     def process(self):
@@ -106,23 +116,33 @@ class SvLloydSolidNode(SverchCustomTreeNode, bpy.types.Node):
         tolerance = 10**(-self.accuracy)
 
         verts_out = []
+        displacement_out = []
         for params in zip_long_repeat(solid_in, sites_in, iterations_in, thickness_in, weights_in):
             new_verts = []
+            new_displacement = []
             for solid, sites, iterations, thickness, weights in zip_long_repeat(*params):
+                history = []
                 if self.mode == 'VOLUME':
                     sites = lloyd_in_solid(solid, sites, iterations,
-                                weight_field = weights, tolerance = tolerance)
+                                weight_field = weights, tolerance = tolerance,
+                                stop_tolerance = self.stop_tolerance, history = history)
                 else:
                     sites = lloyd_on_solid_surface(solid, sites, thickness, iterations,
-                                weight_field = weights, tolerance = tolerance)
+                                weight_field = weights, tolerance = tolerance,
+                                stop_tolerance = self.stop_tolerance, history = history)
 
                 new_verts.append(sites)
+                new_displacement.append(history)
             if nested_output:
                 verts_out.append(new_verts)
+                displacement_out.append(new_displacement)
             else:
                 verts_out.extend(new_verts)
+                displacement_out.extend(new_displacement)
 
         self.outputs['Sites'].sv_set(verts_out)
+        if 'Displacement' in self.outputs:
+            self.outputs['Displacement'].sv_set(displacement_out)
 
 
 def register():
@@ -41,6 +41,17 @@ class SvLloydSolidFaceNode(SverchCustomTreeNode, bpy.types.Node):
         description="Thickness of region where Voronoi diagram is generated",
         update=updateNode)
 
+    stop_tolerance : FloatProperty(
+        name = "Stop Tolerance",
+        description = "Stop iterations as soon as no site moves by more than this distance during an iteration; 0 means always do all iterations",
+        min = 0.0,
+        default = 0.0,
+        precision = 5,
+        update = updateNode)
+
+    def draw_buttons_ext(self, context, layout):
+        layout.prop(self, "stop_tolerance")
+
     def sv_init(self, context):
         self.inputs.new('SvSurfaceSocket', "SolidFace")
         self.inputs.new('SvVerticesSocket', "Sites").enable_input_link_menu = False
@@ -49,6 +60,7 @@ class SvLloydSolidFaceNode(SverchCustomTreeNode, bpy.types.Node):
         self.inputs.new('SvScalarFieldSocket', 'Weights').enable_input_link_menu = False
         self.outputs.new('SvVerticesSocket', "Sites")
         self.outputs.new('SvVerticesSocket', "UVPoints")
+        self.outputs.new('SvStringsSocket', "Displacement")
 
     def process(self):
 
@@ -72,9 +84,11 @@ class SvLloydSolidFaceNode(SverchCustomTreeNode, bpy.types.Node):
         nested_output = input_level > 3
 
         verts_out = []
+        displacement_out = []
         uvpoints_out = []
         for params in zip_long_repeat(surface_in, sites_in, iterations_in, thickness_in, weights_in):
             new_verts = []
+            new_displacement = []
             new_uvpoints = []
             for surface, sites, iterations, thickness, weights in zip_long_repeat(*params):
                 if is_solid_face_surface(surface):
@@ -82,18 +96,25 @@ class SvLloydSolidFaceNode(SverchCustomTreeNode, bpy.types.Node):
                 else:
                     fc_face = surface_to_freecad(surface, make_face=True).face
 
-                uvpoints, sites = lloyd_on_fc_face(fc_face, sites, thickness, iterations, weight_field = weights)
+                history = []
+                uvpoints, sites = lloyd_on_fc_face(fc_face, sites, thickness, iterations, weight_field = weights,
+                                    stop_tolerance = self.stop_tolerance, history = history)
 
                 new_verts.append(sites)
+                new_displacement.append(history)
                 new_uvpoints.append(uvpoints)
             if nested_output:
                 verts_out.append(new_verts)
+                displacement_out.append(new_displacement)
                 uvpoints_out.append(new_uvpoints)
             else:
                 verts_out.extend(new_verts)
+                displacement_out.extend(new_displacement)
                 uvpoints_out.extend(new_uvpoints)
 
         self.outputs['Sites'].sv_set(verts_out)
+        if 'Displacement' in self.outputs:
+            self.outputs['Displacement'].sv_set(displacement_out)
         self.outputs['UVPoints'].sv_set(uvpoints_out)
 
 
@@ -16,6 +16,7 @@ from sverchok.data_structure import updateNode, zip_long_repeat, get_data_nestin
 from sverchok.utils.sv_mesh_utils import polygons_to_edges, mesh_join
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata, bmesh_clip
 from sverchok.utils.geom import calc_bounds
+from sverchok.utils.nodes_mixins.cached_result import cache_result
 from sverchok.dependencies import scipy
 
 if scipy is not None:
@@ -197,6 +198,7 @@ class SvExVoronoi3DNode(SverchCustomTreeNode, bpy.types.Node):
             bm.free()
             return vertices, edges, faces
 
+    @cache_result
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
             return
@@ -8,8 +8,10 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.core.sockets import setup_new_node_location
 from sverchok.data_structure import updateNode, match_long_repeat
 from sverchok.utils.marching_cubes import isosurface_np
+from sverchok.utils.field.compiler import compile_field
 from sverchok.dependencies import mcubes, skimage
 from sverchok.utils.nodes_mixins.draft_mode import DraftMode
+from sverchok.utils.nodes_mixins.cached_result import cache_result
 
 if skimage is not None:
     import skimage.measure
@@ -172,6 +174,7 @@ class SvExMarchingCubesNode(DraftMode, SverchCustomTreeNode, bpy.types.Node):
         verts[:,2] = verts[:,2] * scale_z + b1n[2]
         return verts
 
+    @cache_result
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
             return
@@ -230,7 +233,7 @@ class SvExMarchingCubesNode(DraftMode, SverchCustomTreeNode, bpy.types.Node):
                 y_range = np.linspace(b1[1], b2[1], num=samples_y)
                 z_range = np.linspace(b1[2], b2[2], num=samples_z)
                 xs, ys, zs = np.meshgrid(x_range, y_range, z_range, indexing='ij')
-                func_values = field.evaluate_grid(xs.flatten(), ys.flatten(), zs.flatten())
+                func_values = compile_field(field).evaluate_grid(xs.flatten(), ys.flatten(), zs.flatten())
                 func_values = func_values.reshape((samples_x, samples_y, samples_z))
 
             if self.implementation == 'mcubes':
@@ -1,3 +1,4 @@
+from functools import partial
 
 import bpy
 from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
@@ -9,6 +10,7 @@ from sverchok.utils.math import supported_metrics
 from sverchok.utils.curve.core import SvCurve
 from sverchok.utils.curve.nurbs import SvNurbsCurve
 from sverchok.utils.surface.nurbs import simple_loft
+from sverchok.utils.nodes_mixins.cached_result import cache_thread_task
 from sverchok.dependencies import geomdl
 
 class SvNurbsLoftNode(SverchCustomTreeNode, bpy.types.Node):
@@ -72,13 +74,24 @@ class SvNurbsLoftNode(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvCurveSocket', "UnifiedCurves")
         self.outputs.new('SvCurveSocket', "VCurves")
 
-    def process(self):
+    @cache_thread_task
+    def sv_thread_task(self):
         if not any(socket.is_linked for socket in self.outputs):
-            return
+            return lambda: {}
 
         curves_s = self.inputs['Curves'].sv_get()
         degrees_s = self.inputs['DegreeV'].sv_get()
 
+        # the function can be called in a worker thread, it should not touch the node
+        return partial(self.evaluate, curves_s, degrees_s,
+                       self.u_knots_mode, self.metric, self.nurbs_implementation)
+
+    def process(self):
+        for name, data in self.sv_thread_task()().items():
+            self.outputs[name].sv_set(data)
+
+    @staticmethod
+    def evaluate(curves_s, degrees_s, u_knots_mode, metric, nurbs_implementation):
         curves_s = ensure_nesting_level(curves_s, 3, data_types=(SvCurve,))
         degrees_s = ensure_nesting_level(degrees_s, 2)
 
@@ -95,9 +108,9 @@ class SvNurbsLoftNode(SverchCustomTreeNode, bpy.types.Node):
                     raise Exception("Some of curves are not NURBS!")
                 unified_curves, v_curves, new_surface = simple_loft(curves, 
                                     degree_v = degree_v,
-                                    knots_u = self.u_knots_mode,
-                                    metric = self.metric,
-                                    implementation = self.nurbs_implementation)
+                                    knots_u = u_knots_mode,
+                                    metric = metric,
+                                    implementation = nurbs_implementation)
                 new_surfaces.append(new_surface)
                 new_curves.extend(unified_curves)
                 new_v_curves.extend(v_curves)
@@ -105,9 +118,7 @@ class SvNurbsLoftNode(SverchCustomTreeNode, bpy.types.Node):
             curves_out.append(new_curves)
             v_curves_out.append(new_v_curves)
 
-        self.outputs['Surface'].sv_set(surface_out)
-        self.outputs['UnifiedCurves'].sv_set(curves_out)
-        self.outputs['VCurves'].sv_set(v_curves_out)
+        return {'Surface': surface_out, 'UnifiedCurves': curves_out, 'VCurves': v_curves_out}
 
 def register():
     bpy.utils.register_class(SvNurbsLoftNode)
@@ -17,6 +17,8 @@
 # ##### END GPL LICENSE BLOCK #####
 
 
+import numpy as np
+
 import bpy
 from bpy.props import EnumProperty, IntProperty, FloatProperty
 from mathutils import noise
@@ -24,7 +26,8 @@ from mathutils import noise
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.utils.sv_seed_funcs import get_offset, seed_adjusted
-from sverchok.utils.sv_noise_utils import noise_options, PERLIN_ORIGINAL
+from sverchok.utils.sv_noise_utils import noise_options, PERLIN_ORIGINAL, implementation_modes
+from sverchok.utils import sv_noise_np
 
 # helpers
 def dict_from(options, idx1, idx2):
@@ -50,6 +53,29 @@ def hybrid(nbasis, verts, h_factor, lacunarity, octaves, offset, gain):
     return [noise.hybrid_multi_fractal(v, h_factor, lacunarity, octaves, offset, gain, noise_basis=nbasis) for v in verts]
 
 
+# NumPy versions of function wrappers
+def fractal_np(nbasis, verts, h_factor, lacunarity, octaves, offset, gain):
+    return sv_noise_np.fractal(verts, h_factor, lacunarity, octaves, nbasis).tolist()
+
+def multifractal_np(nbasis, verts, h_factor, lacunarity, octaves, offset, gain):
+    return sv_noise_np.multi_fractal(verts, h_factor, lacunarity, octaves, nbasis).tolist()
+
+def hetero_np(nbasis, verts, h_factor, lacunarity, octaves, offset, gain):
+    return sv_noise_np.hetero_terrain(verts, h_factor, lacunarity, octaves, offset, nbasis).tolist()
+
+def ridged_np(nbasis, verts, h_factor, lacunarity, octaves, offset, gain):
+    return sv_noise_np.ridged_multi_fractal(verts, h_factor, lacunarity, octaves, offset, gain, nbasis).tolist()
+
+def hybrid_np(nbasis, verts, h_factor, lacunarity, octaves, offset, gain):
+    return sv_noise_np.hybrid_multi_fractal(verts, h_factor, lacunarity, octaves, offset, gain, nbasis).tolist()
+
+fractal_np_f = {
+    'FRACTAL': fractal_np,
+    'MULTI_FRACTAL': multifractal_np,
+    'HETERO_TERRAIN': hetero_np,
+    'RIDGED_MULTI_FRACTAL': ridged_np,
+    'HYBRID_MULTI_FRACTAL': hybrid_np
+}
 
 fractal_options = [
     ('FRACTAL', 0, fractal),
@@ -134,6 +160,11 @@ class SvVectorFractal(SverchCustomTreeNode, bpy.types.Node):
     gain: FloatProperty(default=0.5, description='Gain parameter', name='Gain', update=updateNode)
     seed: IntProperty(default=0, name='Seed', update=updateNode)
 
+    implementation: EnumProperty(
+        name='Implementation', items=implementation_modes,
+        description='Choose calculation method',
+        default="Mathutils", update=updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', 'Vertices')
         self.inputs.new('SvStringsSocket', 'Seed').prop_name = 'seed'
@@ -146,6 +177,10 @@ class SvVectorFractal(SverchCustomTreeNode, bpy.types.Node):
         layout.prop(self, 'fractal_type', text="Type")
         layout.prop(self, 'noise_type', text="Type")
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, 'implementation')
+
     def process(self):
         inputs, outputs = self.inputs, self.outputs
 
@@ -153,7 +188,11 @@ class SvVectorFractal(SverchCustomTreeNode, bpy.types.Node):
             return
 
         _seed = inputs['Seed'].sv_get()[0][0]
-        wrapped_fractal_function = fractal_f[self.fractal_type]
+        use_numpy = self.implementation == 'NumPy' and self.noise_type in sv_noise_np.NOISE_TYPES
+        if use_numpy:
+            wrapped_fractal_function = fractal_np_f[self.fractal_type]
+        else:
+            wrapped_fractal_function = fractal_f[self.fractal_type]
 
         verts = inputs['Vertices'].sv_get()
 
@@ -168,7 +207,10 @@ class SvVectorFractal(SverchCustomTreeNode, bpy.types.Node):
         for idx, vlist in enumerate(verts):
             # lazy generation of full parameters.
             params = [(param[idx] if idx < len(param) else param[-1]) for param in param_list]
-            final_vert_list = [seed_adjusted(vlist, _seed)]
+            if use_numpy:
+                final_vert_list = [np.asarray(vlist, dtype=np.float64) + np.array(get_offset(_seed))]
+            else:
+                final_vert_list = [seed_adjusted(vlist, _seed)]
 
             out.append(wrapped_fractal_function(self.noise_type, final_vert_list[0], *params))
 
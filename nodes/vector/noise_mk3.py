@@ -25,8 +25,10 @@ from itertools import cycle
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat
-from sverchok.utils.sv_noise_utils import noise_options, PERLIN_ORIGINAL, noise_numpy_types
+from sverchok.utils.sv_noise_utils import noise_options, PERLIN_ORIGINAL, implementation_modes, noise_numpy_types
 from sverchok.utils.modules.matrix_utils import matrix_apply_np
+from sverchok.utils import sv_noise_np
+from sverchok.utils.sv_seed_funcs import noise_lock
 import numpy as np
 
 
@@ -57,6 +59,15 @@ def mathulis_noise(vecs, out, out_mode, noise_type, noise_function, output_numpy
         noise_output = np.linalg.norm(vecs, axis=1)*0.5
         out.append(noise_output if output_numpy else noise_output.tolist())
 
+def numpy_mathutils_noise(vecs, out, out_mode, noise_type, seed, output_numpy):
+    """NumPy version of mathulis_noise"""
+    vecs = np.asarray(vecs, dtype=np.float64).reshape((-1, 3))  # it can be empty list
+    noise_output = sv_noise_np.noise_vector(vecs, noise_type, seed)
+    if out_mode != 'VECTOR':
+        noise_output[:, 2] -= 1
+        noise_output = np.linalg.norm(noise_output, axis=1)*0.5
+    out.append(noise_output if output_numpy else noise_output.tolist())
+
 def preprocess_verts(noise_matrix, verts, numpy_mode):
     if isinstance(noise_matrix[0], Matrix):
         if numpy_mode:
@@ -140,6 +151,11 @@ class SvNoiseNodeMK3(SverchCustomTreeNode, bpy.types.Node):
         description='Output NumPy arrays',
         default=False, update=updateNode)
 
+    implementation: EnumProperty(
+        name='Implementation', items=implementation_modes,
+        description='Calculation method of Blender noise types',
+        default="Mathutils", update=updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', 'Vertices')
         self.inputs.new('SvStringsSocket', 'Seed').prop_name = 'seed'
@@ -158,6 +174,8 @@ class SvNoiseNodeMK3(SverchCustomTreeNode, bpy.types.Node):
 
     def draw_buttons_ext(self, ctx, layout):
         self.draw_buttons(ctx, layout)
+        if self.noise_type not in noise_numpy_types.keys():
+            layout.prop(self, "implementation")
         layout.prop(self, "output_numpy", toggle=False)
 
     def rclick_menu(self, context, layout):
@@ -198,6 +216,14 @@ class SvNoiseNodeMK3(SverchCustomTreeNode, bpy.types.Node):
                 obj_id = min(i, len(verts)-1)
                 numpy_noise(verts[obj_id], out, out_mode, seed, noise_function, smooth, output_numpy)
 
+        elif self.implementation == 'NumPy' and noise_type in sv_noise_np.NOISE_TYPES:
+
+            for i in range(max_len):
+                seed = seeds[min(i, len(seeds)-1)]
+                obj_id = min(i, len(verts)-1)
+                seed_val = int(round(seed)) or 140230
+                numpy_mathutils_noise(verts[obj_id], out, out_mode, noise_type, seed_val, output_numpy)
+
         else:
 
             noise_function = noise.noise_vector
@@ -207,8 +233,9 @@ class SvNoiseNodeMK3(SverchCustomTreeNode, bpy.types.Node):
                 obj_id = min(i, len(verts)-1)
                 # 0 unsets the seed and generates unreproducible output based on system time
                 seed_val = int(round(seed)) or 140230
-                noise.seed_set(seed_val)
-                mathulis_noise(verts[obj_id], out, out_mode, noise_type, noise_function, output_numpy)
+                with noise_lock:  # a noise field can be evaluated in a worker thread meanwhile
+                    noise.seed_set(seed_val)
+                    mathulis_noise(verts[obj_id], out, out_mode, noise_type, noise_function, output_numpy)
 
         outputs[0].sv_set(out)
 
@@ -31,6 +31,7 @@ set_frame_change = None
 info, setLevel = [None] * 2
 draw_extra_addons = None
 apply_theme, rebuild_color_cache, color_callback = [None] * 3
+set_socket_cache_limit, set_copy_on_write, set_node_cache_directory, set_node_cache_disk_limit = [None] * 4
 
 def get_params(prop_names_and_fallbacks, direct=False):
     """
@@ -251,6 +252,46 @@ class SverchokPreferences(AddonPreferences):
             default = "NONE",
             description = "Performance profiling mode")
 
+    def update_socket_cache_limit(self, context):
+        set_socket_cache_limit(self.socket_cache_limit)
+
+    socket_cache_limit: IntProperty(
+        name="Socket data memory limit",
+        description="Maximum size of socket data in megabytes kept in memory. "
+                    "Data exceeding the limit is moved to disk. Zero means no limit",
+        default=0, min=0,
+        update=update_socket_cache_limit)
+
+    def update_socket_data_cow(self, context):
+        set_copy_on_write(self.socket_data_cow)
+
+    socket_data_cow: BoolProperty(
+        name="Copy-on-write socket data",
+        description="Nodes share data of linked sockets and copy only those nested lists which they read. "
+                    "Some old nodes which check exact type of data can fail in this mode",
+        default=False,
+        update=update_socket_data_cow)
+
+    def update_node_cache_directory(self, context):
+        set_node_cache_directory(self.node_cache_directory)
+
+    node_cache_directory: StringProperty(
+        name="Node results folder",
+        description="Folder where results of expensive nodes are kept between sessions. "
+                    "If empty the results are kept only in memory",
+        subtype='DIR_PATH',
+        update=update_node_cache_directory)
+
+    def update_node_cache_disk_limit(self, context):
+        set_node_cache_disk_limit(self.node_cache_disk_limit)
+
+    node_cache_disk_limit: IntProperty(
+        name="Node results folder limit",
+        description="Maximum size of the node results folder in megabytes. "
+                    "Least recently used results are removed. Zero means no limit",
+        default=1024, min=0,
+        update=update_node_cache_disk_limit)
+
     developer_mode: BoolProperty(name = "Developer mode",
             description = "Show some additional panels or features useful for Sverchok developers only",
             default = False)
@@ -497,6 +538,13 @@ class SverchokPreferences(AddonPreferences):
         col2box.label(text="Debug:")
         col2box.prop(self, "developer_mode")
 
+        perf_box = col2.box()
+        perf_box.label(text="Performance:")
+        perf_box.prop(self, "socket_cache_limit")
+        perf_box.prop(self, "socket_data_cow")
+        perf_box.prop(self, "node_cache_directory")
+        perf_box.prop(self, "node_cache_disk_limit")
+
         log_box = col2.box()
         log_box.label(text="Logging:")
         log_box.prop(self, "log_level")
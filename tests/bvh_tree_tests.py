@@ -0,0 +1,30 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.bvh_tree import bvh_tree_from_polygons, bvh_find_nearest_array
+from sverchok.utils.field.scalar import SvBvhAttractorScalarField
+
+
+class BvhFindNearestTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        verts = [(-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+                 (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)]
+        faces = [(0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
+        self.bvh = bvh_tree_from_polygons(verts, faces)
+        self.points = np.random.default_rng(0).uniform(-2, 2, (50, 3))
+
+    def test_find_nearest_array(self):
+        nearest, normals, idxs, distances = bvh_find_nearest_array(self.bvh, self.points)
+        for point, loc, normal, idx, distance in zip(self.points, nearest, normals, idxs, distances):
+            expected = self.bvh.find_nearest(point)
+            self.assert_numpy_arrays_equal(loc, np.array(expected[0]), precision=6)
+            self.assert_numpy_arrays_equal(normal, np.array(expected[1]), precision=6)
+            self.assertEqual(idx, expected[2])
+            self.assertAlmostEqual(distance, expected[3])
+
+    def test_signed_distance(self):
+        field = SvBvhAttractorScalarField(bvh=self.bvh, signed=True)
+        xs, ys, zs = self.points.T
+        expected = np.array([field.evaluate(x, y, z) for x, y, z in self.points])
+        self.assert_numpy_arrays_equal(field.evaluate_grid(xs, ys, zs), expected, precision=6)
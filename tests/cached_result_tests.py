@@ -0,0 +1,107 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+import sverchok
+from sverchok.utils.testing import SverchokTestCase, EmptyTreeTestCase
+import sverchok.core.socket_data
+from sverchok.utils.nodes_mixins.cached_result import ResultCache, result_key, _imported_files, \
+    cache_thread_task, result_cache
+
+
+class ResultCacheTest(SverchokTestCase):
+    def test_hit_and_miss(self):
+        cache = ResultCache(memory_limit=2**20)
+        self.assertIsNone(cache.get('a'))
+        result = [[[1, 2, 3]], None]
+        cache.put('a', result)
+        self.assertEqual(cache.get('a'), result)
+        self.assertIsNone(cache.get('b'))
+
+    def test_copy(self):
+        cache = ResultCache(memory_limit=2**20)
+        cache.put('a', [[[1, 2, 3]]])
+        cache.get('a')[0][0].append(4)
+        self.assertEqual(cache.get('a'), [[[1, 2, 3]]])
+
+    def test_not_picklable(self):
+        cache = ResultCache(memory_limit=2**20)
+        cache.put('a', [[lambda: None]])
+        self.assertIsNone(cache.get('a'))
+
+    def test_memory_eviction(self):
+        cache = ResultCache(memory_limit=15000)
+        for key in 'abc':
+            cache.put(key, [list(range(2000))])
+        cache.get('b')
+        cache.put('d', [list(range(2000))])
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNone(cache.get('c'))
+        self.assertIsNotNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('d'))
+
+    def test_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(memory_limit=2**20)
+            cache.directory = directory
+            cache.put('a', [[[1, 2, 3]]])
+
+            cache = ResultCache(memory_limit=2**20)  # new session
+            cache.directory = directory
+            self.assertEqual(cache.get('a'), [[[1, 2, 3]]])
+            self.assertIsNone(cache.get('b'))
+
+    def test_disk_eviction(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(memory_limit=0)
+            cache.directory = directory
+            for key in 'abc':
+                cache.put(key, [[os.urandom(1000)]])
+            cache.get('a')
+            cache.disk_limit = 2500
+            cache.put('d', [[os.urandom(1000)]])
+            self.assertEqual(sorted(os.listdir(directory)), ['a.pkl.z', 'd.pkl.z'])
+            self.assertIsNone(cache.get('b'))
+            self.assertIsNotNone(cache.get('a'))
+
+
+class ResultKeyTest(EmptyTreeTestCase):
+    def test_key(self):
+        node = self.tree.nodes.new('SvNGonNode')
+        key = result_key(node)
+        self.assertIsNotNone(key)
+        self.assertEqual(result_key(node), key)
+
+        node.sides_ += 1
+        self.assertNotEqual(result_key(node), key)
+        node.sides_ -= 1
+        self.assertEqual(result_key(node), key)
+
+        node.outputs[0].sv_set([[(0.0, 0.0, 0.0)]])  # output data does not matter
+        self.assertEqual(result_key(node), key)
+
+    def test_version(self):
+        node = self.tree.nodes.new('SvNGonNode')
+        key = result_key(node)
+        with patch.object(sverchok, 'VERSION', 'another version'):
+            self.assertNotEqual(result_key(node), key)
+
+    def test_imported_modules(self):
+        # the key changes when code which the node uses is changed
+        files = _imported_files('sverchok.utils.nodes_mixins.cached_result')
+        self.assertIn(sverchok.core.socket_data.__file__, files)
+
+    def test_thread_task(self):
+        node = self.tree.nodes.new('SvNGonNode')
+        calls = []
+
+        @cache_thread_task
+        def sv_thread_task(_node):
+            calls.append(_node)
+            return lambda: {'Vertices': [[(1.0, 2.0, 3.0)]]}
+
+        with patch.object(result_cache, '_results', type(result_cache._results)()), \
+                patch.object(result_cache, '_directory', ''):
+            self.assertEqual(sv_thread_task(node)(), {'Vertices': [[(1.0, 2.0, 3.0)]]})
+            self.assertEqual(sv_thread_task(node)(), {'Vertices': [[(1.0, 2.0, 3.0)]]})
+        self.assertEqual(len(calls), 1)
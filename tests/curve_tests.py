@@ -1,8 +1,17 @@
 import numpy as np
 import unittest
 
-from sverchok.utils.testing import SverchokTestCase, requires
+from time import perf_counter
+
+from sverchok.utils.testing import SverchokTestCase, requires, manual_only
+from sverchok.utils.logging import info
 from sverchok.utils.curve.core import *
+from sverchok.utils.curve import knotvector as sv_knotvector
+from sverchok.utils.curve.primitives import SvLine, SvCircle
+from sverchok.utils.curve.algorithms import SvCurveLengthSolver
+from sverchok.utils.curve.bezier import SvBezierCurve, SvCubicBezierCurve
+from sverchok.utils.curve.nurbs import SvNativeNurbsCurve
+from sverchok.utils.curve.batch import evaluate_curves
 
 class TaylorTests(SverchokTestCase):
     def test_square_1(self):
@@ -38,3 +47,86 @@ class TaylorTests(SverchokTestCase):
 
         self.assert_numpy_arrays_equal(cpts, expected_cpts, precision=6)
 
+class BatchEvaluationTests(SverchokTestCase):
+    def _curves(self, number):
+        rng = np.random.default_rng(0)
+        curves = []
+        for i in range(number):
+            kind = i % 5
+            if kind == 0:
+                curve = SvNativeNurbsCurve(3, sv_knotvector.generate(3, 6),
+                                           rng.uniform(-1, 1, (6, 3)), rng.uniform(0.5, 2, 6))
+            elif kind == 1:  # unclamped, evaluated out of its knot spans
+                curve = SvNativeNurbsCurve(2, np.linspace(0, 1, 9), rng.uniform(-1, 1, (6, 3)))
+            elif kind == 2:
+                curve = SvBezierCurve(rng.uniform(-1, 1, (5, 3)))
+            elif kind == 3:
+                curve = SvCubicBezierCurve(*rng.uniform(-1, 1, (4, 3)))
+            else:
+                curve = SvLine(rng.uniform(-1, 1, 3), rng.uniform(-1, 1, 3))
+            curves.append(curve)
+        ts_list = [np.linspace(*curve.get_u_bounds(), num=1 + i % 7) for i, curve in enumerate(curves)]
+        return curves, ts_list
+
+    def test_evaluate_curves(self):
+        curves, ts_list = self._curves(50)
+        result = evaluate_curves(curves, ts_list)
+        for curve, ts, points in zip(curves, ts_list, result):
+            expected = np.array([curve.evaluate(t) for t in ts])
+            self.assert_numpy_arrays_equal(points, expected, precision=8)
+
+    @manual_only
+    def test_performance(self):
+        curves, ts_list = self._curves(5000)
+        start = perf_counter()
+        for curve, ts in zip(curves, ts_list):
+            curve.evaluate_array(ts)
+        loop_time = perf_counter() - start
+        start = perf_counter()
+        evaluate_curves(curves, ts_list)
+        batch_time = perf_counter() - start
+        info(f"{len(curves)} curves: one by one {loop_time * 1000:.0f}ms, batch {batch_time * 1000:.0f}ms")
+        self.assertLess(batch_time, loop_time)
+
+class LengthSolverTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.circle = SvCircle(center=np.zeros(3), normal=np.array([0.0, 0.0, 1.0]),
+                               vectorx=np.array([2.0, 0.0, 0.0]))
+        self.circle.u_bounds = (0.0, 2*np.pi)
+
+    def test_adaptive_length(self):
+        solver = SvCurveLengthSolver(self.circle)
+        solver.prepare('SPL', 10, tolerance=1e-6)
+        self.assertAlmostEqual(solver.get_total_length(), 4*np.pi, places=6)
+        ts = solver.solve(np.array([0.0, np.pi, 3*np.pi]))
+        self.assert_numpy_arrays_equal(ts, np.array([0.0, np.pi/2, 3*np.pi/2]), precision=6)
+
+    def test_nurbs_length(self):
+        rng = np.random.default_rng(0)
+        curve = SvNativeNurbsCurve(3, sv_knotvector.generate(3, 10), rng.uniform(-1, 1, (10, 3)))
+        solver = SvCurveLengthSolver(curve)
+        solver.prepare('LIN', 20, tolerance=1e-4)
+        lengths = np.linspace(0, solver.get_total_length(), 10)
+        # compare with chords of very fine polyline
+        fine = SvCurveLengthSolver(curve)
+        fine.prepare('LIN', 100000)
+        self.assert_numpy_arrays_equal(fine.calc_length_params(solver.solve(lengths)), lengths, precision=3)
+
+    def test_cached_tables(self):
+        solver1 = SvCurveLengthSolver(self.circle)
+        solver1.prepare('SPL', 10, tolerance=1e-3)
+        solver2 = SvCurveLengthSolver(self.circle)
+        solver2.prepare('SPL', 10, tolerance=1e-3)
+        self.assertIs(solver1._reverse_spline, solver2._reverse_spline)
+        solver3 = SvCurveLengthSolver(self.circle)
+        solver3.prepare('SPL', 10, tolerance=1e-4)
+        self.assertIsNot(solver1._reverse_spline, solver3._reverse_spline)
+
+    def test_changed_curve(self):
+        solver = SvCurveLengthSolver(self.circle)
+        solver.prepare('SPL', 10, tolerance=1e-6)
+        self.circle.radius = 1.0
+        solver = SvCurveLengthSolver(self.circle)
+        solver.prepare('SPL', 10, tolerance=1e-6)
+        self.assertAlmostEqual(solver.get_total_length(), 2*np.pi, places=6)
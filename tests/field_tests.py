@@ -0,0 +1,47 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.field.scalar import (SvScalarField, SvCoordinateScalarField, SvScalarFieldBinOp,
+                                         SvVectorFieldNorm, SvMergedScalarField)
+from sverchok.utils.field.vector import SvComposedVectorField, SvVectorFieldsLerp, SvVectorFieldMultipliedByScalar
+from sverchok.utils.field.compiler import compile_field
+
+
+class CountingScalarField(SvScalarField):
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate_grid(self, xs, ys, zs):
+        self.calls += 1
+        return np.sin(xs) * np.cos(ys) + zs
+
+
+class FieldCompilerTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.xs, self.ys, self.zs = np.random.default_rng(0).uniform(-1, 1, (3, 1000))
+        self.shared = CountingScalarField()
+        x = SvCoordinateScalarField('X')
+        product = SvScalarFieldBinOp(self.shared, x, lambda a, b: a * b)
+        total = SvScalarFieldBinOp(self.shared, product, lambda a, b: a + b)
+        self.vfield = SvComposedVectorField('XYZ', product, total, self.shared)
+        norm = SvVectorFieldNorm(self.vfield)
+        self.lerp = SvVectorFieldsLerp(self.vfield, SvVectorFieldMultipliedByScalar(self.vfield, norm), x)
+        self.sfield = SvMergedScalarField('SUM', [norm, total, self.shared])
+
+    def test_shared_fields(self):
+        expected = self.sfield.evaluate_grid(self.xs, self.ys, self.zs)
+        self.shared.calls = 0
+        values = compile_field(self.sfield).evaluate_grid(self.xs, self.ys, self.zs)
+        self.assertEqual(self.shared.calls, 1)
+        self.assert_numpy_arrays_equal(values, expected)
+
+    def test_chunks(self):
+        expected = self.lerp.evaluate_grid(self.xs, self.ys, self.zs)
+        self.shared.calls = 0
+        values = compile_field(self.lerp, chunk_size=300).evaluate_grid(self.xs, self.ys, self.zs)
+        self.assertEqual(self.shared.calls, 4)
+        self.assert_numpy_arrays_equal(np.array(values), np.array(expected))
+
+    def test_single_field(self):
+        self.assertIs(compile_field(self.shared), self.shared)
@@ -0,0 +1,59 @@
+import os
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.frame_cache import FrameCache
+
+
+class FrameCacheTests(SverchokTestCase):
+    def _frame(self, i):
+        return [np.full((1000, 3), i, dtype=np.float64)]
+
+    def test_copy(self):
+        cache = FrameCache()
+        data = [[1, 2, 3]]
+        cache.put(1, data)
+        data[0].append(4)
+        self.assertEqual(cache.get(1), [[1, 2, 3]])
+        self.assertEqual(cache.get(2, []), [])
+
+    def test_budget(self):
+        cache = FrameCache(memory_budget=100_000)
+        for i in range(10):
+            cache.put(i, self._frame(i))
+        self.assertLessEqual(cache.memory_size, 100_000)
+        self.assertEqual(len(cache), 10)
+        # frames from the disk are the same
+        for i in range(10):
+            self.assert_numpy_arrays_equal(cache.get(i)[0], self._frame(i)[0])
+
+    def test_no_disk(self):
+        cache = FrameCache(memory_budget=100_000, use_disk=False)
+        for i in range(10):
+            cache.put(i, self._frame(i))
+        self.assertLess(len(cache), 10)
+        self.assertIn(9, cache)
+        self.assertNotIn(0, cache)
+
+    def test_lru(self):
+        cache = FrameCache(memory_budget=60_000, use_disk=False)
+        cache.put(0, self._frame(0))
+        cache.put(1, self._frame(1))
+        cache.get(0)
+        cache.put(2, self._frame(2))
+        self.assertIn(0, cache)
+        self.assertNotIn(1, cache)
+
+    def test_prefetch(self):
+        cache = FrameCache(memory_budget=100_000)
+        for i in range(10):
+            cache.put(i, self._frame(i))
+        folder = cache._resources['folder']
+        cache.prefetch([0, 1])
+        cache._resources['executor'].shutdown(wait=True)
+        self.assertIn(0, cache._memory)
+        self.assertIn(1, cache._memory)
+        cache.clear()
+        self.assertFalse(os.path.exists(folder))
+        self.assertEqual(len(cache), 0)
@@ -0,0 +1,54 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.marching_cubes import isosurface_np, Polygoniser
+
+
+def per_voxel_isosurface(data, isolevel):
+    """The original implementation, calls Polygoniser for each cube"""
+    sx, sy, sz = data.shape
+    polygoniser = Polygoniser(isolevel)
+    triangles = []
+    for z in range(sz-1):
+        for y in range(sy-1):
+            for x in range(sx-1):
+                cornervalues = [data[x, y, z], data[x, y+1, z], data[x+1, y+1, z], data[x+1, y, z],
+                                data[x, y, z+1], data[x, y+1, z+1], data[x+1, y+1, z+1], data[x+1, y, z+1]]
+                triangles.extend(polygoniser.polygonise(cornervalues, x, y, z, x+1, y+1, z+1))
+    return np.array(polygoniser.vertices), triangles
+
+
+class MarchingCubesTests(SverchokTestCase):
+    def triangles(self, verts, faces):
+        """Sorted coordinates of triangles, does not depend on order of vertices"""
+        return sorted(tuple(np.round(verts[face], 8).ravel()) for face in np.array(faces))
+
+    def test_per_voxel(self):
+        data = np.random.default_rng(1).uniform(-1, 1, (7, 9, 8))
+        verts, faces = isosurface_np(data, 0.1)
+        expected_verts, expected_faces = per_voxel_isosurface(data, 0.1)
+        self.assertEqual(len(verts), len(expected_verts))
+        self.assertEqual(self.triangles(verts, faces), self.triangles(expected_verts, expected_faces))
+
+    def test_chunks(self):
+        data = np.random.default_rng(2).uniform(-1, 1, (12, 5, 6))
+        verts, faces = isosurface_np(data, 0.0)
+        chunked_verts, chunked_faces = isosurface_np(data, 0.0, chunk_cells=7)
+        self.assert_numpy_arrays_equal(chunked_verts, verts)
+        self.assertEqual(chunked_faces, faces)
+
+    def test_sphere(self):
+        xs = np.linspace(-1, 1, 21)
+        xs, ys, zs = np.meshgrid(xs, xs, xs, indexing='ij')
+        verts, faces = isosurface_np(xs**2 + ys**2 + zs**2, 0.5)
+        radiuses = np.linalg.norm(verts * 0.1 - 1, axis=1)
+        self.assertTrue(np.all(abs(radiuses - np.sqrt(0.5)) < 0.02))
+        # closed surface: each edge is shared by two triangles
+        edges = np.sort(np.array(faces)[:, [0, 1, 1, 2, 2, 0]].reshape((-1, 2)), axis=1)
+        _, counts = np.unique(edges, axis=0, return_counts=True)
+        self.assertTrue(np.all(counts == 2))
+
+    def test_empty(self):
+        verts, faces = isosurface_np(np.ones((4, 4, 4)), 0.5)
+        self.assertEqual(verts.shape, (0, 3))
+        self.assertEqual(faces, [])
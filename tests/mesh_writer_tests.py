@@ -0,0 +1,51 @@
+import numpy as np
+
+import bpy
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.nodes_mixins.generating_objects import MeshTopologyArrays
+
+
+class MeshTopologyArraysTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.verts = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0)]
+        self.edges = [(1, 4)]
+        self.faces = [[0, 1, 2], [0, 2, 3]]
+
+    def test_hash(self):
+        topology = MeshTopologyArrays(5, self.edges, self.faces)
+        same = MeshTopologyArrays(5, np.array(self.edges), np.array(self.faces))
+        self.assertEqual(topology.hash(), same.hash())
+        self.assertNotEqual(topology.hash(), MeshTopologyArrays(5, self.edges, [[0, 1, 3], [0, 2, 3]]).hash())
+        self.assertNotEqual(topology.hash(), MeshTopologyArrays(6, self.edges, self.faces).hash())
+        self.assertNotEqual(topology.hash(), MeshTopologyArrays(5, [], self.faces).hash())
+
+    def test_validate(self):
+        with self.assertRaises(IndexError):
+            MeshTopologyArrays(5, [], [[0, 1, 5]]).validate()
+        with self.assertRaises(IndexError):
+            MeshTopologyArrays(5, [(0, -1)], []).validate()
+        with self.assertRaises(ValueError):
+            MeshTopologyArrays(5, [], [[0, 1]]).validate()
+        with self.assertRaises(ValueError):
+            MeshTopologyArrays(5, [], [[1, 0, 2, 1]]).validate()
+        with self.assertRaises(ValueError):
+            MeshTopologyArrays(5, [], [[0, 1, 0, 2]]).validate()
+        with self.assertRaises(ValueError):
+            MeshTopologyArrays(5, [], [[0, 1, 2], [3, 4, 1, 2], [2, 0, 1]]).validate()
+        with self.assertRaises(ValueError):
+            MeshTopologyArrays(5, [(0, 1), (2, 3), (1, 0)], []).validate()
+        MeshTopologyArrays(5, [(0, 1), (1, 2)], [[0, 1, 2], [0, 2, 1, 3], [3, 4, 0]]).validate()
+        MeshTopologyArrays(5, [], np.array([[0, 1, 2], [0, 1, 3]])).validate()
+
+    def test_write(self):
+        mesh = bpy.data.meshes.new("mesh_writer_test")
+        try:
+            MeshTopologyArrays(5, self.edges, self.faces).write(mesh, self.verts)
+            self.assertEqual(len(mesh.vertices), 5)
+            self.assertEqual([list(p.vertices) for p in mesh.polygons], self.faces)
+            edges = {tuple(sorted(e.vertices)) for e in mesh.edges}
+            self.assertEqual(edges, {(0, 1), (1, 2), (0, 2), (2, 3), (0, 3), (1, 4)})
+            self.assertFalse(mesh.validate())
+        finally:
+            bpy.data.meshes.remove(mesh)
@@ -0,0 +1,65 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils import sv_noise_np
+from sverchok.utils.sv_seed_funcs import get_offset
+from sverchok.nodes.vector.noise_mk3 import numpy_mathutils_noise
+
+
+class NumpyNoiseTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.points = np.random.default_rng(0).uniform(-5, 5, (1000, 3))
+
+    def test_range(self):
+        for noise_type in ['PERLIN_ORIGINAL', 'PERLIN_NEW', 'CELLNOISE', 'VORONOI_F2F1', 'VORONOI_CRACKLE']:
+            with self.subTest(noise_type=noise_type):
+                values = sv_noise_np.noise(self.points, noise_type)
+                self.assertTrue((np.abs(values) <= 1.1).all())
+
+    def test_voronoi_sorted(self):
+        distances = sv_noise_np.voronoi(self.points)
+        self.assertEqual(distances.shape, (4, 1000))
+        self.assertTrue((np.diff(distances, axis=0) >= 0).all())
+        # F1 is not greater than distance to the feature point of the own cell
+        self.assertTrue((distances[0] <= np.sqrt(3)).all())
+
+    def test_continuity(self):
+        for noise_type in ['PERLIN_ORIGINAL', 'PERLIN_NEW', 'VORONOI_F1', 'VORONOI_F3']:
+            with self.subTest(noise_type=noise_type):
+                values = sv_noise_np.noise(self.points, noise_type)
+                shifted = sv_noise_np.noise(self.points + 1e-6, noise_type)
+                self.assertTrue((np.abs(values - shifted) < 1e-4).all())
+
+    def test_vector_shape(self):
+        grid = self.points.reshape((10, 100, 3))
+        vectors = sv_noise_np.noise_vector(grid, 'PERLIN_NEW', seed=1)
+        self.assertEqual(vectors.shape, (10, 100, 3))
+        self.assert_numpy_arrays_equal(vectors[2, 5], sv_noise_np.noise_vector(grid[2, 5], 'PERLIN_NEW', seed=1))
+
+    def test_seed(self):
+        noise1 = sv_noise_np.noise_vector(self.points, 'PERLIN_NEW', seed=1)
+        noise2 = sv_noise_np.noise_vector(self.points, 'PERLIN_NEW', seed=2)
+        self.assert_numpy_arrays_equal(noise1, sv_noise_np.noise_vector(self.points, 'PERLIN_NEW', seed=1))
+        self.assertFalse(np.allclose(noise1, noise2))
+
+    def test_seed_offsets(self):
+        # the same offsets as in other noise nodes
+        offsets = sv_noise_np.seed_offsets(5)
+        self.assert_numpy_arrays_equal(offsets[0], np.array(get_offset(5)))
+        self.assert_numpy_arrays_equal(offsets[2], np.array(get_offset(7)))
+
+    def test_empty(self):
+        self.assertEqual(sv_noise_np.noise_vector([], 'PERLIN_NEW', seed=1).shape, (0, 3))
+        for out_mode in ['VECTOR', 'SCALAR']:
+            out = []
+            numpy_mathutils_noise([], out, out_mode, 'PERLIN_NEW', 1, output_numpy=False)
+            self.assertEqual(out, [[]])
+
+    def test_fractal_octaves(self):
+        args = (self.points, 0.5, 2.0)
+        one = sv_noise_np.fractal(*args, 1, 'PERLIN_NEW')
+        self.assert_numpy_arrays_equal(one, sv_noise_np.noise(self.points, 'PERLIN_NEW'))
+        half = sv_noise_np.fractal(*args, 1.5, 'PERLIN_NEW')
+        two = sv_noise_np.fractal(*args, 2, 'PERLIN_NEW')
+        self.assert_numpy_arrays_equal(half, (one + two) / 2, precision=8)
@@ -1,10 +1,12 @@
 import numpy as np
 import unittest
 from math import pi
+from time import perf_counter
 
 from mathutils import Matrix
 
-from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.utils.testing import SverchokTestCase, requires, manual_only
+from sverchok.utils.logging import info
 from sverchok.utils.geom import circle_by_three_points
 from sverchok.utils.nurbs_common import SvNurbsMaths, elevate_bezier_degree, from_homogenous
 from sverchok.utils.curve import knotvector as sv_knotvector
@@ -755,6 +757,74 @@ class OtherNurbsTests(SverchokTestCase):
         endpoint = nurbs.evaluate(u_max)
         self.assert_sverchok_data_equal(endpoint.tolist(), pt3, precision=6)
 
+class SparseNurbsTests(SverchokTestCase):
+    """Evaluation via knot spans should give the same results as evaluation
+    of all basis functions"""
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(0)
+        self.degree = 3
+        self.control_points = rng.uniform(-1, 1, (7, 3))
+        self.weights = rng.uniform(0.5, 2, 7)
+        self.knotvector = np.array([0, 0, 0, 0, 0.2, 0.5, 0.5, 1, 1, 1, 1])
+        self.ts = np.concatenate([np.linspace(0, 1, 20), [0.2, 0.5]])
+
+    def test_span_derivatives(self):
+        basis = SvNurbsBasisFunctions(self.knotvector)
+        k = len(self.control_points)
+        indexes, ders = basis.span_derivatives(self.degree, k, self.ts, 3)
+        for order in range(4):
+            dense = np.array([basis.derivative(i, self.degree, order)(self.ts) for i in range(k)]).T
+            sparse = np.zeros_like(dense)
+            np.put_along_axis(sparse, indexes, ders[order], axis=1)
+            self.assert_numpy_arrays_equal(sparse, dense, precision=8)
+
+    def test_out_of_spans(self):
+        knotvector = np.arange(11.0)  # unclamped, spans are defined in [3, 7)
+        basis = SvNurbsBasisFunctions(knotvector)
+        self.assertIsNotNone(basis.find_spans(3, 7, np.array([3, 5, 6.9])))
+        self.assertIsNone(basis.find_spans(3, 7, np.array([5, 7])))
+        self.assertIsNone(basis.find_spans(3, 7, np.array([1, 5])))
+
+    def test_curve_fractions(self):
+        curve = SvNativeNurbsCurve(self.degree, self.knotvector, self.control_points, self.weights)
+        for order, (numerator, denominator) in enumerate(curve.fractions(3, self.ts)):
+            expected_numerator, expected_denominator = curve._dense_fraction(order, self.ts)
+            self.assert_numpy_arrays_equal(numerator, expected_numerator, precision=6)
+            self.assert_numpy_arrays_equal(denominator, expected_denominator, precision=6)
+
+    def test_surface_fraction(self):
+        rng = np.random.default_rng(0)
+        control_points = rng.uniform(-1, 1, (7, 4, 3))
+        weights = rng.uniform(0.5, 2, (7, 4))
+        knotvector_v = sv_knotvector.generate(2, 4)
+        surface = SvNativeNurbsSurface(self.degree, 2, self.knotvector, knotvector_v, control_points, weights)
+        dense = SvNativeNurbsSurface(self.degree, 2, self.knotvector, knotvector_v, control_points, weights)
+        dense.basis_u.span_derivatives = lambda *args: None
+        us = self.ts
+        vs = np.linspace(1, 0, len(us))
+        for orders in [(0, 0), (1, 0), (0, 1), (1, 1), (2, 0), (0, 2)]:
+            numerator, denominator = surface.fraction(*orders, us, vs)
+            expected_numerator, expected_denominator = dense.fraction(*orders, us, vs)
+            self.assert_numpy_arrays_equal(numerator, expected_numerator, precision=6)
+            self.assert_numpy_arrays_equal(denominator, expected_denominator, precision=6)
+
+    @manual_only
+    def test_performance(self):
+        rng = np.random.default_rng(0)
+        k = 300
+        curve = SvNativeNurbsCurve(3, sv_knotvector.generate(3, k), rng.uniform(-1, 1, (k, 3)))
+        ts = np.linspace(0, 1, 5000)
+        start = perf_counter()
+        curve._dense_fraction(0, ts)
+        dense_time = perf_counter() - start
+        start = perf_counter()
+        curve.fraction(0, ts)
+        sparse_time = perf_counter() - start
+        info(f"{k} control points, {len(ts)} parameters: "
+             f"dense {dense_time * 1000:.1f}ms, sparse {sparse_time * 1000:.1f}ms")
+        self.assertLess(sparse_time, dense_time)
+
 class KnotvectorTests(SverchokTestCase):
     def test_generate_1(self):
         knotvector = sv_knotvector.generate(degree=1, num_ctrlpts=2, clamped=True)
@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.parameter_sweep import pack_output, unpack_output, sweep
+
+
+class PackOutputTest(SverchokTestCase):
+    def _round_trip(self, values):
+        store = dict()
+        pack_output('Node.Socket', values, store)
+        return store, unpack_output(store, 'Node.Socket')
+
+    def test_same_shape(self):
+        values = [[[(0, 0, 0), (1, 1, 1)]], [[(2, 2, 2), (3, 3, 3)]]]
+        store, result = self._round_trip(values)
+        self.assertEqual(store['output/Node.Socket'].shape, (2, 1, 2, 3))
+        self.assert_numpy_arrays_equal(np.array(result), np.array(values))
+
+    def test_different_number_of_vertices(self):
+        values = [[[(0, 0, 0)], [(1, 1, 1), (2, 2, 2)]], None]
+        store, result = self._round_trip(values)
+        self.assertEqual(store['output/Node.Socket'].shape, (3, 3))
+        self.assertEqual(len(result[0]), 2)
+        self.assert_numpy_arrays_equal(result[0][1], np.array(values[0][1]))
+        self.assertEqual(result[1], [])
+
+    def test_ragged_objects(self):
+        values = [[[[0, 1, 2], [0, 1, 2, 3]]], [[[0, 1, 2]]]]
+        store, result = self._round_trip(values)
+        self.assertEqual(store['output/Node.Socket'].dtype, object)
+        self.assertEqual(result, values)
+
+
+class SweepTest(SverchokTestCase):
+    def test_failed_worker(self):
+        failed = Mock(**{'wait.return_value': 1, 'poll.return_value': 1})
+        running = Mock(**{'wait.return_value': 0, 'poll.return_value': None})
+        with patch('sverchok.utils.parameter_sweep.bpy'), \
+                patch('sverchok.utils.parameter_sweep.subprocess.Popen', side_effect=[failed, running]):
+            with self.assertRaises(RuntimeError):
+                sweep(SimpleNamespace(name="Tree"), [("Node", "prop", [1, 2])], [], "result.npz", processes=2)
+        failed.terminate.assert_not_called()
+        running.terminate.assert_called_once()
+        running.wait.assert_called_once()
@@ -0,0 +1,45 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.pulga_recorder import PulgaRecorder, recorded_iterations
+
+
+class PulgaRecorderTests(SverchokTestCase):
+    def _record(self, recorder, n_frames):
+        verts = np.zeros((4, 3))
+        for i in range(n_frames):
+            # the system changes its arrays in place
+            verts += 1
+            recorder.record(verts, np.full(4, i, dtype=np.float64), verts * 2, np.array([[]]))
+
+    def test_recorded_iterations(self):
+        self.assertEqual(recorded_iterations([10]), [9])
+        self.assertEqual(recorded_iterations([10, 5, 5]), [4, 9])
+        self.assertEqual(recorded_iterations([10], record_step=3), [2, 5, 8, 9])
+
+    def test_frames(self):
+        recorder = PulgaRecorder(3)
+        self._record(recorder, 3)
+        out_lists = [[], [], [], []]
+        recorder.output(out_lists, True)
+        verts_out, rads_out, velocity_out, reactions_out = out_lists
+        self.assertEqual([v[0, 0] for v in verts_out], [1, 2, 3])
+        self.assertEqual([r[0] for r in rads_out], [0, 1, 2])
+        self.assert_numpy_arrays_equal(velocity_out[2], np.full((4, 3), 6.0))
+        self.assertEqual(len(reactions_out), 3)
+
+    def test_ring_buffer(self):
+        recorder = PulgaRecorder(5, max_frames=2)
+        self._record(recorder, 5)
+        out_lists = [[], [], [], []]
+        recorder.output(out_lists, False)
+        self.assertEqual([r[0] for r in out_lists[1]], [3, 4])
+        self.assertEqual(out_lists[3], [[[]], [[]]])
+
+    def test_on_disk(self):
+        recorder = PulgaRecorder(4, on_disk=True)
+        self._record(recorder, 4)
+        self.assertIsInstance(recorder.verts, np.memmap)
+        out_lists = [[], [], [], []]
+        recorder.output(out_lists, True)
+        self.assertEqual([v[3, 2] for v in out_lists[0]], [1, 2, 3, 4])
@@ -0,0 +1,52 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.relax_mesh import MeshTopology, lloyd_relax, edges_relax, faces_relax, NONE, NORMAL, LINEAR
+
+class RelaxMeshTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(0)
+        n = 6
+        self.verts = [(x + rng.uniform(-0.3, 0.3), y + rng.uniform(-0.3, 0.3), 0.0) for y in range(n) for x in range(n)]
+        self.faces = [(y*n + x, y*n + x + 1, (y+1)*n + x + 1, (y+1)*n + x) for y in range(n-1) for x in range(n-1)]
+        self.boundary = [i for i in range(n*n) if i % n in (0, n-1) or i // n in (0, n-1)]
+
+    def test_boundary(self):
+        topology = MeshTopology(len(self.verts), self.faces)
+        self.assertEqual(np.flatnonzero(topology.is_boundary).tolist(), self.boundary)
+
+    def test_vertex_normals(self):
+        verts = np.array([(x, y, z) for z in (0, 1) for y in (0, 1) for x in (0, 1)], dtype=np.float64)
+        faces = [(0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4), (2, 6, 7, 3), (0, 4, 6, 2), (1, 3, 7, 5)]
+        normals = MeshTopology(8, faces).vert_normals(verts)
+        expected = (verts - 0.5) / np.linalg.norm(verts - 0.5, axis=1)[np.newaxis].T
+        self.assert_numpy_arrays_equal(normals, expected, precision=8)
+
+    def test_lloyd(self):
+        verts = np.array(lloyd_relax(self.verts, self.faces, 3, method=NONE))
+        self.assert_numpy_arrays_equal(verts[self.boundary], np.array(self.verts)[self.boundary])
+        # vertices of a planar mesh stay in its plane
+        for method in [NORMAL, LINEAR]:
+            relaxed = np.array(lloyd_relax(self.verts, self.faces, 3, method=method))
+            self.assert_numpy_arrays_equal(relaxed, verts, precision=8)
+
+    def test_lloyd_step(self):
+        # one step moves a vertex to the mean of centers of its faces
+        verts = np.array(lloyd_relax(self.verts, self.faces, 1, method=NONE))
+        src = np.array(self.verts)
+        centers = [src[list(face)].mean(axis=0) for face in self.faces if 7 in face]
+        self.assert_numpy_arrays_equal(verts[7], np.mean(centers, axis=0), precision=8)
+
+    def test_edges_relax(self):
+        src = np.array(self.verts)
+        verts = np.array(edges_relax(self.verts, [], self.faces, 10, 0.5, method=NORMAL, use_axes={0}))
+        self.assert_numpy_arrays_equal(verts[:,1:], src[:,1:])
+        self.assertFalse(np.allclose(verts, src))
+
+    def test_faces_relax(self):
+        def area_deviation(verts):
+            areas = [np.linalg.norm(np.cross(verts[c] - verts[a], verts[d] - verts[b])) / 2 for a, b, c, d in self.faces]
+            return np.std(areas)
+        verts = np.array(faces_relax(self.verts, [], self.faces, 10, 0.5, method=NONE))
+        self.assertLess(area_deviation(verts), area_deviation(np.array(self.verts)))
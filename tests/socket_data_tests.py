@@ -0,0 +1,217 @@
+import tracemalloc
+from time import perf_counter
+from types import SimpleNamespace
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, manual_only
+from sverchok.utils.logging import info
+from sverchok.utils.curve.core import SvLambdaCurve
+from sverchok.utils.curve.primitives import SvCircle
+from sverchok.core.socket_data import sv_deep_copy, cow_copy, CowList, LimitedMemory, estimate_size, \
+    data_fingerprint, sv_set_socket, sv_update_fingerprint, sv_forget_socket
+
+
+class FingerprintTest(SverchokTestCase):
+    def test_equal_data(self):
+        self.assertEqual(data_fingerprint([[(0.0, 1.0, 2.0)], [(3.0, 4.0, 5.0)]]),
+                         data_fingerprint([[(0.0, 1.0, 2.0)], [(3.0, 4.0, 5.0)]]))
+        self.assertEqual(data_fingerprint([np.arange(5)]), data_fingerprint([np.arange(5)]))
+
+    def test_different_data(self):
+        pairs = [
+            ([[-1]], [[-2]]),  # equal Python hashes
+            ([[(0.0, -1)]], [[(0.0, -2)]]),
+            ([[1, 2]], [[1.0, 2.0]]),
+            ([[1, 2]], [[True, 2]]),
+            ([[(1, 2)]], [[[1, 2]]]),
+            ([[1], [2]], [[1, 2]]),
+            ([np.arange(4)], [np.arange(4).reshape((2, 2))]),
+            ([np.arange(4)], [np.arange(4, dtype=np.float64)]),
+        ]
+        for data_1, data_2 in pairs:
+            with self.subTest(data=data_1):
+                self.assertNotEqual(data_fingerprint(data_1), data_fingerprint(data_2))
+
+    def test_not_comparable(self):
+        self.assertIsNone(data_fingerprint([[{'a': 1}]]))
+        self.assertIsNone(data_fingerprint([[object()]]))
+
+    def test_curves(self):
+        def circle(radius):
+            return SvCircle(center=np.zeros(3), normal=np.array([0.0, 0.0, 1.0]),
+                            vectorx=np.array([radius, 0.0, 0.0]))
+        self.assertEqual(data_fingerprint([[circle(1.0)]]), data_fingerprint([[circle(1.0)]]))
+        self.assertNotEqual(data_fingerprint([[circle(1.0)]]), data_fingerprint([[circle(2.0)]]))
+        self.assertNotEqual(data_fingerprint([[circle(1.0)]]), data_fingerprint([circle(1.0)]))
+        self.assertIsNone(data_fingerprint([[SvLambdaCurve(lambda t: (t, 0, 0))]]))
+
+    def test_update_fingerprint(self):
+        socket = SimpleNamespace(socket_id='fingerprint_test_socket')
+        try:
+            sv_set_socket(socket, [[-1]])
+            self.assertTrue(sv_update_fingerprint(socket))
+            sv_set_socket(socket, [[-1]])
+            self.assertFalse(sv_update_fingerprint(socket))
+            sv_set_socket(socket, [[-2]])
+            self.assertTrue(sv_update_fingerprint(socket))
+            sv_set_socket(socket, [[-2.0]])
+            self.assertTrue(sv_update_fingerprint(socket))
+        finally:
+            sv_forget_socket(socket)
+
+
+class LimitedMemoryTest(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.values = {f"sock_{i}": [[float(i)] * 1000] for i in range(4)}
+        self.value_size = estimate_size(self.values["sock_0"])
+
+    def tearDown(self):
+        super().tearDown()
+        self.memory.clear()
+
+    def test_spill_and_load(self):
+        self.memory = LimitedMemory(dict(), int(self.value_size * 2.5))
+        for key, value in self.values.items():
+            self.memory[key] = value
+        self.assertEqual(self.memory.spilled_number, 2)
+        self.assertLessEqual(self.memory.size, self.memory.limit)
+        self.assertEqual(len(self.memory), 4)
+        # the oldest values are moved first
+        self.assertNotIn("sock_0", self.memory.data)
+        self.assertNotIn("sock_1", self.memory.data)
+        self.assertEqual(self.memory["sock_0"], self.values["sock_0"])
+        self.assertIn("sock_0", self.memory.data)
+        self.assertEqual(self.memory.spilled_number, 2)
+        self.assertEqual({k: self.memory[k] for k in list(self.memory)}, self.values)
+
+    def test_last_used_is_kept(self):
+        self.memory = LimitedMemory(dict(), self.value_size // 2)
+        self.memory["sock_0"] = self.values["sock_0"]
+        self.memory["sock_1"] = self.values["sock_1"]
+        self.assertEqual(list(self.memory.data), ["sock_1"])
+        self.memory["sock_0"]
+        self.assertEqual(list(self.memory.data), ["sock_0"])
+
+    def test_shared_object(self):
+        self.memory = LimitedMemory(dict(), int(self.value_size * 1.5))
+        shared = self.values["sock_0"]
+        self.memory["out"] = shared
+        self.memory["in"] = shared
+        self.assertEqual(self.memory.size, self.value_size)
+        self.memory["other"] = self.values["sock_1"]
+        # both sockets are moved to a single file
+        self.assertEqual(self.memory.spilled_number, 2)
+        self.assertEqual(len(set(self.memory._spilled.values())), 1)
+        self.assertIs(self.memory["out"], self.memory["in"])
+        self.assertEqual(list(self.memory._spilled), ["other"])
+        del self.memory["out"]
+        del self.memory["in"]
+        self.assertEqual(self.memory.size, 0)
+
+    def test_unpicklable(self):
+        self.memory = LimitedMemory(dict(), self.value_size // 2)
+        self.memory["lambda"] = [[lambda: 1] * 1000]
+        self.memory["sock_0"] = self.values["sock_0"]
+        self.memory["sock_1"] = self.values["sock_1"]
+        self.assertIn("lambda", self.memory.data)
+        self.assertIn("sock_0", self.memory._spilled)
+
+
+class CopyOnWriteTest(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.data = [[[0, 1, 2], [2, 3, 4]], [[5, 6, 7]]]
+        self.expected = [[[0, 1, 2], [2, 3, 4]], [[5, 6, 7]]]
+
+    def test_equal_to_source(self):
+        self.assertEqual(cow_copy(self.data), self.expected)
+
+    def test_change_by_index(self):
+        data = cow_copy(self.data)
+        data[0][0].append(9)
+        data[1][0][0] = 10
+        self.assertEqual(data, [[[0, 1, 2, 9], [2, 3, 4]], [[10, 6, 7]]])
+        self.assertEqual(self.data, self.expected)
+
+    def test_change_by_iteration(self):
+        data = cow_copy(self.data)
+        for obj in data:
+            for face in obj:
+                face.reverse()
+        self.assertEqual(data, [[[2, 1, 0], [4, 3, 2]], [[7, 6, 5]]])
+        self.assertEqual(self.data, self.expected)
+
+    def test_change_structure(self):
+        data = cow_copy(self.data)
+        data.insert(0, [[1]])
+        data[1].pop()
+        data[1][0].append(3)
+        self.assertEqual(data, [[[1]], [[0, 1, 2, 3]], [[5, 6, 7]]])
+        self.assertEqual(self.data, self.expected)
+
+    def test_copy_of_copy(self):
+        data = cow_copy(self.data)
+        data[0][0].append(9)
+        data_2 = cow_copy(data)
+        data_2[0][0].append(10)
+        self.assertEqual(data[0][0], [0, 1, 2, 9])
+        self.assertEqual(data_2[0][0], [0, 1, 2, 9, 10])
+        self.assertEqual(self.data, self.expected)
+
+    def test_concatenation(self):
+        data = [[9]] + cow_copy(self.data)[0]
+        data[1].append(9)
+        data = cow_copy(self.data) + [[[9]]]
+        data[0][0].append(9)
+        self.assertEqual(self.data, self.expected)
+
+    def test_vertices_are_not_copied(self):
+        verts = [[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)]]
+        data = cow_copy(verts)
+        self.assertIsInstance(data, CowList)
+        self.assertIsNot(data[0], verts[0])
+        self.assertIs(data[0][0], verts[0][0])
+
+
+class DeepCopyTest(SverchokTestCase):
+    def test_mixed_items(self):
+        data = [[(0.0, 1.0), [2.0, 3.0]]]
+        copied = sv_deep_copy(data)
+        copied[0][1].append(4.0)
+        self.assertEqual(data, [[(0.0, 1.0), [2.0, 3.0]]])
+        self.assertEqual(sv_deep_copy([[(0.0, 1.0), ([2.0],)]]), [[(0.0, 1.0), [[2.0]]]])
+
+    def test_vertices(self):
+        verts = [[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)]]
+        copied = sv_deep_copy(verts)
+        self.assertIsNot(copied[0], verts[0])
+        self.assertIs(copied[0][1], verts[0][1])
+
+
+class CopyOnWriteBenchmark(SverchokTestCase):
+    """Compares copy-on-write and deep copy of socket data. It imitates
+    a node output connected to several nodes which read only a part of data"""
+
+    @staticmethod
+    def _measure(copy_func, data, readers):
+        tracemalloc.start()
+        start = perf_counter()
+        for _ in range(readers):
+            copied = copy_func(data)
+            copied[0][0][0]  # read single face
+        duration = perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return duration, peak
+
+    @manual_only
+    def test_fan_out(self):
+        faces = [[[i, i + 1, i + 2, i + 3] for i in range(20_000)] for _ in range(10)]
+        deep_time, deep_peak = self._measure(sv_deep_copy, faces, readers=10)
+        cow_time, cow_peak = self._measure(cow_copy, faces, readers=10)
+        info(f"Deep copy: {deep_time:.3f}s, peak {deep_peak / 2**20:.1f}MB")
+        info(f"Copy-on-write: {cow_time:.3f}s, peak {cow_peak / 2**20:.1f}MB")
+        self.assertLess(cow_peak, deep_peak)
+        self.assertLess(cow_time, deep_time)
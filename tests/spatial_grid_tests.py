@@ -0,0 +1,91 @@
+from time import perf_counter
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, manual_only
+from sverchok.utils.logging import info
+from sverchok.utils.spatial_grid import all_pairs, close_pairs
+from sverchok.utils.pulga_physics_core import self_react
+
+
+class ClosePairsTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.rng = np.random.default_rng(0)
+
+    def _check(self, verts, radius):
+        pairs = close_pairs(verts, radius)
+        expected = all_pairs(len(verts))
+        dist = np.linalg.norm(verts[expected[:, 0]] - verts[expected[:, 1]], axis=1)
+        expected = expected[dist < radius]
+        self.assertEqual(len(pairs), len(expected))
+        self.assertEqual(set(map(tuple, pairs)), set(map(tuple, expected)))
+
+    def test_random(self):
+        self._check(self.rng.uniform(0, 1, (500, 3)), 0.1)
+
+    def test_coincident(self):
+        verts = self.rng.uniform(0, 1, (100, 3))
+        verts[:10] = verts[0]
+        self._check(verts, 0.05)
+
+    def test_big_radius(self):
+        self._check(self.rng.uniform(0, 1, (100, 3)), 10.0)
+
+    def test_sparse(self):
+        verts = self.rng.uniform(0, 1e6, (200, 3))
+        verts[:150] = self.rng.uniform(0, 1e-3, (150, 3))
+        self._check(verts, 1e-4)
+
+    def test_empty(self):
+        self.assertEqual(close_pairs(np.zeros((1, 3)), 1.0).shape, (0, 2))
+        self.assertEqual(close_pairs(self.rng.uniform(0, 1, (10, 3)), 0.0).shape, (0, 2))
+
+
+class PulgaStub:
+    def __init__(self, verts, rads):
+        self.verts = verts
+        self.rads = rads
+        self.v_len = len(verts)
+        self.r = np.zeros((self.v_len, 3))
+        self.params = {}
+
+
+class SelfCollisionTests(SverchokTestCase):
+    def test_collision_forces(self):
+        rng = np.random.default_rng(0)
+        verts = rng.uniform(0, 2, (300, 3))
+        rads = rng.uniform(0.05, 0.15, 300)
+        collision = np.array([0.5])
+        ps = PulgaStub(verts, rads)
+        self_react([ps, collision, None, [True, False, False], [], []])
+
+        # forces from all pairs, accumulated in a dense matrix
+        indexes = all_pairs(300)
+        dif_v = verts[indexes[:, 0]] - verts[indexes[:, 1]]
+        dist = np.linalg.norm(dif_v, axis=1)
+        mask = rads[indexes[:, 0]] + rads[indexes[:, 1]] > dist
+        id0, id1 = indexes[mask, 0], indexes[mask, 1]
+        force = dif_v[mask] / dist[mask, np.newaxis] * (dist[mask] - rads[id0] - rads[id1])[:, np.newaxis] * 0.5
+        result = np.zeros((300, 300, 3))
+        result[id0, id1] = -force
+        result[id1, id0] = force
+        self.assert_numpy_arrays_equal(ps.r, result.sum(axis=1), precision=10)
+
+
+class SelfCollisionBenchmark(SverchokTestCase):
+    """Time of one step of collisions of particles with constant density"""
+
+    @manual_only
+    def test_scaling(self):
+        rng = np.random.default_rng(0)
+        times = []
+        for n in [1_000, 10_000, 100_000]:
+            verts = rng.uniform(0, n ** (1/3), (n, 3))
+            ps = PulgaStub(verts, np.full(n, 0.5))
+            start = perf_counter()
+            self_react([ps, np.array([0.5]), None, [True, False, False], [], []])
+            times.append(perf_counter() - start)
+            info(f"{n} particles: {times[-1]:.3f}s")
+        # quadratic time would be 10000 times slower
+        self.assertLess(times[-1], 1000 * times[0])
@@ -0,0 +1,71 @@
+import numpy as np
+from math import pi
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.curve import knotvector as sv_knotvector
+from sverchok.utils.curve.primitives import SvCircle
+from sverchok.utils.curve.nurbs import SvNativeNurbsCurve
+from sverchok.utils.surface.nurbs import SvNativeNurbsSurface
+from sverchok.utils.surface.algorithms import SvRevolutionSurface, SvCurveLerpSurface, SvExtrudeCurveCurveSurface
+from sverchok.utils.surface.coons import SvCoonsSurface
+
+class SurfaceDerivativesTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.rng = np.random.default_rng(0)
+        self.us = self.rng.uniform(0.1, 0.9, 20)
+        self.vs = self.rng.uniform(0.1, 0.9, 20)
+
+    def _curve(self):
+        control_points = self.rng.uniform(-1, 1, (6, 3))
+        weights = self.rng.uniform(0.5, 2, 6)
+        return SvNativeNurbsCurve(3, sv_knotvector.generate(3, 6), control_points, weights)
+
+    def _check_derivatives(self, surface):
+        """Compare exact derivatives with central finite differences"""
+        us, vs, h = self.us, self.vs, 1e-4
+        evaluate = surface.evaluate_array
+        points = evaluate(us, vs)
+        u_plus, u_minus = evaluate(us + h, vs), evaluate(us - h, vs)
+        v_plus, v_minus = evaluate(us, vs + h), evaluate(us, vs - h)
+        uv_diff = evaluate(us + h, vs + h) - evaluate(us + h, vs - h) \
+                  - evaluate(us - h, vs + h) + evaluate(us - h, vs - h)
+
+        data = surface.derivatives_array(us, vs, 2)
+        self.assert_numpy_arrays_equal(data.points, points, precision=8)
+        self.assert_numpy_arrays_equal(data.du, (u_plus - u_minus) / (2*h), precision=4)
+        self.assert_numpy_arrays_equal(data.dv, (v_plus - v_minus) / (2*h), precision=4)
+        self.assert_numpy_arrays_equal(data.duu, (u_plus - 2*points + u_minus) / h**2, precision=3)
+        self.assert_numpy_arrays_equal(data.dvv, (v_plus - 2*points + v_minus) / h**2, precision=3)
+        self.assert_numpy_arrays_equal(data.duv, uv_diff / (4*h*h), precision=3)
+
+    def test_nurbs(self):
+        control_points = self.rng.uniform(-1, 1, (6, 5, 3))
+        weights = self.rng.uniform(0.5, 2, (6, 5))
+        surface = SvNativeNurbsSurface(3, 2, sv_knotvector.generate(3, 6), sv_knotvector.generate(2, 5),
+                                       control_points, weights)
+        self._check_derivatives(surface)
+
+    def test_ruled(self):
+        self._check_derivatives(SvCurveLerpSurface(self._curve(), self._curve()))
+
+    def test_extrusion(self):
+        self._check_derivatives(SvExtrudeCurveCurveSurface(self._curve(), self._curve()))
+
+    def test_revolution(self):
+        surface = SvRevolutionSurface(self._curve(), np.array([0.1, 0.2, 0.3]), np.array([0.3, 1.0, 2.0]))
+        self._check_derivatives(surface)
+
+    def test_coons(self):
+        self._check_derivatives(SvCoonsSurface(self._curve(), self._curve(), self._curve(), self._curve()))
+
+    def test_sphere_curvature(self):
+        radius = 2.0
+        meridian = SvCircle(center=np.zeros(3), normal=np.array([0.0, 1.0, 0.0]),
+                            vectorx=np.array([0.0, 0.0, radius]))
+        meridian.u_bounds = (0.2, pi - 0.2)
+        sphere = SvRevolutionSurface(meridian, np.zeros(3), np.array([0.0, 0.0, 1.0]))
+        us = np.linspace(0.3, pi - 0.3, 10)
+        vs = np.linspace(0.0, 2*pi, 10)
+        gauss = sphere.gauss_curvature_array(us, vs)
+        self.assert_numpy_arrays_equal(gauss, np.full(10, 1 / radius**2), precision=4)
@@ -0,0 +1,37 @@
+import threading
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils import tracing
+
+
+class TracerTest(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.names = ("Tree", "Node")
+        self.tracer = tracing.Tracer()
+
+    def test_histogram(self):
+        self.tracer.add(tracing.NODE, *self.names, 0, 0.002)
+        self.tracer.add(tracing.NODE, *self.names, 1, 1.05)
+        self.tracer.add(tracing.CACHE_HIT, *self.names, 2)
+        stat = self.tracer.histogram()[self.names]
+        self.assertEqual(stat['calls'], 2)
+        self.assertEqual(stat['hits'], 1)
+        self.assertAlmostEqual(stat['max_ms'], 50, places=3)
+        self.assertEqual(sum(stat['bins']), 2)
+
+    def test_chrome_trace(self):
+        self.tracer.add(tracing.NODE, *self.names, 0, 0.002)
+        self.tracer.add(tracing.SKIPPED, *self.names, 1)
+        node_event, skip_event = self.tracer.chrome_trace()['traceEvents']
+        self.assertEqual(node_event['ph'], 'X')
+        self.assertEqual(node_event['name'], "Node")
+        self.assertEqual(node_event['args']['tree'], "Tree")
+        self.assertEqual(skip_event['ph'], 'i')
+
+    def test_thread_id(self):
+        self.tracer.add(tracing.NODE, *self.names, 0, 0.002)
+        self.tracer.add(tracing.NODE, *self.names, 1, 1.05, tid=42)
+        main_event, worker_event = self.tracer.chrome_trace()['traceEvents']
+        self.assertEqual(main_event['tid'], threading.get_ident())
+        self.assertEqual(worker_event['tid'], 42)
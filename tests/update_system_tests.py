@@ -1,7 +1,13 @@
+import threading
+from time import sleep
 from typing import Iterable
 
-from sverchok.utils.testing import SverchokTestCase
-from sverchok.core.update_system import SearchTree
+import sverchok.core.tasks as ts
+from sverchok.utils.testing import SverchokTestCase, EmptyTreeTestCase, create_node, create_node_tree, \
+    remove_node_tree
+from sverchok.core.update_system import SearchTree, UpdateTree, ERROR_KEY
+from sverchok.core.headless import evaluate_tree
+from sverchok.utils import tracing
 
 
 class TreeCleaningTest(SverchokTestCase):
@@ -76,6 +82,227 @@ class TreeCleaningTest(SverchokTestCase):
         self.assertSetEqual(f_ns, t_ns, msg=msg)
 
 
+class IncrementalTopologyTest(EmptyTreeTestCase):
+    def test_add_and_remove_links(self):
+        ngon = create_node("SvNGonNode")
+        apply_1 = create_node("MatrixApplyNode")
+        apply_2 = create_node("MatrixApplyNode")
+        self.tree.links.new(ngon.outputs['Vertices'], apply_1.inputs['Vectors'])
+        up_tree = UpdateTree.get(self.tree, refresh_tree=True)
+
+        link = self.tree.links.new(apply_1.outputs['Vectors'], apply_2.inputs['Vectors'])
+        up_tree.is_updated = False
+        up_tree = UpdateTree.get(self.tree, refresh_tree=True)
+        self.assertEqual(up_tree._from_nodes, SearchTree(self.tree)._from_nodes)
+
+        self.tree.links.remove(link)
+        self.tree.nodes.remove(ngon)
+        up_tree.is_updated = False
+        up_tree = UpdateTree.get(self.tree, refresh_tree=True)
+        search_tree = SearchTree(self.tree)
+        self.assertEqual(up_tree._from_nodes, search_tree._from_nodes)
+        self.assertEqual(up_tree._to_nodes, search_tree._to_nodes)
+        self.assertEqual(up_tree._links, search_tree._links)
+
+    def test_remove_linked_node(self):
+        ngon = create_node("SvNGonNode")
+        apply_1 = create_node("MatrixApplyNode")
+        apply_2 = create_node("MatrixApplyNode")
+        apply_3 = create_node("MatrixApplyNode")
+        self.tree.links.new(ngon.outputs['Vertices'], apply_1.inputs['Vectors'])
+        self.tree.links.new(apply_1.outputs['Vectors'], apply_2.inputs['Vectors'])
+        self.tree.links.new(apply_1.outputs['Vectors'], apply_3.inputs['Vectors'])
+        up_tree = UpdateTree.get(self.tree, refresh_tree=True)
+
+        self.tree.nodes.remove(apply_1)
+        up_tree.is_updated = False
+        up_tree = UpdateTree.get(self.tree, refresh_tree=True)
+        search_tree = SearchTree(self.tree)
+        self.assertEqual(up_tree._from_nodes, search_tree._from_nodes)
+        self.assertEqual(up_tree._to_nodes, search_tree._to_nodes)
+        self.assertEqual(up_tree._from_sock, search_tree._from_sock)
+        self.assertEqual(up_tree._to_socks, search_tree._to_socks)
+        self.assertEqual(up_tree._links, search_tree._links)
+
+
+    def test_changed_nodes(self):
+        ngon = create_node("SvNGonNode")
+        apply_1 = create_node("MatrixApplyNode")
+        apply_2 = create_node("MatrixApplyNode")
+        apply_3 = create_node("MatrixApplyNode")
+        link = self.tree.links.new(ngon.outputs['Vertices'], apply_1.inputs['Vectors'])
+        up_tree = UpdateTree.get(self.tree, refresh_tree=True)
+        links = self.tree.links
+
+        # new consumer of already calculated output
+        changed = self._changed_nodes(
+            up_tree, lambda: links.new(ngon.outputs['Vertices'], apply_2.inputs['Vectors']))
+        self.assertEqual(changed, {apply_2})
+
+        changed = self._changed_nodes(up_tree, lambda: links.remove(link))
+        self.assertEqual(changed, {apply_1})
+
+        def relink():
+            links.new(apply_2.outputs['Vectors'], apply_3.inputs['Vectors'])
+            links.new(ngon.outputs['Vertices'], apply_3.inputs['Vectors'])
+        self.assertEqual(self._changed_nodes(up_tree, relink), {apply_3})
+
+        # output which was not connected
+        changed = self._changed_nodes(
+            up_tree, lambda: links.new(apply_3.outputs['Vectors'], apply_1.inputs['Vectors']))
+        self.assertEqual(changed, {apply_3})
+
+    def _changed_nodes(self, up_tree, change):
+        """Changes of incremental update should be the same as of rebuilding"""
+        old = SearchTree(self.tree)
+        change()
+        expected = UpdateTree._update_difference(SearchTree(self.tree), old)
+        self.assertEqual(up_tree._update_topology(self.tree), expected)
+        return expected
+
+
+class HeadlessEvaluationTest(EmptyTreeTestCase):
+    def test_evaluate_tree(self):
+        ngon = create_node("SvNGonNode")
+        ngon.sides_ = 4
+        matrix_apply = create_node("MatrixApplyNode")
+        self.tree.links.new(ngon.outputs['Vertices'], matrix_apply.inputs['Vectors'])
+
+        result = evaluate_tree(self.tree, outputs=[(ngon.name, 'Vertices')])
+        self.assertSetEqual(set(result.node_times), {ngon.name, matrix_apply.name})
+        self.assertDictEqual(result.errors, {})
+        self.assertEqual(len(result.outputs[ngon.name, 'Vertices'][0]), 4)
+
+    def test_evaluate_after_discard(self):
+        ngon = create_node("SvNGonNode")
+        outputs = [(ngon.name, 'Vertices')]
+        log = []
+        ts.tasks.add(ts.Task(self.tree, _updater(log, 'old'), False))
+        first = evaluate_tree(self.tree, outputs=outputs)
+        ts.tasks.add(ts.Task(self.tree, _updater(log, 'new'), False))
+        second = evaluate_tree(self.tree, outputs=outputs)
+        self.assertEqual(first.outputs, second.outputs)
+
+        ts.tasks.add(ts.Task(self.tree, _updater(log, 'last'), False))
+        while ts.tasks:
+            ts.tasks.run()
+        self.assertEqual(log, ['last'])
+
+
+class TasksTest(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.trees = [create_node_tree(f"TasksTest {i}") for i in range(3)]
+        self.tasks = ts.Tasks()
+        self.log = []
+
+    def tearDown(self):
+        for tree in self.trees:
+            remove_node_tree(tree.name)
+        super().tearDown()
+
+    def _add(self, tree, priority, name, steps=1, delay=0.):
+        task = ts.Task(tree, _updater(self.log, name, steps, delay), False)
+        task.priority = priority
+        self.tasks.add(task)
+
+    def _run_all(self):
+        while self.tasks:
+            self.tasks.run()
+
+    def test_priority_order(self):
+        self._add(self.trees[0], ts.Priority.BACKGROUND, 'background')
+        self._add(self.trees[1], ts.Priority.ANIMATION, 'animation')
+        self._add(self.trees[2], ts.Priority.EDITOR, 'editor')
+        self._add(self.trees[1], ts.Priority.ANIMATION, 'the same tree')
+        self._run_all()
+        self.assertEqual(self.log, ['animation', 'editor', 'background'])
+
+    def test_add_after_discard(self):
+        self._add(self.trees[0], ts.Priority.EDITOR, 'old')
+        self._add(self.trees[1], ts.Priority.ANIMATION, 'other')
+        self.tasks.discard(self.trees[0])
+        self._add(self.trees[0], ts.Priority.BACKGROUND, 'new')
+        self._run_all()
+        self.assertEqual(self.log, ['other', 'new'])
+
+    def test_postpone_started_task(self):
+        self._add(self.trees[0], ts.Priority.BACKGROUND, 'background', steps=10, delay=0.01)
+        self.tasks.run()
+        started = len(self.log)
+        self.assertLess(started, 10)
+        self._add(self.trees[1], ts.Priority.EDITOR, 'editor')
+        self._run_all()
+        self.assertEqual(self.log, ['background'] * started + ['editor'] + ['background'] * (10 - started))
+
+    def test_time_budget(self):
+        self._add(self.trees[0], ts.Priority.EDITOR, 'step', steps=10, delay=0.01)
+        self.tasks.run()
+        self.assertLess(len(self.log), 10)
+        self.assertTrue(self.tasks)
+        self._run_all()
+        self.assertEqual(len(self.log), 10)
+
+
+class ParallelEvaluationTest(EmptyTreeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.evals = []
+        for radius in [1, 2]:
+            circle = create_node("SvCircleCurveMk2Node")
+            circle.radius = radius
+            evaluate = create_node("SvExEvalCurveNode")
+            self.tree.links.new(circle.outputs['Curve'], evaluate.inputs['Curve'])
+            matrix_apply = create_node("MatrixApplyNode")
+            self.tree.links.new(evaluate.outputs['Vertices'], matrix_apply.inputs['Vectors'])
+            self.evals.append(evaluate)
+        self.outputs = [(n.name, 'Vertices') for n in self.evals]
+
+    def test_same_result(self):
+        expected = evaluate_tree(self.tree, outputs=self.outputs).outputs
+        self.tree.sv_parallel = True
+        result = evaluate_tree(self.tree, outputs=self.outputs)
+        self.assertDictEqual(result.errors, {})
+        self.assertEqual(result.outputs, expected)
+
+    def test_task_without_node(self):
+        evaluate_tree(self.tree, outputs=self.outputs)
+        task = self.evals[0].sv_thread_task()
+        self.tree.nodes.remove(self.evals[0])
+        self.assertEqual(len(task()['Vertices'][0]), 50)
+
+    def test_worker_thread_events(self):
+        self.tree.sv_parallel = True
+        tracing.start()
+        try:
+            evaluate_tree(self.tree, outputs=self.outputs)
+            names = {n.name for n in self.evals}
+            tids = {tid for kind, _, name, _, _, tid, _ in tracing.tracer.events
+                    if kind == tracing.NODE and name in names}
+        finally:
+            tracing.stop()
+        self.assertTrue(tids)
+        self.assertNotIn(threading.get_ident(), tids)
+
+    def test_tree_changed(self):
+        self.tree.sv_parallel = True
+        UpdateTree.reset_tree(self.tree)
+        update = UpdateTree.main_update(self.tree, update_interface=False)
+        next(update)
+        UpdateTree.get(self.tree).is_updated = False
+        for _ in update:
+            pass
+        self.assertIsNone(UpdateTree.get(self.tree)._outdated_nodes)
+        self.assertFalse(any(n.get(ERROR_KEY) for n in self.tree.nodes))
+
+
+def _updater(log: list, name: str, steps=1, delay=0.):
+    for _ in range(steps):
+        sleep(delay)
+        log.append(name)
+        yield
+
+
 def _to_names(nodes: Iterable) -> Iterable[str]:
     for n in nodes:
         yield n.name
@@ -0,0 +1,93 @@
+import numpy as np
+from collections import Counter
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.dependencies import scipy
+from sverchok.utils.math import weighted_center, weighted_centers
+from sverchok.utils.voronoi3d import voronoi3d_regions, lloyd_iterations, lloyd3d_bounded, Bounds
+
+if scipy is not None:
+    from scipy.spatial import ConvexHull
+
+
+def signed_volume(verts, faces):
+    verts = np.array(verts)
+    volume = 0.0
+    for face in faces:
+        for i in range(1, len(face) - 1):
+            volume += np.dot(verts[face[0]], np.cross(verts[face[i]], verts[face[i+1]])) / 6.0
+    return volume
+
+@requires(scipy)
+class Voronoi3dRegionsTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.sites = np.random.default_rng(1).uniform(0, 1, (200, 3)).tolist()
+
+    def check_cell(self, verts, edges, faces):
+        directed_edges = Counter()
+        for face in faces:
+            for i, j in zip(face, face[1:] + face[:1]):
+                directed_edges[(i, j)] += 1
+        # closed manifold with consistently oriented faces
+        for (i, j), count in directed_edges.items():
+            self.assertEqual(count, 1)
+            self.assertEqual(directed_edges[(j, i)], 1)
+        self.assertEqual(len(edges), len(directed_edges) // 2)
+        self.assertEqual(len(set(sum(faces, []))), len(verts))
+        # cells are convex and oriented outwards
+        volume = signed_volume(verts, faces)
+        self.assertAlmostEqual(volume, ConvexHull(verts).volume, places=9)
+        return volume
+
+    def test_regions(self):
+        verts, edges, faces = voronoi3d_regions(self.sites)
+        self.assertTrue(len(verts) > 0)
+        for cell in zip(verts, edges, faces):
+            self.check_cell(*cell)
+
+    def test_clip(self):
+        verts, edges, faces = voronoi3d_regions(self.sites, do_clip=True, clipping=0.1)
+        bounds = np.array(self.sites)
+        for verts_i, edges_i, faces_i in zip(verts, edges, faces):
+            self.check_cell(verts_i, edges_i, faces_i)
+            self.assertTrue((np.array(verts_i) >= bounds.min(axis=0) - 0.1 - 1e-9).all())
+            self.assertTrue((np.array(verts_i) <= bounds.max(axis=0) + 0.1 + 1e-9).all())
+
+    def test_open_regions(self):
+        closed, _, _ = voronoi3d_regions(self.sites)
+        verts, edges, faces = voronoi3d_regions(self.sites, closed_only=False)
+        self.assertEqual(len(verts), len(self.sites))
+        self.assertTrue(len(closed) < len(verts))
+
+class LloydTests(SverchokTestCase):
+    def test_weighted_centers(self):
+        class Weights:
+            def evaluate_grid(self, xs, ys, zs):
+                return 1.0 + xs*xs + ys
+        rng = np.random.default_rng(2)
+        verts = rng.uniform(0, 1, (50, 3))
+        regions = [rng.choice(50, k, replace=False).tolist() for k in rng.integers(3, 9, 20)]
+        for field in [None, Weights()]:
+            expected = np.array([weighted_center(verts[region], field) for region in regions])
+            self.assert_numpy_arrays_equal(weighted_centers(verts, regions, field), expected, precision=10)
+
+    def test_stop_tolerance(self):
+        # each iteration halves the distance to zero
+        history = []
+        points = lloyd_iterations(np.array([[1.0, 0.0, 0.0]]), lambda pts: pts / 2, lambda pts: pts, 100,
+                    stop_tolerance=0.01, history=history)
+        self.assertEqual(len(history), 7)
+        self.assertAlmostEqual(history[0], 0.5)
+        self.assertTrue(history[-1] < 0.01 <= history[-2])
+        self.assert_numpy_arrays_equal(points, np.array([[1.0 / 2**7, 0.0, 0.0]]), precision=10)
+
+    @requires(scipy)
+    def test_bounded(self):
+        sites = np.random.default_rng(3).uniform(0, 1, (100, 3)).tolist()
+        bounds = Bounds.new('SPHERE', sites, 0.1)
+        history = []
+        points = lloyd3d_bounded(bounds, sites, 5, history=history)
+        self.assertEqual(len(points), len(sites))
+        self.assertEqual(len(history), 5)
+        self.assertTrue(bounds.contains_array(np.array(points) * (1 - 1e-9) + bounds.center * 1e-9).all())
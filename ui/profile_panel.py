@@ -5,11 +5,14 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+import os
+
 import bpy
 from bpy.props import EnumProperty, BoolProperty
 
 from sverchok.utils.logging import info
 import sverchok.utils.profile as prof
+from sverchok.utils import tracing
 
 
 class SvProfilingToggle(bpy.types.Operator):
@@ -85,7 +88,47 @@ class SvProfileReset(bpy.types.Operator):
         return {'FINISHED'}
 
 
-classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset]
+class SvTracingToggle(bpy.types.Operator):
+    """Toggle recording of nodes execution events on/off"""
+    bl_idname = "node.sverchok_tracing_toggle"
+    bl_label = "Toggle tracing"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        if tracing.tracer is None:
+            tracing.start()
+        else:
+            tracing.stop()
+        info("Tracing is set to %s", tracing.tracer is not None)
+        return {'FINISHED'}
+
+
+class SvTraceSave(bpy.types.Operator):
+    """Save trace in Chrome trace event format (JSON) and per node histogram
+    (CSV file with the same name)"""
+    bl_idname = "node.sverchok_trace_save"
+    bl_label = "Save trace"
+    bl_options = {'INTERNAL'}
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+    filename_ext = ".json"
+
+    @classmethod
+    def poll(cls, context):
+        return tracing.tracer is not None
+
+    def execute(self, context):
+        tracing.tracer.save_chrome_trace(self.filepath)
+        tracing.tracer.save_histogram(os.path.splitext(self.filepath)[0] + '.csv')
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset,
+           SvTracingToggle, SvTraceSave]
 
 
 def register():
@@ -19,7 +19,7 @@
 import bpy
 
 import sverchok
-from sverchok.utils import profile
+from sverchok.utils import profile, tracing
 from sverchok.ui.development import displaying_sverchok_nodes
 from sverchok.utils.context_managers import sv_preferences
 from sverchok.utils.handle_blender_data import BlTrees
@@ -70,6 +70,8 @@ class SV_PT_ActiveTreePanel(SverchokPanels, bpy.types.Panel):
         col.prop(ng, 'sv_scene_update', text="Scene", icon='SCENE_DATA')
         col.prop(ng, 'sv_process', text="Live update", toggle=True)
         col.prop(ng, "sv_draft", text="Draft mode", toggle=True)
+        col.prop(ng, "sv_parallel", text="Parallel", toggle=True)
+        col.prop(ng, "sv_skip_unchanged", text="Skip unchanged", toggle=True)
 
 
 class SV_PT_TreeTimingsPanel(SverchokPanels, bpy.types.Panel):
@@ -145,6 +147,13 @@ class SV_PT_ProfilingPanel(SverchokPanels, bpy.types.Panel):
         col_save.operator("node.sverchok_profile_save", text="Save data", icon="FILE_TICK")
         col_save.operator("node.sverchok_profile_reset", text="Reset data", icon="X")
 
+        col.separator()
+        if tracing.tracer is not None:
+            col.operator("node.sverchok_tracing_toggle", text="Stop tracing", icon="CANCEL")
+        else:
+            col.operator("node.sverchok_tracing_toggle", text="Start tracing", icon="TIME")
+        col.operator("node.sverchok_trace_save", text="Save trace", icon="FILE_TICK")
+
 
 class SV_PT_SverchokUtilsPanel(SverchokPanels, bpy.types.Panel):
     bl_idname = "SV_PT_SverchokUtilsPanel"
@@ -5,6 +5,8 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+from itertools import chain
+
 from mathutils.bvhtree import BVHTree
 import numpy as np
 
@@ -28,3 +30,33 @@ def bvh_tree_from_polygons(vertices, polygons, all_triangles=False, epsilon=0.0,
     if isinstance(polygons, np.ndarray):
         polygons = polygons.tolist()
     return BVHTree.FromPolygons(vertices, polygons, all_triangles=all_triangles, epsilon=epsilon)
+
+def bvh_find_nearest_array(bvh, points):
+    """
+    BVHTree.find_nearest for many points at once. The tree is queried in a
+    tight loop and the results are converted into arrays in bulk, so callers
+    can process them by NumPy instead of calling Python code per point.
+
+    inputs:
+    * bvh - mathutils.bvhtree.BVHTree
+    * points - np.array of shape (n, 3)
+
+    outputs: tuple of
+    * nearest points, np.array of shape (n, 3);
+    * normals of faces of the nearest points, np.array of shape (n, 3);
+    * indexes of faces of the nearest points, np.array of shape (n,);
+    * distances to the nearest points, np.array of shape (n,).
+    """
+    points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+    n = len(points)
+    find_nearest = bvh.find_nearest
+    found = [find_nearest(point) for point in points.tolist()]
+    try:
+        nearest = np.fromiter(chain.from_iterable(r[0] for r in found), dtype=np.float64, count=3*n)
+        normals = np.fromiter(chain.from_iterable(r[1] for r in found), dtype=np.float64, count=3*n)
+    except TypeError:
+        idx = next(i for i, r in enumerate(found) if r[0] is None)
+        raise Exception("No nearest point on mesh found for vertex %s" % points[idx])
+    indexes = np.fromiter((r[2] for r in found), dtype=np.int64, count=n)
+    distances = np.fromiter((r[3] for r in found), dtype=np.float64, count=n)
+    return nearest.reshape((n, 3)), normals.reshape((n, 3)), indexes, distances
@@ -7,6 +7,9 @@
 
 import numpy as np
 import itertools
+import hashlib
+import pickle
+import weakref
 
 from mathutils import Vector, Matrix
 from sverchok.utils.curve.core import (
@@ -30,7 +33,32 @@ def make_euclidean_ts(pts):
     tknots = tknots / tknots[-1]
     return tknots
 
+# Gauss-Kronrod G3-K7 quadrature on [-1, 1]; nodes are sorted, nodes of
+# Gauss rule are at odd indexes of Kronrod nodes.
+_KRONROD_NODES = np.array([
+        -0.960491268708020283, -0.774596669241483377, -0.434243749346802558, 0.0,
+        0.434243749346802558, 0.774596669241483377, 0.960491268708020283])
+_KRONROD_WEIGHTS = np.array([
+        0.104656226026467265, 0.268488089868333440, 0.401397414775962222, 0.450916538658474642,
+        0.401397414775962222, 0.268488089868333440, 0.104656226026467265])
+_GAUSS_WEIGHTS = np.array([0.555555555555555556, 0.888888888888888889, 0.555555555555555556])
+
+# Length tables of curves: curve -> (state, {(mode, resolution, tolerance, bounds): table}).
+# The state is a digest of attributes of the curve, the tables are dropped
+# when the curve is changed. Curves which attributes can't be pickled
+# are not cached.
+_length_tables = weakref.WeakKeyDictionary()
+
+def _curve_state(curve):
+    try:
+        dump = pickle.dumps(vars(curve), pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return hashlib.blake2b(dump, digest_size=16).digest()
+
 class SvCurveLengthSolver(object):
+    MAX_SUBDIVISIONS = 16
+
     def __init__(self, curve):
         self.curve = curve
         self._reverse_spline = None
@@ -52,35 +80,85 @@ class SvCurveLengthSolver(object):
         tknots = np.linspace(t_min, t_max, num=resolution)
         return tknots
 
-    def _prepare_find(self, resolution, tolerance, tknots=None, lengths=None, length_params=None):
-        if tknots is None:
-            tknots = self._calc_tknots_fixed(resolution)
-        if lengths is None:
-            lengths = self.calc_length_segments(tknots)
-        if length_params is None:
-            length_params = np.cumsum(np.insert(lengths, 0, 0))
-
-        resolution2 = resolution * 2 - 1
-        tknots2 = self._calc_tknots_fixed(resolution2)
-        lengths2 = self.calc_length_segments(tknots2)
-        length_params2 = np.cumsum(np.insert(lengths2, 0, 0))
-        
-        dl = abs(length_params2[::2] - length_params)
-        if (dl < tolerance).all():
-            return tknots2, length_params2
-        else:
-            return self._prepare_find(resolution2, tolerance, tknots2, lengths2, length_params2)
-
-    def prepare(self, mode, resolution=50, tolerance=None):
+    def _gauss_kronrod(self, t1s, t2s):
+        """
+        Lengths of curve segments between t1s and t2s by Kronrod and Gauss rules.
+        Difference between them is an estimation of the error.
+        """
+        half = (t2s - t1s) / 2.0
+        center = (t1s + t2s) / 2.0
+        ts = center[np.newaxis].T + half[np.newaxis].T * _KRONROD_NODES # (n, 7)
+        speeds = np.linalg.norm(self.curve.tangent_array(ts.flatten()), axis=1).reshape(ts.shape)
+        kronrod = half * (speeds @ _KRONROD_WEIGHTS)
+        gauss = half * (speeds[:, 1::2] @ _GAUSS_WEIGHTS)
+        return kronrod, gauss
+
+    def _calc_tknots_adaptive(self, resolution, tolerance):
+        """
+        Subdivide the intervals of the initial uniform grid until each of them
+        meets the tolerance. The curve is evaluated only at intervals which
+        are being refined. An interval is split in halves, and it is good if
+        * lengths of its halves are calculated with the error less than its
+          part of the tolerance;
+        * the halves have almost the same length, so parameters within
+          the interval can be interpolated by the length.
+        """
+        t_min, t_max = self.curve.get_u_bounds()
+        tknots = self._calc_tknots_fixed(resolution)
+        t1s, t2s = tknots[:-1], tknots[1:]
+        done_ts, done_lengths = [], []
+        for i in range(self.MAX_SUBDIVISIONS + 1):
+            middle = (t1s + t2s) / 2.0
+            kronrod, gauss = self._gauss_kronrod(np.concatenate((t1s, middle)), np.concatenate((middle, t2s)))
+            n = len(t1s)
+            left, right = kronrod[:n], kronrod[n:]
+            quadrature_error = abs(kronrod - gauss)
+            quadrature_error = quadrature_error[:n] + quadrature_error[n:]
+            interpolation_error = abs(left - right) / 2.0
+            good = (quadrature_error <= tolerance * (t2s - t1s) / (t_max - t_min)) & (interpolation_error <= tolerance)
+            if i == self.MAX_SUBDIVISIONS:
+                good[:] = True
+            done_ts.extend([t1s[good], middle[good]])
+            done_lengths.extend([left[good], right[good]])
+            if good.all():
+                break
+            t1s, t2s = np.concatenate((t1s[~good], middle[~good])), np.concatenate((middle[~good], t2s[~good]))
+
+        ts = np.concatenate(done_ts)
+        lengths = np.concatenate(done_lengths)
+        order = np.argsort(ts)
+        tknots = np.append(ts[order], t_max)
+        length_params = np.cumsum(np.insert(lengths[order], 0, 0))
+        return tknots, length_params
+
+    def _calc_length_table(self, resolution, tolerance):
         if tolerance is None:
             tknots = self._calc_tknots_fixed(resolution)
             lengths = self.calc_length_segments(tknots)
-            self._length_params = np.cumsum(np.insert(lengths, 0, 0))
+            return tknots, np.cumsum(np.insert(lengths, 0, 0))
         else:
-            tknots, self._length_params = self._prepare_find(resolution, tolerance)
-        self._reverse_spline = self._make_spline(mode, tknots, self._length_params)
-        self._prime_spline = self._make_spline(mode, self._length_params, tknots)
+            return self._calc_tknots_adaptive(resolution, tolerance)
 
+    def prepare(self, mode, resolution=50, tolerance=None):
+        key = (type(self), mode, resolution, tolerance, tuple(self.curve.get_u_bounds()))
+        tables = dict()
+        if (state := _curve_state(self.curve)) is not None:
+            try:
+                cached_state, cached_tables = _length_tables.get(self.curve, (None, None))
+                if cached_state == state:
+                    tables = cached_tables
+                else:
+                    _length_tables[self.curve] = state, tables
+            except TypeError:  # the curve can't be referenced weakly
+                pass
+        table = tables.get(key)
+        if table is None:
+            tknots, length_params = self._calc_length_table(resolution, tolerance)
+            table = (length_params,
+                     self._make_spline(mode, tknots, length_params),
+                     self._make_spline(mode, length_params, tknots))
+            tables[key] = table
+        self._length_params, self._reverse_spline, self._prime_spline = table
 
     def _make_spline(self, mode, tknots, values):
         zeros = np.zeros(len(tknots))
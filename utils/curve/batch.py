@@ -0,0 +1,126 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Evaluation of many curves at once. Calling evaluate_array for each of
+thousands of short curves spends most of the time in Python overhead, so
+curves of the same kind, degree and number of control points are stacked
+into arrays and evaluated by one vectorized call. Other curves are
+evaluated one by one.
+"""
+
+import numpy as np
+from collections import defaultdict
+
+from sverchok.utils.math import binomial
+from sverchok.utils.nurbs_common import nurbs_divide
+from sverchok.utils.curve.bezier import SvBezierCurve, SvCubicBezierCurve
+from sverchok.utils.curve.nurbs import SvNativeNurbsCurve
+
+def evaluate_curves(curves, ts_list):
+    """
+    Evaluate each curve at its own parameters.
+
+    inputs:
+    * curves - list of SvCurve
+    * ts_list - list of np.arrays of shape (n_i,), one per curve
+
+    output: list of np.arrays of shape (n_i, 3), one per curve.
+    """
+    ts_list = [np.asarray(ts, dtype=np.float64) for ts in ts_list]
+    result = [None] * len(curves)
+
+    groups = defaultdict(list)
+    for i, curve in enumerate(curves):
+        groups[_batch_key(curve)].append(i)
+
+    for key, indexes in groups.items():
+        if key is None or len(indexes) == 1:
+            for i in indexes:
+                result[i] = _evaluate_single(curves[i], ts_list[i])
+            continue
+
+        group_curves = [curves[i] for i in indexes]
+        group_ts = [ts_list[i] for i in indexes]
+        if key[0] == 'NURBS':
+            points, good = _evaluate_nurbs(group_curves, group_ts)
+        else:
+            points, good = _evaluate_bezier(group_curves, group_ts), None
+        lengths = [len(ts) for ts in group_ts]
+        for j, (i, curve_points) in enumerate(zip(indexes, np.split(points, np.cumsum(lengths)[:-1]))):
+            if good is None or good[j]:
+                result[i] = curve_points
+            else:
+                result[i] = _evaluate_single(curves[i], ts_list[i])
+    return result
+
+def _batch_key(curve):
+    """Curves with equal keys can be evaluated together"""
+    if isinstance(curve, SvNativeNurbsCurve):
+        return ('NURBS', curve.get_degree(), len(curve.get_control_points()))
+    if isinstance(curve, (SvBezierCurve, SvCubicBezierCurve)):
+        return ('BEZIER', curve.get_degree())
+    return None
+
+def _evaluate_single(curve, ts):
+    if len(ts) == 1:
+        return np.array([curve.evaluate(ts[0])])
+    return curve.evaluate_array(ts)
+
+def _evaluate_bezier(curves, ts_list):
+    p = curves[0].get_degree()
+    control_points = np.array([curve.get_control_points() for curve in curves]) # (m, p+1, 3)
+    rows = np.repeat(np.arange(len(curves)), [len(ts) for ts in ts_list])
+    ts = np.concatenate(ts_list)[np.newaxis].T # (n, 1)
+    ks = np.arange(p+1)
+    binomials = np.array([binomial(p, k) for k in ks])
+    coeffs = binomials * ts**ks * (1 - ts)**(p - ks) # (n, p+1)
+    return np.einsum('nk,nkd->nd', coeffs, control_points[rows])
+
+def _evaluate_nurbs(curves, ts_list):
+    """
+    Returns points and mask of curves which were evaluated. Basis functions
+    are calculated only for non-zero functions of knot span of each parameter
+    (The NURBS Book, 2nd edition, algorithm A2.2). Curves with parameters out
+    of their [u_p, u_k] range should be evaluated separately.
+    """
+    p = curves[0].get_degree()
+    k = len(curves[0].get_control_points())
+    knotvectors = np.array([curve.get_knotvector() for curve in curves]) # (m, k+p+1)
+    control_points = np.array([curve.get_control_points() for curve in curves]) # (m, k, 3)
+    weights = np.array([curve.get_weights() for curve in curves]) # (m, k)
+    rows = np.repeat(np.arange(len(curves)), [len(ts) for ts in ts_list])
+    ts = np.concatenate(ts_list)
+
+    knots = knotvectors[rows] # (n, k+p+1)
+    u_p, u_k = knots[:,p], knots[:,k]
+    good_ts = (ts >= u_p) & ((ts < u_k) | ((ts == u_k) & (u_k == knots[:,-1])))
+    good = np.ones(len(curves), dtype=bool)
+    good[rows[~good_ts]] = False
+
+    spans = (knots <= ts[np.newaxis].T).sum(axis=1) - 1
+    spans = np.clip(spans, p, k-1)
+    ns = np.zeros((p+1, len(ts)))
+    ns[0] = 1.0
+    left = np.zeros((p+1, len(ts)))
+    right = np.zeros((p+1, len(ts)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for j in range(1, p+1):
+            left[j] = ts - np.take_along_axis(knots, (spans+1-j)[np.newaxis].T, axis=1)[:,0]
+            right[j] = np.take_along_axis(knots, (spans+j)[np.newaxis].T, axis=1)[:,0] - ts
+            saved = np.zeros(len(ts))
+            for r in range(j):
+                temp = ns[r] / (right[r+1] + left[j-r])
+                ns[r] = saved + right[r+1] * temp
+                saved = left[j-r] * temp
+            ns[j] = saved
+
+    indexes = spans[np.newaxis].T - p + np.arange(p+1) # (n, p+1)
+    coeffs = ns.T * weights[rows[np.newaxis].T, indexes] # (n, p+1)
+    numerator = np.einsum('np,npd->nd', coeffs, control_points[rows[np.newaxis].T, indexes])
+    denominator = coeffs.sum(axis=1)
+    return nurbs_divide(numerator, denominator), good
@@ -1157,6 +1157,35 @@ class SvNativeNurbsCurve(SvNurbsCurve):
             return numerator / denominator
 
     def fraction(self, deriv_order, ts):
+        return self.fractions(deriv_order, ts)[deriv_order]
+
+    def fractions(self, max_order, ts):
+        """
+        Numerators and denominators of the curve and its derivatives
+        up to max_order (inclusive), in one pass over knot spans.
+
+        output: list of (numerator, denominator) tuples per derivative order;
+            numerator is np.array of shape (n, 3), denominator - of shape (n, 1).
+        """
+        p = self.degree
+        k = len(self.control_points)
+        sparse = self.basis.span_derivatives(p, k, ts, max_order)
+        if sparse is None:
+            # some parameters are outside of [u_p, u_k] range
+            return [self._dense_fraction(order, ts) for order in range(max_order+1)]
+
+        indexes, ders = sparse # (n, p+1), (max_order+1, n, p+1)
+        weights = self.weights[indexes] # (n, p+1)
+        control_points = self.control_points[indexes] # (n, p+1, 3)
+        result = []
+        for order in range(max_order+1):
+            coeffs = ders[order] * weights # (n, p+1)
+            numerator = np.einsum('np,npd->nd', coeffs, control_points) # (n, 3)
+            denominator = coeffs.sum(axis=1) # (n,)
+            result.append((numerator, denominator[np.newaxis].T))
+        return result
+
+    def _dense_fraction(self, deriv_order, ts):
         n = len(ts)
         p = self.degree
         k = len(self.control_points)
@@ -1206,11 +1235,7 @@ class SvNativeNurbsCurve(SvNurbsCurve):
         # numerator' = curve' * denominator + curve * denominator'
         # ergo:
         # curve' = (numerator' - curve*denominator') / denominator
-        numerator, denominator = self.fraction(0, ts)
-        curve = numerator / denominator
-        numerator1, denominator1 = self.fraction(1, ts)
-        curve1 = (numerator1 - curve*denominator1) / denominator
-        return curve1
+        return self.derivatives_array(1, ts)[0]
 
     def second_derivative(self, t, tangent_delta=None):
         return self.second_derivative_array(np.array([t]))[0]
@@ -1218,42 +1243,30 @@ class SvNativeNurbsCurve(SvNurbsCurve):
     def second_derivative_array(self, ts, tangent_delta=None):
         # numerator'' = (curve * denominator)'' =
         #  = curve'' * denominator + 2 * curve' * denominator' + curve * denominator''
-        numerator, denominator = self.fraction(0, ts)
-        curve = numerator / denominator
-        numerator1, denominator1 = self.fraction(1, ts)
-        curve1 = (numerator1 - curve*denominator1) / denominator
-        numerator2, denominator2 = self.fraction(2, ts)
-        curve2 = (numerator2 - 2*curve1*denominator1 - curve*denominator2) / denominator
-        return curve2
+        return self.derivatives_array(2, ts)[1]
 
     def third_derivative_array(self, ts, tangent_delta=None):
         # numerator''' = (curve * denominator)''' = 
         #  = curve''' * denominator + 3 * curve'' * denominator' + 3 * curve' * denominator'' + denominator'''
-        numerator, denominator = self.fraction(0, ts)
-        curve = numerator / denominator
-        numerator1, denominator1 = self.fraction(1, ts)
-        curve1 = (numerator1 - curve*denominator1) / denominator
-        numerator2, denominator2 = self.fraction(2, ts)
-        curve2 = (numerator2 - 2*curve1*denominator1 - curve*denominator2) / denominator
-        numerator3, denominator3 = self.fraction(3, ts)
-
-        curve3 = (numerator3 - 3*curve2*denominator1 - 3*curve1*denominator2 - curve*denominator3) / denominator
-        return curve3
+        return self.derivatives_array(3, ts)[2]
 
     def derivatives_array(self, n, ts, tangent_delta=None):
         result = []
-        if n >= 1:
-            numerator, denominator = self.fraction(0, ts)
-            curve = numerator / denominator
-            numerator1, denominator1 = self.fraction(1, ts)
-            curve1 = (numerator1 - curve*denominator1) / denominator
-            result.append(curve1)
+        if n < 1:
+            return result
+        # all required orders are calculated at once
+        fractions = self.fractions(min(n, 3), ts)
+        numerator, denominator = fractions[0]
+        curve = numerator / denominator
+        numerator1, denominator1 = fractions[1]
+        curve1 = (numerator1 - curve*denominator1) / denominator
+        result.append(curve1)
         if n >= 2:
-            numerator2, denominator2 = self.fraction(2, ts)
+            numerator2, denominator2 = fractions[2]
             curve2 = (numerator2 - 2*curve1*denominator1 - curve*denominator2) / denominator
             result.append(curve2)
         if n >= 3:
-            numerator3, denominator3 = self.fraction(3, ts)
+            numerator3, denominator3 = fractions[3]
             curve3 = (numerator3 - 3*curve2*denominator1 - 3*curve1*denominator2 - curve*denominator3) / denominator
             result.append(curve3)
         return result
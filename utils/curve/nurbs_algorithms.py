@@ -550,14 +550,15 @@ class SvNurbsCurveLengthSolver(SvCurveLengthSolver):
 
         return np.array(sorted(all_knots))
 
+    def _calc_length_table(self, resolution, tolerance):
+        tknots = self._calc_tknots(resolution, tolerance)
+        lengths = self.calc_length_segments(tknots)
+        return tknots, np.cumsum(np.insert(lengths, 0, 0))
+
     def prepare(self, mode, resolution=50, tolerance=1e-3):
         if tolerance is None:
             tolerance = 1e-3
-        tknots = self._calc_tknots(resolution, tolerance)
-        lengths = self.calc_length_segments(tknots)
-        self._length_params = np.cumsum(np.insert(lengths, 0, 0))
-        self._reverse_spline = self._make_spline(mode, tknots, self._length_params)
-        self._prime_spline = self._make_spline(mode, self._length_params, tknots)
+        super().prepare(mode, resolution, tolerance)
 
 def cast_nurbs_curve(curve, target, coeff=1.0):
     if not hasattr(target, 'projection_of_points'):
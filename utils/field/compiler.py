@@ -0,0 +1,138 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Evaluation of composed fields as a graph. Field nodes build chains of field
+objects (SvScalarFieldBinOp of SvComposedVectorField of ...), and
+evaluate_grid of such a chain evaluates each input field once per consumer:
+a field which output is used by two nodes downstream is evaluated twice.
+compile_field flattens the chain into a list of distinct fields in
+dependency order (fields are compared by identity), so each of them is
+evaluated once per grid. The grid is evaluated by chunks, intermediate
+values are dropped as soon as the last consumer used them, and the results
+are written into one preallocated array. Usage:
+
+    field = compile_field(field)
+    values = field.evaluate_grid(xs, ys, zs)
+
+Only inputs evaluated at the same points are part of the graph (see
+SvScalarField.grid_inputs), other fields are evaluated by their own
+evaluate_grid.
+"""
+
+import numpy as np
+
+from sverchok.utils.field.scalar import SvScalarField
+from sverchok.utils.field.vector import SvVectorField
+
+# number of points evaluated at once
+CHUNK_SIZE = 1 << 16
+
+
+def _grid_inputs(field):
+    return field.grid_inputs() if hasattr(field, 'grid_inputs') else []
+
+
+class FieldGraph:
+    """Fields of a composed field in dependency order, the root is the last"""
+    def __init__(self, field):
+        self.fields = []  # fields in the order of evaluation
+        self.inputs = []  # for each field, indexes of its inputs in self.fields
+        indexes = dict()
+        stack = [(field, False)]
+        while stack:
+            field, inputs_added = stack.pop()
+            if id(field) in indexes:
+                continue
+            inputs = _grid_inputs(field)
+            if not inputs_added:
+                stack.append((field, True))
+                stack.extend((f, False) for f in reversed(inputs) if id(f) not in indexes)
+                continue
+            indexes[id(field)] = len(self.fields)
+            self.fields.append(field)
+            self.inputs.append([indexes[id(f)] for f in inputs])
+
+        # index of the last consumer of each field value
+        self.last_use = list(range(len(self.fields)))
+        for i, inputs in enumerate(self.inputs):
+            for j in inputs:
+                self.last_use[j] = max(self.last_use[j], i)
+
+    def evaluate(self, xs, ys, zs):
+        values = [None] * len(self.fields)
+        for i, (field, inputs) in enumerate(zip(self.fields, self.inputs)):
+            if inputs:
+                values[i] = field.evaluate_grid_from(xs, ys, zs, [values[j] for j in inputs])
+            else:
+                values[i] = field.evaluate_grid(xs, ys, zs)
+            for j in set(inputs):
+                if self.last_use[j] == i:
+                    values[j] = None
+        return values[-1]
+
+    def evaluate_by_chunks(self, xs, ys, zs, chunk_size, is_vector):
+        """Evaluates the graph for each chunk of points and writes the values
+        into one array"""
+        xs, ys, zs = np.asarray(xs), np.asarray(ys), np.asarray(zs)
+        if xs.ndim != 1 or len(xs) <= chunk_size:
+            return self.evaluate(xs, ys, zs)
+        result = None
+        for start in range(0, len(xs), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            values = self.evaluate(xs[chunk], ys[chunk], zs[chunk])
+            if result is None:
+                shape = (3, len(xs)) if is_vector else (len(xs),)
+                result = np.empty(shape, dtype=np.result_type(*values) if is_vector else np.asarray(values).dtype)
+            result[..., chunk] = values
+        if is_vector:
+            return result[0], result[1], result[2]
+        return result
+
+    def __len__(self):
+        return len(self.fields)
+
+
+class SvCompiledScalarField(SvScalarField):
+    def __init__(self, field, chunk_size=CHUNK_SIZE):
+        self.field = field
+        self.graph = FieldGraph(field)
+        self.chunk_size = chunk_size
+        self.__description__ = "Compiled({})".format(field)
+
+    def evaluate(self, x, y, z):
+        return self.field.evaluate(x, y, z)
+
+    def evaluate_grid(self, xs, ys, zs):
+        return self.graph.evaluate_by_chunks(xs, ys, zs, self.chunk_size, is_vector=False)
+
+
+class SvCompiledVectorField(SvVectorField):
+    def __init__(self, field, chunk_size=CHUNK_SIZE):
+        self.field = field
+        self.graph = FieldGraph(field)
+        self.chunk_size = chunk_size
+        self.__description__ = "Compiled({})".format(field)
+
+    def evaluate(self, x, y, z):
+        return self.field.evaluate(x, y, z)
+
+    def evaluate_grid(self, xs, ys, zs):
+        return self.graph.evaluate_by_chunks(xs, ys, zs, self.chunk_size, is_vector=True)
+
+
+def compile_field(field, chunk_size=CHUNK_SIZE):
+    """
+    Returns a field which evaluates the given one as a graph. Fields which
+    do not have inputs are returned as is.
+    """
+    if isinstance(field, (SvCompiledScalarField, SvCompiledVectorField)) or not _grid_inputs(field):
+        return field
+    if isinstance(field, SvVectorField):
+        return SvCompiledVectorField(field, chunk_size)
+    else:
+        return SvCompiledScalarField(field, chunk_size)
@@ -10,6 +10,7 @@ from mathutils import Matrix, Vector
 
 from sverchok.utils.field.scalar import SvScalarField
 from sverchok.utils.field.vector import SvVectorField
+from sverchok.utils.bvh_tree import bvh_find_nearest_array
 from sverchok.dependencies import scipy
 
 if scipy is not None:
@@ -72,15 +73,9 @@ class SvBvhRbfNormalVectorField(SvVectorField):
         return self.rbf(x0, y0, z0)
     
     def evaluate_grid(self, xs, ys, zs):
-        def find(v):
-            nearest, normal, idx, distance = self.bvh.find_nearest(v)
-            if nearest is None:
-                raise Exception("No nearest point on mesh found for vertex %s" % v)
-            x0, y0, z0 = nearest
-            return self.rbf(x0, y0, z0)
-
         points = np.stack((xs, ys, zs)).T
-        vectors = np.vectorize(find, signature='(3)->(3)')(points)
+        nearest, _, _, _ = bvh_find_nearest_array(self.bvh, points)
+        vectors = self.rbf(nearest[:,0], nearest[:,1], nearest[:,2])
         R = vectors.T
         return R[0], R[1], R[2]
 
@@ -15,6 +15,7 @@ from mathutils import bvhtree
 from sverchok.utils.math import from_cylindrical, from_spherical, to_cylindrical, to_spherical, np_dot
 from sverchok.utils.geom import LineEquation, CircleEquation3D
 from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.bvh_tree import bvh_find_nearest_array
 
 ##################
 #                #
@@ -37,6 +38,17 @@ class SvScalarField(object):
     def evaluate_grid(self, xs, ys, zs):
         raise Exception("not implemented")
 
+    # Fields which are built from other fields evaluated at the same points
+    # return them from grid_inputs and implement evaluate_grid_from, which
+    # gets their values instead of evaluating them. This lets
+    # sverchok.utils.field.compiler evaluate fields shared by several
+    # consumers only once.
+    def grid_inputs(self):
+        return []
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        raise Exception("not implemented")
+
     def gradient(self, point, step=0.001):
         x, y, z = point
         v_dx_plus = self.evaluate(x+step,y,z)
@@ -96,8 +108,14 @@ class SvVectorFieldDecomposed(SvScalarField):
             rho, phi, theta = to_spherical(tuple(result), mode='radians')
             return [rho, phi, theta][self.axis]
 
+    def grid_inputs(self):
+        return [self.vfield]
+
     def evaluate_grid(self, xs, ys, zs):
-        results = self.vfield.evaluate_grid(xs, ys, zs)
+        return self.evaluate_grid_from(xs, ys, zs, [self.vfield.evaluate_grid(xs, ys, zs)])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        results, = values
         if self.coords == 'XYZ':
             return results[self.axis]
         elif self.coords == 'CYL':
@@ -118,11 +136,17 @@ class SvScalarFieldLambda(SvScalarField):
         self.variables = variables
         self.in_field = in_field
 
+    def grid_inputs(self):
+        return [] if self.in_field is None else [self.in_field]
+
     def evaluate_grid(self, xs, ys, zs):
+        return self.evaluate_grid_from(xs, ys, zs, [f.evaluate_grid(xs, ys, zs) for f in self.grid_inputs()])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
         if self.in_field is None:
             Vs = np.zeros(xs.shape[0])
         else:
-            Vs = self.in_field.evaluate_grid(xs, ys, zs)
+            Vs, = values
         if self.function_numpy is not None:
             return self.function_numpy(xs, ys, zs, Vs)
         else:
@@ -191,11 +215,17 @@ class SvScalarFieldBinOp(SvScalarField):
     def evaluate(self, x, y, z):
         return self.function(self.field1.evaluate(x, y, z), self.field2.evaluate(x, y, z))
 
+    def grid_inputs(self):
+        return [self.field1, self.field2]
+
     def evaluate_grid(self, xs, ys, zs):
         return self.function(self.field1.evaluate_grid(xs, ys, zs), self.field2.evaluate_grid(xs, ys, zs))
         #func = lambda xs, ys, zs : self.function(self.field1.evaluate_grid(xs, ys, zs), self.field2.evaluate_grid(xs, ys, zs))
         #return np.vectorize(func, signature="(m),(m),(m)->(m)")(xs, ys, zs)
 
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        return self.function(*values)
+
 class SvScalarFieldVectorizedFunction(SvScalarField):
     def __init__(self, field, function):
         self.function = function
@@ -205,9 +235,15 @@ class SvScalarFieldVectorizedFunction(SvScalarField):
     def evaluate(self, x, y, z):
         return self.function(self.field.evaluate(x,y,z))
 
+    def grid_inputs(self):
+        return [self.field]
+
     def evaluate_grid(self, xs, ys, zs):
         return self.function(self.field.evaluate_grid(xs,ys,zs))
 
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        return self.function(values[0])
+
 class SvCoordinateScalarField(SvScalarField):
     def __init__(self, coordinate):
         self.coordinate = coordinate
@@ -260,9 +296,15 @@ class SvNegatedScalarField(SvScalarField):
         v = self.field.evaluate(x, y, z)
         return -x
 
+    def grid_inputs(self):
+        return [self.field]
+
     def evaluate_grid(self, xs, ys, zs):
         return (- self.field.evaluate_grid(xs, ys, zs))
 
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        return - values[0]
+
 class SvAbsScalarField(SvScalarField):
     def __init__(self, field):
         self.field = field
@@ -272,9 +314,15 @@ class SvAbsScalarField(SvScalarField):
         v = self.field.evaluate(x, y, z)
         return abs(v) 
 
+    def grid_inputs(self):
+        return [self.field]
+
     def evaluate_grid(self, xs, ys, zs):
         return np.abs(self.field.evaluate_grid(xs, ys, zs))
 
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        return np.abs(values[0])
+
 class SvVectorFieldsScalarProduct(SvScalarField):
     def __init__(self, field1, field2):
         self.field1 = field1
@@ -286,13 +334,16 @@ class SvVectorFieldsScalarProduct(SvScalarField):
         v2 = self.field2.evaluate(x, y, z)
         return np.dot(v1, v2)
 
+    def grid_inputs(self):
+        return [self.field1, self.field2]
+
     def evaluate_grid(self, xs, ys, zs):
-        vx1, vy1, vz1 = self.field1.evaluate_grid(xs, ys, zs)
-        vx2, vy2, vz2 = self.field2.evaluate_grid(xs, ys, zs)
-        vectors1 = np.stack((vx1, vy1, vz1)).T
-        vectors2 = np.stack((vx2, vy2, vz2)).T
-        result = np.vectorize(np.dot, signature="(3),(3)->()")(vectors1, vectors2)
-        return result
+        return self.evaluate_grid_from(xs, ys, zs, [self.field1.evaluate_grid(xs, ys, zs),
+                                                    self.field2.evaluate_grid(xs, ys, zs)])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        (vx1, vy1, vz1), (vx2, vy2, vz2) = values
+        return vx1*vx2 + vy1*vy2 + vz1*vz2
 
 class SvVectorFieldNorm(SvScalarField):
     def __init__(self, field):
@@ -303,11 +354,15 @@ class SvVectorFieldNorm(SvScalarField):
         v = self.field.evaluate(x, y, z)
         return np.linalg.norm(v)
 
+    def grid_inputs(self):
+        return [self.field]
+
     def evaluate_grid(self, xs, ys, zs):
-        vx, vy, vz = self.field.evaluate_grid(xs, ys, zs)
-        vectors = np.stack((vx, vy, vz)).T
-        result = np.linalg.norm(vectors, axis=1)
-        return result
+        return self.evaluate_grid_from(xs, ys, zs, [self.field.evaluate_grid(xs, ys, zs)])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        vx, vy, vz = values[0]
+        return np.sqrt(vx*vx + vy*vy + vz*vz)
 
 class SvMergedScalarField(SvScalarField):
     def __init__(self, mode, fields):
@@ -335,8 +390,14 @@ class SvMergedScalarField(SvScalarField):
             raise Exception("unsupported operation")
         return value
 
+    def grid_inputs(self):
+        return self.fields
+
     def evaluate_grid(self, xs, ys, zs):
-        values = np.array([field.evaluate_grid(xs, ys, zs) for field in self.fields])
+        return self.evaluate_grid_from(xs, ys, zs, [field.evaluate_grid(xs, ys, zs) for field in self.fields])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        values = np.array(values)
         if self.mode == 'MIN':
             value = np.min(values, axis=0)
         elif self.mode == 'MAX':
@@ -496,19 +557,10 @@ class SvBvhAttractorScalarField(SvScalarField):
             return self.falloff(np.array([value]))[0]
 
     def evaluate_grid(self, xs, ys, zs):
-        def find(v):
-            nearest, normal, idx, distance = self.bvh.find_nearest(v)
-            if nearest is None:
-                raise Exception("No nearest point on mesh found for vertex %s" % v)
-            if self.signed:
-                sign = (v - nearest).dot(normal)
-                sign = copysign(1, sign)
-            else:
-                sign = 1
-            return sign * distance
-
         points = np.stack((xs, ys, zs)).T
-        norms = np.vectorize(find, signature='(3)->()')(points)
+        nearest, normals, idxs, norms = bvh_find_nearest_array(self.bvh, points)
+        if self.signed:
+            norms = np.copysign(1, np_dot(points - nearest, normals)) * norms
         if self.falloff is not None:
             result = self.falloff(norms)
             return result
@@ -536,12 +588,8 @@ class SvBvhEdgesAttractorScalarField(SvScalarField):
             return self.falloff(np.array([distance]))[0]
 
     def evaluate_grid(self, xs, ys, zs):
-        def find(v):
-            nearest, normal, idx, distance = self.bvh.find_nearest(v)
-            return distance
-
         points = np.stack((xs, ys, zs)).T
-        norms = np.vectorize(find, signature='(3)->()')(points)
+        _, _, _, norms = bvh_find_nearest_array(self.bvh, points)
         if self.falloff is not None:
             result = self.falloff(norms)
             return result
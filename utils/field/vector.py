@@ -16,6 +16,9 @@ from sverchok.utils.curve import SvCurveLengthSolver, SvNormalTrack, MathutilsRo
 from sverchok.utils.geom import LineEquation, CircleEquation3D
 from sverchok.utils.math import from_cylindrical, from_spherical, np_dot
 from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.bvh_tree import bvh_find_nearest_array
+from sverchok.utils import sv_noise_np
+from sverchok.utils.sv_seed_funcs import noise_lock
 from sverchok.utils.field.voronoi import SvVoronoiFieldData
 
 ##################
@@ -38,6 +41,13 @@ class SvVectorField(object):
     def evaluate_grid(self, xs, ys, zs):
         raise Exception("not implemented")
 
+    # See SvScalarField.grid_inputs
+    def grid_inputs(self):
+        return []
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        raise Exception("not implemented")
+
     def evaluate_array(self, points):
         xs = points[:,0]
         ys = points[:,1]
@@ -97,10 +107,14 @@ class SvComposedVectorField(SvVectorField):
         else: # SPH:
             return np.array(from_spherical(v1, v2, v3, mode='radians'))
 
+    def grid_inputs(self):
+        return [self.sfield1, self.sfield2, self.sfield3]
+
     def evaluate_grid(self, xs, ys, zs):
-        v1s = self.sfield1.evaluate_grid(xs, ys, zs)
-        v2s = self.sfield2.evaluate_grid(xs, ys, zs)
-        v3s = self.sfield3.evaluate_grid(xs, ys, zs)
+        return self.evaluate_grid_from(xs, ys, zs, [f.evaluate_grid(xs, ys, zs) for f in self.grid_inputs()])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        v1s, v2s, v3s = values
         if self.coords == 'XYZ':
             return v1s, v2s, v3s
         elif self.coords == 'CYL':
@@ -121,8 +135,14 @@ class SvAbsoluteVectorField(SvVectorField):
         r = self.field.evaluate(x, y, z)
         return r + np.array([x, y, z])
 
+    def grid_inputs(self):
+        return [self.field]
+
     def evaluate_grid(self, xs, ys, zs):
-        rxs, rys, rzs = self.field.evaluate_grid(xs, ys, zs)
+        return self.evaluate_grid_from(xs, ys, zs, [self.field.evaluate_grid(xs, ys, zs)])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        rxs, rys, rzs = values[0]
         return rxs + xs, rys + ys, rzs + zs
 
 class SvRelativeVectorField(SvVectorField):
@@ -134,8 +154,14 @@ class SvRelativeVectorField(SvVectorField):
         r = self.field.evaluate(x, y, z)
         return r - np.array([x, y, z])
 
+    def grid_inputs(self):
+        return [self.field]
+
     def evaluate_grid(self, xs, ys, zs):
-        rxs, rys, rzs = self.field.evaluate_grid(xs, ys, zs)
+        return self.evaluate_grid_from(xs, ys, zs, [self.field.evaluate_grid(xs, ys, zs)])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        rxs, rys, rzs = values[0]
         return rxs - xs, rys - ys, rzs - zs
 
 class SvVectorFieldLambda(SvVectorField):
@@ -148,11 +174,17 @@ class SvVectorFieldLambda(SvVectorField):
         self.variables = variables
         self.in_field = in_field
 
+    def grid_inputs(self):
+        return [] if self.in_field is None else [self.in_field]
+
     def evaluate_grid(self, xs, ys, zs):
+        return self.evaluate_grid_from(xs, ys, zs, [f.evaluate_grid(xs, ys, zs) for f in self.grid_inputs()])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
         if self.in_field is None:
             Vs = np.zeros(xs.shape[0])
         else:
-            vx, vy, vz = self.in_field.evaluate_grid(xs, ys, zs)
+            vx, vy, vz = values[0]
             Vs = np.stack((vx, vy, vz)).T
         if self.function_numpy is None:
             return np.vectorize(self.function,
@@ -178,14 +210,20 @@ class SvVectorFieldBinOp(SvVectorField):
     def evaluate(self, x, y, z):
         return self.function(self.field1.evaluate(x, y, z), self.field2.evaluate(x, y, z))
 
+    def grid_inputs(self):
+        return [self.field1, self.field2]
+
     def evaluate_grid(self, xs, ys, zs):
         def func(xs, ys, zs):
-            vx1, vy1, vz1 = self.field1.evaluate_grid(xs, ys, zs)
-            vx2, vy2, vz2 = self.field2.evaluate_grid(xs, ys, zs)
-            R = self.function(np.array([vx1, vy1, vz1]), np.array([vx2, vy2, vz2]))
-            return R[0], R[1], R[2]
+            values = [self.field1.evaluate_grid(xs, ys, zs), self.field2.evaluate_grid(xs, ys, zs)]
+            return self.evaluate_grid_from(xs, ys, zs, values)
         return np.vectorize(func, signature="(m),(m),(m)->(m),(m),(m)")(xs, ys, zs)
 
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        (vx1, vy1, vz1), (vx2, vy2, vz2) = values
+        R = self.function(np.array([vx1, vy1, vz1]), np.array([vx2, vy2, vz2]))
+        return R[0], R[1], R[2]
+
 class SvAverageVectorField(SvVectorField):
 
     def __init__(self, fields):
@@ -196,18 +234,20 @@ class SvAverageVectorField(SvVectorField):
         vectors = np.array([field.evaluate(x, y, z) for field in self.fields])
         return np.mean(vectors, axis=0)
 
+    def grid_inputs(self):
+        return self.fields
+
     def evaluate_grid(self, xs, ys, zs):
         def func(xs, ys, zs):
-            data = []
-            for field in self.fields:
-                vx, vy, vz = field.evaluate_grid(xs, ys, zs)
-                vectors = np.stack((vx, vy, vz)).T
-                data.append(vectors)
-            data = np.array(data)
-            mean = np.mean(data, axis=0).T
-            return mean[0], mean[1], mean[2]
+            values = [field.evaluate_grid(xs, ys, zs) for field in self.fields]
+            return self.evaluate_grid_from(xs, ys, zs, values)
         return np.vectorize(func, signature="(m),(m),(m)->(m),(m),(m)")(xs, ys, zs)
 
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        data = np.array([np.stack((vx, vy, vz)).T for vx, vy, vz in values])
+        mean = np.mean(data, axis=0).T
+        return mean[0], mean[1], mean[2]
+
 class SvVectorFieldCrossProduct(SvVectorField):
     def __init__(self, field1, field2):
         self.field1 = field1
@@ -219,9 +259,15 @@ class SvVectorFieldCrossProduct(SvVectorField):
         v2 = self.field2.evaluate(x, y, z)
         return np.cross(v1, v2)
 
+    def grid_inputs(self):
+        return [self.field1, self.field2]
+
     def evaluate_grid(self, xs, ys, zs):
-        vx1, vy1, vz1 = self.field1.evaluate_grid(xs, ys, zs)
-        vx2, vy2, vz2 = self.field2.evaluate_grid(xs, ys, zs)
+        return self.evaluate_grid_from(xs, ys, zs, [self.field1.evaluate_grid(xs, ys, zs),
+                                                    self.field2.evaluate_grid(xs, ys, zs)])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        (vx1, vy1, vz1), (vx2, vy2, vz2) = values
         vectors1 = np.stack((vx1, vy1, vz1)).T
         vectors2 = np.stack((vx2, vy2, vz2)).T
         R = np.cross(vectors1, vectors2).T
@@ -238,15 +284,19 @@ class SvVectorFieldMultipliedByScalar(SvVectorField):
         vector = self.vector_field.evaluate(x, y, z)
         return scalar * vector
 
+    def grid_inputs(self):
+        return [self.scalar_field, self.vector_field]
+
     def evaluate_grid(self, xs, ys, zs):
         def product(xs, ys, zs):
-            scalars = self.scalar_field.evaluate_grid(xs, ys, zs)
-            vx, vy, vz = self.vector_field.evaluate_grid(xs, ys, zs)
-            vectors = np.stack((vx, vy, vz))
-            R = (scalars * vectors)
-            return R[0], R[1], R[2]
+            values = [self.scalar_field.evaluate_grid(xs, ys, zs), self.vector_field.evaluate_grid(xs, ys, zs)]
+            return self.evaluate_grid_from(xs, ys, zs, values)
         return np.vectorize(product, signature="(m),(m),(m)->(m),(m),(m)")(xs, ys, zs)
 
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        scalars, (vx, vy, vz) = values
+        return scalars * vx, scalars * vy, scalars * vz
+
 class SvVectorFieldsLerp(SvVectorField):
 
     def __init__(self, vfield1, vfield2, scalar_field):
@@ -261,33 +311,46 @@ class SvVectorFieldsLerp(SvVectorField):
         vector2 = self.vfield2.evaluate(x, y, z)
         return (1 - scalar) * vector1 + scalar * vector2
 
+    def grid_inputs(self):
+        return [self.scalar_field, self.vfield1, self.vfield2]
+
     def evaluate_grid(self, xs, ys, zs):
-            scalars = self.scalar_field.evaluate_grid(xs, ys, zs)
-            vx1, vy1, vz1 = self.vfield1.evaluate_grid(xs, ys, zs)
-            vectors1 = np.stack((vx1, vy1, vz1))
-            vx2, vy2, vz2 = self.vfield2.evaluate_grid(xs, ys, zs)
-            vectors2 = np.stack((vx2, vy2, vz2))
-            R = (1 - scalars) * vectors1 + scalars * vectors2
-            return R[0], R[1], R[2]
+        return self.evaluate_grid_from(xs, ys, zs, [f.evaluate_grid(xs, ys, zs) for f in self.grid_inputs()])
+
+    def evaluate_grid_from(self, xs, ys, zs, values):
+        scalars, (vx1, vy1, vz1), (vx2, vy2, vz2) = values
+        vectors1 = np.stack((vx1, vy1, vz1))
+        vectors2 = np.stack((vx2, vy2, vz2))
+        R = (1 - scalars) * vectors1 + scalars * vectors2
+        return R[0], R[1], R[2]
 
 class SvNoiseVectorField(SvVectorField):
-    def __init__(self, noise_type, seed):
+    def __init__(self, noise_type, seed, use_numpy=False):
         self.noise_type = noise_type
         self.seed = seed
+        # bases not implemented with NumPy are evaluated by mathutils
+        self.use_numpy = use_numpy and noise_type in sv_noise_np.NOISE_TYPES
         self.__description__ = "{} noise".format(noise_type)
 
     def evaluate(self, x, y, z):
-        noise.seed_set(self.seed)
-        v = noise.noise_vector((x, y, z), noise_basis=self.noise_type)
+        if self.use_numpy:
+            return sv_noise_np.noise_vector(np.array([x, y, z]), self.noise_type, self.seed)
+        with noise_lock:
+            noise.seed_set(self.seed)
+            v = noise.noise_vector((x, y, z), noise_basis=self.noise_type)
         return np.array(v)
 
     def evaluate_grid(self, xs, ys, zs):
-        noise.seed_set(self.seed)
+        if self.use_numpy:
+            r = sv_noise_np.noise_vector(np.stack((xs, ys, zs), axis=-1), self.noise_type, self.seed)
+            return r[..., 0], r[..., 1], r[..., 2]
         def mk_noise(v):
             r = noise.noise_vector(v, noise_basis=self.noise_type)
             return r[0], r[1], r[2]
         vectors = np.stack((xs,ys,zs)).T
-        return np.vectorize(mk_noise, signature="(3)->(),(),()")(vectors)
+        with noise_lock:
+            noise.seed_set(self.seed)
+            return np.vectorize(mk_noise, signature="(3)->(),(),()")(vectors)
 
 class SvKdtVectorField(SvVectorField):
 
@@ -614,22 +677,16 @@ class SvBvhAttractorVectorField(SvVectorField):
                 return dv
 
     def evaluate_grid(self, xs, ys, zs):
-        def find(v):
-            nearest, normal, idx, distance = self.bvh.find_nearest(v)
-            if nearest is None:
-                raise Exception("No nearest point on mesh found for vertex %s" % v)
-            if self.use_normal:
-                if self.signed_normal:
-                    sign = (v - nearest).dot(normal)
-                    sign = copysign(1, sign)
-                else:
-                    sign = 1
-                return sign * np.array(normal)
-            else:
-                return np.array(nearest) - v
-
         points = np.stack((xs, ys, zs)).T
-        vectors = np.vectorize(find, signature='(3)->(3)')(points)
+        nearest, normals, idxs, distances = bvh_find_nearest_array(self.bvh, points)
+        if self.use_normal:
+            if self.signed_normal:
+                signs = np.copysign(1, np_dot(points - nearest, normals))
+                vectors = signs[np.newaxis].T * normals
+            else:
+                vectors = normals
+        else:
+            vectors = nearest - points
         if self.falloff is not None:
             norms = np.linalg.norm(vectors, axis=1, keepdims=True)
             nonzero = (norms > 0)[:,0]
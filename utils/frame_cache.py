@@ -0,0 +1,176 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Storage of data of animation frames with limited memory. Frames are kept
+pickled, so the size of each frame is known and a stored frame can not be
+changed by nodes which get it. When the frames take more memory than the
+budget the least recently used ones are moved to compressed files in the
+temporary folder (or forgotten if the disk is not used). Frames from the
+files can be loaded in a background thread before they are requested, so
+scrubbing of the timeline does not wait for the disk.
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import weakref
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class FrameCache:
+    """
+    Frame-indexed LRU store. memory_budget is in bytes, 0 means no limit.
+    Data which can not be pickled (e.g. Blender objects) is kept as is
+    and is never moved to the disk.
+    """
+    def __init__(self, memory_budget=0, use_disk=True):
+        self.memory_budget = memory_budget
+        self.use_disk = use_disk
+        self._memory = OrderedDict()  # frame: pickled bytes or data as is, from the least recently used
+        self._memory_size = 0
+        self._files = dict()  # frame: path of the file
+        self._lock = threading.RLock()
+        self._prefetching = set()
+        # the folder and the thread are created on demand
+        self._resources = dict(folder=None, executor=None)
+        weakref.finalize(self, FrameCache._release, self._resources)
+
+    def __contains__(self, frame):
+        with self._lock:
+            return frame in self._memory or frame in self._files
+
+    def __len__(self):
+        with self._lock:
+            return len(self._memory.keys() | self._files.keys())
+
+    @property
+    def memory_size(self):
+        """Size of pickled frames in memory"""
+        return self._memory_size
+
+    def put(self, frame, data):
+        try:
+            blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            blob = data
+        with self._lock:
+            self._forget(frame)
+            self._memory[frame] = blob
+            self._memory_size += self._size(blob)
+            self._evict(keep=frame)
+
+    def get(self, frame, default=None):
+        with self._lock:
+            if frame in self._memory:
+                self._memory.move_to_end(frame)
+                blob = self._memory[frame]
+            elif frame in self._files:
+                blob = self._read(self._files[frame])
+                self._store_loaded(frame, blob)
+            else:
+                return default
+        if isinstance(blob, bytes):
+            return pickle.loads(blob)
+        return blob
+
+    def prefetch(self, frames):
+        """Load given frames from the disk in a background thread"""
+        with self._lock:
+            frames = [f for f in frames
+                      if f in self._files and f not in self._memory and f not in self._prefetching]
+            if not frames:
+                return
+            if self._resources['executor'] is None:
+                self._resources['executor'] = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='sverchok_frame_cache')
+            self._prefetching.update(frames)
+            executor = self._resources['executor']
+        for frame in frames:
+            executor.submit(self._prefetch, frame)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            self._files.clear()
+            self._prefetching.clear()
+            resources = dict(self._resources)
+            self._resources.update(folder=None, executor=None)
+        FrameCache._release(resources)
+
+    def _prefetch(self, frame):
+        with self._lock:
+            path = self._files.get(frame)
+        # reading of the file does not block the main thread
+        try:
+            blob = self._read(path) if path is not None else None
+        except OSError:  # the frame was changed meanwhile
+            blob = None
+        with self._lock:
+            self._prefetching.discard(frame)
+            if blob is not None and self._files.get(frame) == path and frame not in self._memory:
+                self._store_loaded(frame, blob)
+
+    def _store_loaded(self, frame, blob):
+        # the file is kept, evicting of the frame again will not write it
+        self._memory[frame] = blob
+        self._memory_size += len(blob)
+        self._evict(keep=frame)
+
+    def _forget(self, frame):
+        if frame in self._memory:
+            self._memory_size -= self._size(self._memory.pop(frame))
+        path = self._files.pop(frame, None)
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _evict(self, keep=None):
+        if not self.memory_budget:
+            return
+        for frame in list(self._memory):
+            if self._memory_size <= self.memory_budget:
+                break
+            blob = self._memory[frame]
+            if frame == keep or not isinstance(blob, bytes):
+                continue
+            if self.use_disk and frame not in self._files:
+                self._files[frame] = self._write(frame, blob)
+            del self._memory[frame]
+            self._memory_size -= len(blob)
+
+    def _write(self, frame, blob):
+        if self._resources['folder'] is None:
+            self._resources['folder'] = tempfile.mkdtemp(prefix='sverchok_cache_')
+        path = os.path.join(self._resources['folder'], f'{frame}.bin')
+        with open(path, 'wb') as file:
+            file.write(zlib.compress(blob, 1))
+        return path
+
+    @staticmethod
+    def _read(path):
+        with open(path, 'rb') as file:
+            return zlib.decompress(file.read())
+
+    @staticmethod
+    def _size(blob):
+        return len(blob) if isinstance(blob, bytes) else 0
+
+    @staticmethod
+    def _release(resources):
+        if resources['executor'] is not None:
+            # it can be called from the thread itself when it releases the last reference
+            resources['executor'].shutdown(wait=False, cancel_futures=True)
+        if resources['folder'] is not None:
+            shutil.rmtree(resources['folder'], ignore_errors=True)
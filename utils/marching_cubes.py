@@ -457,32 +457,85 @@ def cornerloop(x,y,z):
         for cy,cx in zip((0,y,y,0),(0,0,x,x)):
              yield cx,cy,cz
 
-def isosurface_np(data, isolevel):
-    triangles = []
-    z_a = 0
-    z_plane_a = data[:,:,z_a]
+# Corners of a cube as offsets from its lowest corner, in the order used by
+# the tables above
+CORNER_OFFSETS = ((0,0,0), (0,1,0), (1,1,0), (1,0,0),
+                  (0,0,1), (0,1,1), (1,1,1), (1,0,1))
+# Each edge of a cube is given by its lower corner and its direction (axis)
+EDGE_LOWER_CORNERS = ((0,0,0), (0,1,0), (1,0,0), (0,0,0),
+                      (0,0,1), (0,1,1), (1,0,1), (0,0,1),
+                      (0,0,0), (0,1,0), (1,1,0), (1,0,0))
+EDGE_AXES = (1, 0, 1, 0, 1, 0, 1, 0, 2, 2, 2, 2)
+
+# Number of cubes processed at once by isosurface_np
+CHUNK_CELLS = 1 << 21
+
+def isosurface_np(data, isolevel, chunk_cells=CHUNK_CELLS):
+    """
+    Vectorized marching cubes.
+
+    Each edge of the grid has an integer id (index of its lower point * 3 +
+    axis), so the vertices shared by neighbouring cubes are merged by
+    np.unique over ids of edges. The grid is processed in slabs along X of
+    about chunk_cells cubes each, this bounds memory used by temporary
+    arrays for big grids.
+
+    inputs:
+    * data - np.array of shape (sx, sy, sz) with values of the field
+    * isolevel - value of the field at the surface
+
+    outputs: np.array of vertices of shape (n, 3) in grid coordinates, and
+    list of triangles.
+    """
+    data = np.asarray(data, dtype=np.float64)
     sx, sy, sz = data.shape
+    if min(sx, sy, sz) < 2:
+        return np.zeros((0, 3)), []
+
+    edges = np.array(edgetable)
+    triangles = np.array(tritable)[:, :15].reshape((256, 5, 3))
+    strides = np.array([sy*sz, sz, 1])
+    edge_offsets = np.array(EDGE_LOWER_CORNERS) @ strides
+    edge_axes = np.array(EDGE_AXES)
+
+    inside = data < isolevel
+    slab = max(1, chunk_cells // ((sy-1) * (sz-1)))
+    edge_ids = []
+    for x1 in range(0, sx-1, slab):
+        x2 = min(x1 + slab, sx-1)
+        cube_index = np.zeros((x2-x1, sy-1, sz-1), dtype=np.int64)
+        for bit, (dx, dy, dz) in enumerate(CORNER_OFFSETS):
+            corners = inside[x1+dx : x2+dx, dy : sy-1+dy, dz : sz-1+dz]
+            cube_index |= corners.astype(np.int64) << bit
+
+        cube_index = cube_index.ravel()
+        active = np.flatnonzero(edges[cube_index])
+        if not len(active):
+            continue
+        # index of the lowest point of each active cube
+        ax, ay, az = np.unravel_index(active, (x2-x1, sy-1, sz-1))
+        points = (ax + x1) * strides[0] + ay * strides[1] + az
+
+        cube_triangles = triangles[cube_index[active]] # (n, 5, 3)
+        cubes, slots = np.nonzero(cube_triangles[:,:,0] >= 0)
+        local_edges = cube_triangles[cubes, slots] # (m, 3)
+        edge_ids.append((points[cubes, np.newaxis] + edge_offsets[local_edges]) * 3 + edge_axes[local_edges])
+
+    if not edge_ids:
+        return np.zeros((0, 3)), []
+
+    unique_ids, faces = np.unique(np.concatenate(edge_ids), return_inverse=True)
+    faces = faces.reshape((-1, 3))
 
-    polygoniser = Polygoniser(isolevel)
-    for z in range(sz-1):
-        z2 = z+1
-        z_plane_b = data[:,:,z2]
-        for y in range(sy-1):
-            y2 = y+1
-            for x in range(sx-1):
-                x2 = x+1
-                cornervalues = [
-                    z_plane_a[x][y],
-                    z_plane_a[x][y+1],
-                    z_plane_a[x+1][y+1],
-                    z_plane_a[x+1][y],
-                    z_plane_b[x][y],
-                    z_plane_b[x][y+1],
-                    z_plane_b[x+1][y+1],
-                    z_plane_b[x+1][y],
-                ]
-                triangles.extend(polygoniser.polygonise(cornervalues, x,y,z, x2, y2, z2))
-        z_plane_a = z_plane_b
-
-    return np.array(polygoniser.vertices), triangles
+    points, axes = np.divmod(unique_ids, 3)
+    values = data.ravel()
+    value1, value2 = values[points], values[points + strides[axes]]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mu = (isolevel - value1) / (value2 - value1)
+    mu[abs(value1 - value2) < 0.00001] = 0.0
+    mu[abs(isolevel - value2) < 0.00001] = 1.0
+    mu[abs(isolevel - value1) < 0.00001] = 0.0
 
+    vertices = np.stack(np.unravel_index(points, data.shape), axis=1).astype(np.float64)
+    vertices[np.arange(len(points)), axes] += mu
+    return vertices, faces.tolist()
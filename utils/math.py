@@ -18,6 +18,7 @@
 
 import numpy as np
 import math
+import itertools
 from math import sin, cos, radians, degrees, sqrt, asin, acos, atan2
 
 xyz_axes = [
@@ -371,6 +372,29 @@ def weighted_center(verts, field=None):
         result = wpoints.sum(axis=0) / weights.sum()
         return result
 
+def weighted_centers(verts, regions, field=None):
+    """
+    weighted_center for many sets of vertices at once.
+
+    inputs:
+    * verts - np.array of shape (n, 3)
+    * regions - list of non-empty lists of indexes of vertices
+    * field - SvScalarField of weights, or None
+
+    output: np.array of shape (len(regions), 3)
+    """
+    if len(regions) == 0:
+        return np.zeros((0, 3))
+    sizes = np.array([len(region) for region in regions])
+    starts = np.cumsum(sizes) - sizes
+    indexes = np.fromiter(itertools.chain.from_iterable(regions), dtype=np.int64, count=sizes.sum())
+    region_verts = np.asarray(verts)[indexes]
+    if field is None:
+        return np.add.reduceat(region_verts, starts) / sizes[:,np.newaxis]
+    weights = field.evaluate_grid(region_verts[:,0], region_verts[:,1], region_verts[:,2])
+    wpoints = np.add.reduceat(weights[:,np.newaxis] * region_verts, starts)
+    return wpoints / np.add.reduceat(weights, starts)[:,np.newaxis]
+
 def gcd(a, b):
 
     """Calculate the Greatest Common Divisor of a and b.
@@ -0,0 +1,341 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Cache of results of expensive deterministic nodes. Results are stored by a key
+built from input data of a node and values of its properties, so a node which
+input data and properties were not changed restores its outputs instantly even
+after undo or reopening a file. Usage:
+
+    from sverchok.utils.nodes_mixins.cached_result import cache_result
+    ...
+    class SvAwesomeNode(SverchCustomTreeNode, bpy.types.Node):
+    ...
+        @cache_result
+        def process(self):
+            ...
+
+Nodes which implement the sv_thread_task method should decorate it with
+cache_thread_task instead.
+
+The results are kept in memory (least recently used results are removed
+when the cache exceeds its limit) and optionally on disk in the directory
+given in the add-on preferences (least recently used files are removed when
+they exceed the limit of the preferences). The key includes the version of
+Sverchok and a digest of the sources of the node and of the Sverchok modules
+it imports, so results of old code are not reused after an update.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import zlib
+from collections import OrderedDict
+from functools import wraps, lru_cache
+from itertools import chain
+from threading import Lock
+from types import ModuleType
+from time import perf_counter
+from typing import Optional
+
+import bpy
+import sverchok
+import sverchok.settings as settings
+from sverchok.core.socket_data import sv_get_socket, sv_set_socket, data_fingerprint
+from sverchok.core.sv_custom_exceptions import SvNoDataError
+from sverchok.utils.logging import debug
+from sverchok.utils import tracing
+
+# the properties do not effect the result of a node
+UPDATE_PROPERTIES = {'is_interactive', 'refresh', 'is_animatable'}
+
+
+class ResultCache:
+    """Keeps node results in memory and optionally on disk. Results are kept
+    pickled, so each hit returns a new copy which nodes are free to change.
+    Results which can't be pickled are not cached"""
+    SUFFIX = '.pkl.z'
+
+    def __init__(self, memory_limit: int, disk_limit: int = 0):
+        """:memory_limit: approximate size of results in memory in bytes
+        :disk_limit: size of the files of the results in bytes, 0 means no limit"""
+        self.memory_limit = memory_limit
+        self.disk_limit = disk_limit
+        self._directory = ''  # if empty results are not saved on disk
+        self._results: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        # key: size of the file, from the least recently used,
+        # it's read from the directory on demand
+        self._files: Optional[OrderedDict[str, int]] = None
+        self._files_size = 0
+        self._lock = Lock()
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @directory.setter
+    def directory(self, path: str):
+        with self._lock:
+            self._directory = path
+            self._files = None
+
+    def get(self, key: str) -> Optional[list]:
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                dump = self._results[key]
+            elif self._directory and key in self._disk_index():
+                try:
+                    with open(path := self._path(key), 'rb') as file:
+                        dump = zlib.decompress(file.read())
+                    os.utime(path)  # the order is kept between sessions
+                except Exception as e:
+                    debug(f"Can't read cached result {self._path(key)}: {e}")
+                    self._forget_file(key)
+                    return None
+                self._files.move_to_end(key)
+                self._put_in_memory(key, dump)
+            else:
+                return None
+        try:
+            return pickle.loads(dump)
+        except Exception as e:
+            debug(f"Can't load cached result: {e}")
+            return None
+
+    def put(self, key: str, result: list):
+        try:
+            dump = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            debug(f"Result can't be cached: {e}")
+            return
+        with self._lock:
+            self._put_in_memory(key, dump)
+            if self._directory:
+                self._put_on_disk(key, zlib.compress(dump, 1))
+
+    def clear(self):
+        """Clears the memory, the files are kept"""
+        with self._lock:
+            self._results.clear()
+            self._size = 0
+
+    def _put_in_memory(self, key, dump):
+        if key in self._results:
+            self._size -= len(self._results[key])
+        self._results[key] = dump
+        self._size += len(dump)
+        while self._size > self.memory_limit and len(self._results) > 1:
+            _, old_dump = self._results.popitem(last=False)
+            self._size -= len(old_dump)
+
+    def _put_on_disk(self, key, dump):
+        files = self._disk_index()
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(self._path(key), 'wb') as file:
+                file.write(dump)
+        except OSError as e:
+            debug(f"Result can't be saved on disk: {e}")
+            return
+        self._files_size -= files.pop(key, 0)
+        files[key] = len(dump)
+        self._files_size += len(dump)
+        while self.disk_limit and self._files_size > self.disk_limit and len(files) > 1:
+            self._forget_file(next(iter(files)))
+
+    def _forget_file(self, key):
+        self._files_size -= self._files.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _disk_index(self) -> OrderedDict[str, int]:
+        if self._files is None:
+            entries = []
+            if os.path.isdir(self._directory):
+                for entry in os.scandir(self._directory):
+                    if entry.name.endswith(self.SUFFIX) and entry.is_file():
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, entry.name[:-len(self.SUFFIX)], stat.st_size))
+            entries.sort()
+            self._files = OrderedDict((key, size) for _, key, size in entries)
+            self._files_size = sum(self._files.values())
+        return self._files
+
+    def _path(self, key):
+        return os.path.join(self._directory, f"{key}{self.SUFFIX}")
+
+
+result_cache = ResultCache(memory_limit=256 * 2**20, disk_limit=1024 * 2**20)
+
+
+def _rna_values(struct):
+    """Yields values of Python defined properties of given node or socket.
+    Raises TypeError if a property refers to Blender data"""
+    for prop in struct.bl_rna.properties:
+        if not prop.is_runtime or 'SKIP_SAVE' in prop.options:
+            continue
+        if prop.identifier in UPDATE_PROPERTIES:
+            continue
+        if prop.type in {'POINTER', 'COLLECTION'}:
+            raise TypeError(f"Property {prop.identifier} refers to Blender data")
+        value = getattr(struct, prop.identifier)
+        if isinstance(value, set):  # enum flag
+            value = tuple(sorted(value))
+        elif not isinstance(value, (bool, int, float, str)):
+            value = tuple(value)  # arrays
+        yield prop.identifier, value
+
+
+def result_key(node) -> Optional[str]:
+    """Returns key of current state of the node. It's None if the node can't
+    be cached (some input data or properties can't be compared by value)"""
+    try:
+        inputs = [_input_fingerprint(s) if s.is_linked else None
+                  for s in node.inputs]
+        state = (
+            sverchok.VERSION,
+            _code_version(type(node)),
+            node.bl_idname,
+            tuple(_rna_values(node)),
+            tuple(tuple(_rna_values(s)) for s in chain(node.inputs, node.outputs)),
+            tuple(s.is_linked for s in node.outputs),
+            tuple(inputs),
+        )
+        return hashlib.blake2b(pickle.dumps(state, pickle.HIGHEST_PROTOCOL), digest_size=20).hexdigest()
+    except (TypeError, pickle.PicklingError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _code_version(node_class) -> str:
+    """Digest of the sources of the module where the node is defined and of
+    all Sverchok modules which it imports directly or indirectly"""
+    digest = hashlib.blake2b(digest_size=8)
+    for path in sorted(_imported_files(node_class.__module__)):
+        try:
+            with open(path, 'rb') as file:
+                digest.update(file.read())
+        except OSError:
+            digest.update(path.encode())
+    return digest.hexdigest()
+
+
+def _imported_files(module_name: str) -> set[str]:
+    """Files of the module and of Sverchok modules which objects it refers to"""
+    files = set()
+    visited = set()
+    to_visit = [module_name]
+    while to_visit:
+        name = to_visit.pop()
+        if name in visited or (module := sys.modules.get(name)) is None:
+            continue
+        visited.add(name)
+        if isinstance(path := getattr(module, '__file__', None), str):
+            files.add(path)
+        for value in list(vars(module).values()):
+            if isinstance(value, ModuleType):
+                dependency = value.__name__
+            else:
+                dependency = getattr(value, '__module__', None)
+            if isinstance(dependency, str) and dependency.startswith('sverchok.'):
+                to_visit.append(dependency)
+    return files
+
+
+def _input_fingerprint(socket) -> bytes:
+    data = _socket_data(socket)
+    if data is None:
+        return b''
+    if (fingerprint := data_fingerprint(data)) is None:
+        raise TypeError(f"Data of {socket.name} socket can't be compared by value")
+    return fingerprint
+
+
+def _socket_data(socket):
+    try:
+        return sv_get_socket(socket, deepcopy=False)
+    except SvNoDataError:
+        return None
+
+
+def cache_result(process):
+    """Decorator for process method of nodes which results depend only on their
+    input data and properties. If the node was already evaluated with the same
+    input data and properties its outputs are restored from the cache"""
+    @wraps(process)
+    def wrapper(node):
+        key = result_key(node)
+        if key is None:
+            return process(node)
+
+        if (result := result_cache.get(key)) is not None:
+            if tracing.tracer is not None:
+                tracing.tracer.add(tracing.CACHE_HIT, node.id_data.name, node.name, perf_counter())
+            for socket, data in zip(node.outputs, result):
+                if data is None:
+                    socket.sv_forget()
+                else:
+                    sv_set_socket(socket, data)  # data was already processed
+                    socket.objects_number = len(data)
+            return
+
+        process(node)
+        result_cache.put(key, [_socket_data(s) for s in node.outputs])
+    return wrapper
+
+
+def cache_thread_task(sv_thread_task):
+    """The same as cache_result but for sv_thread_task method of nodes. The key
+    is calculated in the main thread, the result of the function returned by
+    the method is put into the cache by the worker thread"""
+    @wraps(sv_thread_task)
+    def wrapper(node):
+        key = result_key(node)
+        if key is None:
+            return sv_thread_task(node)
+
+        names = [s.name for s in node.outputs]
+        if (result := result_cache.get(key)) is not None:
+            if tracing.tracer is not None:
+                tracing.tracer.add(tracing.CACHE_HIT, node.id_data.name, node.name, perf_counter())
+            return lambda: {n: d for n, d in zip(names, result) if d is not None}
+
+        if (task := sv_thread_task(node)) is None:
+            return None
+
+        def cached_task():
+            outputs = task()
+            result_cache.put(key, [outputs.get(n) for n in names])
+            return outputs
+        return cached_task
+    return wrapper
+
+
+def set_cache_directory(path: str):
+    result_cache.directory = path and bpy.path.abspath(path)
+
+
+def set_cache_disk_limit(megabytes: int):
+    result_cache.disk_limit = megabytes * 2**20
+
+
+settings.set_node_cache_directory = set_cache_directory
+settings.set_node_cache_disk_limit = set_cache_disk_limit
+
+
+def register():
+    set_cache_directory(settings.get_param('node_cache_directory', ''))
+    set_cache_disk_limit(settings.get_param('node_cache_disk_limit', 1024))
+
+
+def unregister():
+    result_cache.clear()
@@ -5,9 +5,10 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+import hashlib
 import random
 import string
-from itertools import cycle
+from itertools import chain, cycle
 from typing import List, Union
 
 import numpy as np
@@ -18,7 +19,83 @@ from mathutils import Matrix
 
 from sverchok.data_structure import updateNode, update_with_kwargs, numpy_full_list, repeat_last
 from sverchok.utils.handle_blender_data import correct_collection_length, delete_data_block
-from sverchok.utils.sv_bmesh_utils import add_mesh_to_bmesh, bmesh_from_edit_mesh, EmptyBmesh
+from sverchok.utils.sv_bmesh_utils import add_mesh_to_bmesh, bmesh_from_edit_mesh
+
+
+class MeshTopologyArrays:
+    """
+    Edges and faces of Sverchok mesh as flat int32 arrays in the layout of Blender mesh
+    Faces can be given as list of lists or as 2D numpy array (all faces have the same number of sides)
+    """
+    def __init__(self, n_verts: int, edges, faces):
+        self.n_verts = n_verts
+        self.edges = np.ravel(np.asarray(edges, dtype=np.int32)) if len(edges) else np.zeros(0, dtype=np.int32)
+        if isinstance(faces, np.ndarray) and faces.ndim == 2:
+            self.loop_totals = np.full(len(faces), faces.shape[1], dtype=np.int32)
+            self.loops = np.ravel(faces.astype(np.int32, copy=False))
+        else:
+            self.loop_totals = np.fromiter(map(len, faces), dtype=np.int32, count=len(faces))
+            self.loops = np.fromiter(chain.from_iterable(faces), dtype=np.int32, count=int(self.loop_totals.sum()))
+        self.loop_starts = np.cumsum(self.loop_totals, dtype=np.int32) - self.loop_totals
+
+    def hash(self) -> str:
+        """Digest of the whole topology, it is cheap in comparison with rebuilding of a mesh"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.int64(self.n_verts).tobytes())
+        for array in (self.edges, self.loop_totals, self.loops):
+            digest.update(np.int64(len(array)).tobytes())
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def validate(self):
+        """
+        Mesh is written without BMesh which used to check indexes and to reject
+        repeated vertices of faces, repeated faces and edges. Invalid indexes
+        written into mesh can crash Blender
+        """
+        for name, indexes in [('edges', self.edges), ('faces', self.loops)]:
+            if len(indexes) and (indexes.min() < 0 or indexes.max() >= self.n_verts):
+                raise IndexError(f"Indexes of {name} are out of range of {self.n_verts} vertices")
+        if len(self.edges):
+            starts, ends = self.edges[::2].astype(np.int64), self.edges[1::2].astype(np.int64)
+            if np.any(starts == ends):
+                raise ValueError("Edges should connect two different vertices")
+            edge_keys = np.minimum(starts, ends) * self.n_verts + np.maximum(starts, ends)
+            if len(np.unique(edge_keys)) < len(edge_keys):
+                raise ValueError("Edges should not be repeated")
+        if len(self.loop_totals) and self.loop_totals.min() < 3:
+            raise ValueError("Faces should have at least 3 vertices")
+
+        # vertices of each face in ascending order, faces are kept in their order
+        face_indexes = np.repeat(np.arange(len(self.loop_totals)), self.loop_totals)
+        sorted_loops = self.loops[np.lexsort((self.loops, face_indexes))]
+        same_face = face_indexes[1:] == face_indexes[:-1]
+        if np.any(same_face & (sorted_loops[1:] == sorted_loops[:-1])):
+            raise ValueError("Faces should not have the same vertex twice")
+        for total in np.unique(self.loop_totals):
+            # faces with the same vertices are equal for BMesh regardless of their order
+            faces = sorted_loops[np.repeat(self.loop_totals == total, self.loop_totals)].reshape(-1, total)
+            faces = faces[np.lexsort(faces.T[::-1])]
+            if np.any(np.all(faces[1:] == faces[:-1], axis=1)):
+                raise ValueError("Faces should not be repeated")
+
+    def write(self, mesh: bpy.types.Mesh, verts):
+        """Replace geometry of the mesh by bulk setting of its arrays"""
+        self.validate()
+        mesh.clear_geometry()
+        mesh.vertices.add(self.n_verts)
+        mesh.vertices.foreach_set('co', np.ravel(np.asarray(verts, dtype=np.float32)))
+        mesh.edges.add(len(self.edges) // 2)
+        mesh.edges.foreach_set('vertices', self.edges)
+        mesh.loops.add(len(self.loops))
+        mesh.loops.foreach_set('vertex_index', self.loops)
+        mesh.polygons.add(len(self.loop_totals))
+        mesh.polygons.foreach_set('loop_start', self.loop_starts)
+        if bpy.app.version < (4, 0, 0):
+            # since 4.0 sizes of polygons are derived from their starts
+            mesh.polygons.foreach_set('loop_total', self.loop_totals)
+        # Sverchok edges can exclude edges of polygons
+        mesh.update(calc_edges=len(self.loops) > 0)
 
 
 class SvObjectData(bpy.types.PropertyGroup):
@@ -202,6 +279,7 @@ class BlenderObjects:
 
 class SvMeshData(bpy.types.PropertyGroup):
     mesh: bpy.props.PointerProperty(type=bpy.types.Mesh, options={'SKIP_SAVE'})
+    topology_hash: StringProperty(options={'SKIP_SAVE'})
 
     def regenerate_mesh(self, mesh_name: str, verts, edges=None, faces=None, matrix: Matrix = None,
                         make_changes_test=True):
@@ -209,6 +287,7 @@ class SvMeshData(bpy.types.PropertyGroup):
         It takes vertices, edges and faces and updates mesh data block
         If it assume that topology is unchanged only position of vertices will be changed
         In this case it will be more efficient if vertices are given in np.array float32 format
+        Otherwise the mesh is rebuilt by bulk setting of its arrays, BMesh is used only in edit mode
         Can apply matrix to mesh optionally
         """
         if edges is None:
@@ -220,7 +299,8 @@ class SvMeshData(bpy.types.PropertyGroup):
             # new mesh should be created
             self.mesh = bpy.data.meshes.new(name=mesh_name)
 
-        if not make_changes_test or self.is_topology_changed(verts, edges, faces):
+        topology = MeshTopologyArrays(len(verts), edges, faces)
+        if self.is_topology_changed(topology) or not make_changes_test:
 
             if self.mesh.is_editmode:
                 with bmesh_from_edit_mesh(self.mesh) as bm:
@@ -230,11 +310,9 @@ class SvMeshData(bpy.types.PropertyGroup):
                     if matrix:
                         bm.transform(matrix)
             else:
-                with EmptyBmesh(False) as bm:
-                    add_mesh_to_bmesh(bm, verts, edges, faces, update_indexes=False, update_normals=False)
-                    if matrix:
-                        bm.transform(matrix)
-                    bm.to_mesh(self.mesh)
+                topology.write(self.mesh, verts)
+                if matrix:
+                    self.mesh.transform(matrix)
 
         else:
 
@@ -259,22 +337,20 @@ class SvMeshData(bpy.types.PropertyGroup):
             is_smooth = np.zeros(len(self.mesh.polygons), dtype=bool)
         self.mesh.polygons.foreach_set('use_smooth', is_smooth)
 
-    def is_topology_changed(self, verts: list, edges: list, faces: list) -> bool:
+    def is_topology_changed(self, topology: MeshTopologyArrays) -> bool:
         """
-        Simple and fast test but not 100% robust.
-        If number of vertices and faces are unchanged it assumes that topology is not changed
-        This test is useful if mesh just changed its location.
+        Compares hash of given topology with hash of topology of the mesh from previous update
+        It is useful if mesh just changed its location.
         It is much faster just set new coordinate for each vector then recreate whole object
+        The hash is not saved, so first update after opening a file recreates the mesh
         """
-        if not faces:
-            # edges can be take in account if mesh does not have polygons
-            # because Sverchok edges can exclude edges within polygons
-            return len(self.mesh.vertices) != len(verts) or len(self.mesh.edges) != len(edges)
-        else:
-            number_is_changed = len(self.mesh.vertices) != len(verts) or len(self.mesh.polygons) != len(faces)
-            # check several polygons indexes
-            are_polygons_changed = any([list(p.vertices) != f for _, p, f in zip(range(5), self.mesh.polygons, faces)])
-            return number_is_changed or are_polygons_changed
+        topology_hash = topology.hash()
+        # the mesh also could be edited by user
+        is_changed = (topology_hash != self.topology_hash
+                      or len(self.mesh.vertices) != topology.n_verts
+                      or len(self.mesh.loops) != len(topology.loops))
+        self.topology_hash = topology_hash
+        return is_changed
 
     def update_vertices(self, verts: Union[list, np.ndarray]):
         """
@@ -300,6 +300,103 @@ class SvNurbsBasisFunctions(object):
 
         return calc
 
+    def find_spans(self, p, k, ts):
+        """
+        Indexes of knot spans which contain given parameters (vectorized).
+
+        inputs:
+        * p - degree
+        * k - number of control points
+        * ts - parameters, np.array of shape (n,)
+
+        output: np.array of shape (n,) with values in range [p, k-1], or None
+            if some parameters are out of [u_p, u_k) range, where
+            non-zero basis functions can be calculated via knot spans.
+            The end of the range is included if it is the last knot.
+        """
+        u = self.knotvector
+        if len(ts):
+            t_max = ts.max()
+            if ts.min() < u[p] or t_max > u[k] or (t_max == u[k] and u[k] < u[-1]):
+                return None
+        spans = u.searchsorted(ts, side='right') - 1
+        return np.clip(spans, p, k-1)
+
+    def span_derivatives(self, p, k, ts, max_order):
+        """
+        Values and derivatives of only non-zero basis functions at each parameter.
+        Only p+1 functions are non-zero at any parameter, so this is much
+        cheaper than calculation of all k functions by derivative() method.
+        Refer to The NURBS Book, 2nd edition, algorithm A2.3.
+
+        inputs:
+        * p - degree
+        * k - number of control points
+        * ts - parameters, np.array of shape (n,)
+        * max_order - maximum order of derivatives
+
+        output: tuple of
+            * indexes of non-zero functions: np.array of shape (n, p+1)
+            * values of derivatives: np.array of shape (max_order+1, n, p+1);
+              values of functions are at index 0.
+        or None if parameters are out of range where spans are defined
+        (see find_spans()).
+        """
+        spans = self.find_spans(p, k, ts)
+        if spans is None:
+            return None
+        u = self.knotvector
+        n = len(ts)
+
+        # ndu[j, r] for r < j: differences of knots (lower triangle),
+        # ndu[r, j] for r <= j: basis functions of degree j (upper triangle)
+        ndu = np.zeros((p+1, p+1, n))
+        ndu[0, 0] = 1.0
+        left = np.zeros((p+1, n))
+        right = np.zeros((p+1, n))
+        for j in range(1, p+1):
+            left[j] = ts - u[spans+1-j]
+            right[j] = u[spans+j] - ts
+            saved = np.zeros(n)
+            for r in range(j):
+                ndu[j, r] = right[r+1] + left[j-r]
+                temp = ndu[r, j-1] / ndu[j, r]
+                ndu[r, j] = saved + right[r+1] * temp
+                saved = left[j-r] * temp
+            ndu[j, j] = saved
+
+        ders = np.zeros((max_order+1, n, p+1))
+        ders[0] = ndu[:, p].T
+        a = np.zeros((2, p+1, n))
+        for r in range(p+1):
+            s1, s2 = 0, 1
+            a[0, 0] = 1.0
+            for order in range(1, min(max_order, p)+1):
+                d = np.zeros(n)
+                rk = r - order
+                pk = p - order
+                if r >= order:
+                    a[s2, 0] = a[s1, 0] / ndu[pk+1, rk]
+                    d = a[s2, 0] * ndu[rk, pk]
+                j1 = 1 if rk >= -1 else -rk
+                j2 = order-1 if r-1 <= pk else p-r
+                for j in range(j1, j2+1):
+                    a[s2, j] = (a[s1, j] - a[s1, j-1]) / ndu[pk+1, rk+j]
+                    d += a[s2, j] * ndu[rk+j, pk]
+                if r <= pk:
+                    a[s2, order] = -a[s1, order-1] / ndu[pk+1, r]
+                    d += a[s2, order] * ndu[r, pk]
+                ders[order, :, r] = d
+                s1, s2 = s2, s1
+
+        factor = p
+        for order in range(1, min(max_order, p)+1):
+            ders[order] *= factor
+            factor *= p - order
+
+        indexes = spans[np.newaxis].T - p + np.arange(p+1) # (n, p+1)
+        return indexes, ders
+
     def weighted_derivative(self, i, p, k, weights, reset_cache=True):
         if reset_cache:
             self._cache = dict()
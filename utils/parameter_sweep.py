@@ -0,0 +1,205 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Evaluation of a tree over a grid of property values. The combinations of the
+values are distributed among background Blender processes, output data of
+given sockets is collected into single NPZ file. Usage:
+
+    from sverchok.utils.parameter_sweep import sweep, load_sweep
+    tree = bpy.data.node_groups['NodeTree']
+    sweep(tree,
+          axes=[("Box", "size", [1, 2, 3]), ("Box", "divx", [1, 5, 10])],
+          outputs=[("Box", "Vertices")],
+          file_path="/path/to/result.npz")
+    params, outputs, failed = load_sweep("/path/to/result.npz")
+    verts = outputs["Box.Vertices"][4]  # vertices of size=2 and divx=5
+
+Values of properties should be JSON serializable. Sverchok add-on should be
+enabled in user preferences because workers are ordinary Blender instances.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import tempfile
+from collections.abc import Iterable
+from itertools import product
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+import bpy
+from sverchok.core.headless import evaluate_tree
+from sverchok.core.update_system import UpdateTree
+from sverchok.utils.logging import info
+
+if TYPE_CHECKING:
+    from sverchok.node_tree import SverchCustomTree as SvTree
+
+PARAM = 'param/'
+OUTPUT = 'output/'
+LENGTHS = 'lengths/'
+OBJECTS = 'objects/'
+
+
+def sweep(tree: SvTree, axes: Iterable[tuple[str, str, list]],
+          outputs: Iterable[tuple[str, str]], file_path: str,
+          processes: int = None) -> str:
+    """Evaluates the tree for each combination of given property values and
+    saves data of the outputs into NPZ file
+    :axes: node name, property name and values of the property
+    :outputs: node and socket names which data should be saved
+    :processes: number of Blender processes, number of CPUs by default"""
+    axes = [(n, p, list(v)) for n, p, v in axes]
+    outputs = [list(o) for o in outputs]
+    combinations = list(product(*(values for *_, values in axes)))
+    processes = min(processes or os.cpu_count(), len(combinations))
+
+    with tempfile.TemporaryDirectory(prefix='sverchok_sweep_') as folder:
+        blend_path = os.path.join(folder, 'sweep.blend')
+        bpy.ops.wm.save_as_mainfile(filepath=blend_path, copy=True)
+
+        workers = []
+        try:
+            for i in range(processes):
+                task_path = os.path.join(folder, f'task_{i}.json')
+                task = {
+                    'tree': tree.name,
+                    'axes': [[n, p] for n, p, _ in axes],
+                    'outputs': outputs,
+                    'combinations': [[j, c] for j, c in enumerate(combinations)
+                                     if j % processes == i],
+                    'result': os.path.join(folder, f'result_{i}.npz'),
+                }
+                with open(task_path, 'w') as file:
+                    json.dump(task, file)
+                log_path = os.path.join(folder, f'log_{i}.txt')
+                with open(log_path, 'w') as log:
+                    process = subprocess.Popen(
+                        [bpy.app.binary_path, '-b', blend_path,
+                         '--python-exit-code', '1',
+                         '--python-expr',
+                         f'from sverchok.utils.parameter_sweep import run_worker; run_worker({task_path!r})'],
+                        stdout=log, stderr=subprocess.STDOUT)
+                workers.append((process, task['result'], log_path))
+
+            values = {f'{n}.{s}': [None] * len(combinations) for n, s in outputs}
+            failed = np.zeros(len(combinations), dtype=bool)
+            for process, result_path, log_path in workers:
+                if process.wait() != 0:
+                    with open(log_path) as log:
+                        raise RuntimeError(f"Sweep worker has failed:\n{log.read()[-2000:]}")
+                with np.load(result_path, allow_pickle=True) as file:
+                    indexes = file['index']
+                    failed[indexes] = file['failed']
+                    for name, part in values.items():
+                        for index, data in zip(indexes, unpack_output(file, name)):
+                            part[index] = data
+        finally:
+            # the folder is removed on exit, the workers should not outlive it
+            for process, *_ in workers:
+                if process.poll() is None:
+                    process.terminate()
+                    process.wait()
+
+    store = {'failed': failed}
+    for i, (node_name, prop, _) in enumerate(axes):
+        store[f'{PARAM}{node_name}.{prop}'] = np.array([c[i] for c in combinations])
+    for name, data in values.items():
+        pack_output(name, data, store)
+    np.savez_compressed(file_path, **store)
+    info(f"Sweep of {len(combinations)} combinations is saved into {file_path}")
+    return file_path
+
+
+def run_worker(task_path: str):
+    """Evaluates the part of combinations of a sweep, it's called in
+    a background Blender process"""
+    with open(task_path) as file:
+        task = json.load(file)
+    tree = bpy.data.node_groups[task['tree']]
+    outputs = [tuple(o) for o in task['outputs']]
+
+    indexes = []
+    failed = []
+    values = {f'{n}.{s}': [] for n, s in outputs}
+    for i, (index, combination) in enumerate(task['combinations']):
+        nodes = set()
+        for (node_name, prop), value in zip(task['axes'], combination):
+            node = tree.nodes[node_name]
+            setattr(node, prop, value)
+            nodes.add(node)
+        UpdateTree.get(tree).add_outdated(nodes)
+        result = evaluate_tree(tree, outputs, force=i == 0)
+
+        indexes.append(index)
+        failed.append(bool(result.errors))
+        for (node_name, socket_name), part in zip(outputs, values.values()):
+            part.append(result.outputs.get((node_name, socket_name)))
+
+    store = {'index': np.array(indexes, dtype=int), 'failed': np.array(failed, dtype=bool)}
+    for name, data in values.items():
+        pack_output(name, data, store)
+    np.savez(task['result'], **store)
+
+
+def load_sweep(file_path: str) -> tuple[dict[str, np.ndarray], dict[str, list], np.ndarray]:
+    """Reads the result of a sweep. Returns property values, output data and
+    mask of failed evaluations. Each item of the dictionaries has a value per
+    combination"""
+    with np.load(file_path, allow_pickle=True) as file:
+        params = {k[len(PARAM):]: file[k] for k in file.files if k.startswith(PARAM)}
+        outputs = {k[len(OUTPUT):]: unpack_output(file, k[len(OUTPUT):])
+                   for k in file.files if k.startswith(OUTPUT)}
+        return params, outputs, file['failed']
+
+
+def pack_output(name: str, values: list, store: dict[str, np.ndarray]):
+    """Puts the data of a socket into arrays. Each value is data of
+    the socket of one evaluation. If all values have the same shape they are
+    stacked. Otherwise, objects of all values are concatenated and their
+    lengths are saved separately. Data which can't be converted into numeric
+    arrays is saved as objects"""
+    try:
+        arrays = [np.asarray(v) for v in values]
+        if all(a.dtype != object for a in arrays) and len({a.shape for a in arrays}) == 1:
+            store[OUTPUT + name] = np.stack(arrays)
+            return
+    except ValueError:  # ragged data
+        pass
+
+    try:
+        objects = [np.asarray(obj) for v in values for obj in (v or [])]
+        if any(o.dtype == object for o in objects) or len({o.shape[1:] for o in objects}) > 1:
+            raise ValueError("Objects can't be concatenated")
+        store[OUTPUT + name] = np.concatenate(objects) if objects else np.empty(0)
+        store[LENGTHS + name] = np.array([len(o) for o in objects], dtype=int)
+        store[OBJECTS + name] = np.array([len(v or []) for v in values], dtype=int)
+    except (ValueError, TypeError):
+        data = np.empty(len(values), dtype=object)
+        for i, v in enumerate(values):
+            data[i] = v
+        store[OUTPUT + name] = data
+
+
+def unpack_output(file, name: str) -> list[Any]:
+    """Reverse operation to pack_output. Each item of the list is data of
+    a socket of one evaluation"""
+    data = file[OUTPUT + name]
+    if LENGTHS + name not in file:
+        return list(data)
+    lengths = file[LENGTHS + name]
+    objects = np.split(data, np.cumsum(lengths)[:-1]) if len(lengths) else []
+    result = []
+    start = 0
+    for number in file[OBJECTS + name]:
+        result.append(objects[start: start + number])
+        start += number
+    return result
@@ -7,21 +7,12 @@
 
 import numpy as np
 
+from sverchok.utils.spatial_grid import all_pairs, close_pairs
+from sverchok.utils.pulga_recorder import PulgaRecorder, recorded_iterations
+
 def cross_indices3(n):
     '''create crossed indices'''
-
-    nu = np.sum(np.arange(n, dtype=np.int64))
-    ind = np.zeros((nu, 2), dtype=np.int16)
-    c = 0
-    for i in range(n-1):
-        l = n-i-1
-        np_i = np.full(n-i-1, i, dtype=np.int32)
-        np_j = np.arange(i+1, n, dtype=np.int32)
-        np_a = np.stack((np_i, np_j), axis=-1)
-        ind[c:c+l, :] = np_a
-        c += l
-
-    return ind
+    return all_pairs(n)
 
 
 def numpy_match_long_repeat(p):
@@ -74,11 +65,16 @@ def self_react(params):
     '''behaviors between particles: collide, attract and fit'''
     ps, collision, sum_rad, gates, att_params, fit_params = params
     use_collide, use_attract, use_grow = gates
-    indexes = ps.params['indexes']
-    if use_grow:
-        sum_rad = ps.rads[indexes[:, 0]] + ps.rads[indexes[:, 1]]
-        if use_attract:
+    if use_attract:
+        # attraction has no max distance, so all pairs are needed
+        indexes = ps.params['indexes']
+        if use_grow:
+            sum_rad = ps.rads[indexes[:, 0]] + ps.rads[indexes[:, 1]]
             att_params[2] = ps.mass[indexes[:, 0]] * ps.mass[indexes[:, 1]]
+    else:
+        # only touching particles react
+        indexes = close_pairs(ps.verts, 2 * np.amax(ps.rads))
+        sum_rad = ps.rads[indexes[:, 0]] + ps.rads[indexes[:, 1]]
     dif_v = ps.verts[indexes[:, 0], :] - ps.verts[indexes[:, 1], :]
     dist = np.linalg.norm(dif_v, axis=1)
     mask = sum_rad > dist
@@ -88,17 +84,14 @@ def self_react(params):
     some_attractions = use_attract and(len(index_inter) < len(indexes))
 
     if some_collisions or some_attractions:
-        result = np.zeros((ps.v_len, ps.v_len, 3), dtype=np.float64)
         dist_cor = np.clip(dist, 1e-6, 1e4)
         normal_v = dif_v/dist_cor[:, np.newaxis]
 
         if some_collisions:
-            self_collision_force(result, dist, sum_rad, index_inter, mask, normal_v, collision)
+            self_collision_force(ps.r, dist, sum_rad, index_inter, mask, normal_v, collision)
         if some_attractions:
             antimask = np.invert(mask)
-            attract_force(result, dist_cor, antimask, indexes, normal_v, att_params)
-
-        ps.r += np.sum(result, axis=1)
+            attract_force(ps.r, dist_cor, antimask, indexes, normal_v, att_params)
 
     if use_grow:
         fit_force(ps, index_inter, fit_params)
@@ -117,8 +110,8 @@ def self_collision_force(result, dist, sum_rad, index_inter, mask, normal_v, sel
     sf = self_collision[:, np.newaxis]
     len0, len1 = [sf[id1], sf[id0]] if variable_coll else [sf, sf]
 
-    result[id0, id1, :] = -no * le * len0
-    result[id1, id0, :] = no * le * len1
+    np.add.at(result, id0, -no * le * len0)
+    np.add.at(result, id1, no * le * len1)
 
 
 def attract_force(result, dist, mask, index, norm_v, att_params):
@@ -137,15 +130,15 @@ def attract_force(result, dist, mask, index, norm_v, att_params):
     att = attract
     len0, len1 = [att[id1], att[id0]] if variable_att else [att, att]
 
-    result[id0, id1, :] = - direction * len0
-    result[id1, id0, :] = direction * len1
+    np.add.at(result, id0, - direction * len0)
+    np.add.at(result, id1, direction * len1)
 
 
 def fit_force(ps, index_inter, fit_params):
     '''the untouched particles will grow, the ones that collide will shrink'''
     grow, min_rad, max_rad = fit_params
     touch = np.unique(index_inter)
-    free = np.setdiff1d(np.arange(ps.v_len, dtype=np.int16), touch)
+    free = np.setdiff1d(np.arange(ps.v_len), touch)
     v_grow = len(grow) > 1
     grow_un, grow_tou = [grow[free], grow[touch]] if v_grow else [grow, grow]
     ps.rads[free] += grow_un*0.1
@@ -172,8 +165,12 @@ def self_react_setup(ps, dicti, forces_composite):
     if not use_self_react:
         return
 
-    ps.params['indexes'] = cross_indices3(ps.v_len)
-    sum_rad = ps.rads[ps.params['indexes'][:, 0]] + ps.rads[ps.params['indexes'][:, 1]]
+    if use_attract:
+        ps.params['indexes'] = cross_indices3(ps.v_len)
+        sum_rad = ps.rads[ps.params['indexes'][:, 0]] + ps.rads[ps.params['indexes'][:, 1]]
+    else:
+        # pairs of touching particles are found at each iteration
+        sum_rad = None
 
     att_params = att_setup(use_attract, ps, np_attract, att_decay)
     fit_params = fit_setup(use_grow, np_grow, min_rad, max_rad)
@@ -810,14 +807,16 @@ def pulga_system_init(params, parameters, gates, out_lists, cache):
 
     iterations = parameters[1]
     iterations_max = max(iterations)
-    iterations_rec = [i-1 for i in iterations]
-    out_params = [iterations_rec, ps, dictionaries[1]["output"], out_lists]
+    iterations_rec = recorded_iterations(iterations, gates.get("record_step", 0))
+    recorder = PulgaRecorder(len(iterations_rec), gates.get("frames_on_disk", False), gates.get("max_frames", 0))
+    out_params = [set(iterations_rec), ps, recorder]
 
     if dictionaries[1]["accumulate"]:
         if len(cache) > 0:
             ps.hard_update_list(cache, gates["self_react"][2], gates["Pins"])
 
     iterate(iterations_max, force_map, force_parameters, out_params)
+    recorder.output(out_lists, dictionaries[1]["output"])
 
     return ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"]
 
@@ -832,29 +831,7 @@ def iterate(iterations_max, force_map, force_parameters, out_params):
 
 
 def output_data(it, params):
-    '''if is pertinent output the data'''
-    iterations_rec, ps, gate, out_lists = params
-    record_iteration = it in iterations_rec
-    if record_iteration:
-        data_out = prepare_output_data(ps, gate)
-        record_data(data_out, out_lists)
-
-
-def prepare_output_data(ps, gate):
-    '''prepare data to output'''
-    use_numpy_out = gate
-
-    if use_numpy_out:
-        return [ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"]]
-    else:
-        return [ps.verts.tolist(), ps.rads.tolist(), ps.vel.tolist(), ps.params["Pins Reactions"].tolist()]
-
-
-def record_data(data_out, out_lists):
-    '''save data to main list'''
-    verts_out, rads_out, velocity_out, reactions_out = out_lists
-    new_verts, new_rad, new_vel, new_react = data_out
-    verts_out.append(new_verts)
-    rads_out.append(new_rad)
-    velocity_out.append(new_vel)
-    reactions_out.append(new_react)
\ No newline at end of file
+    '''if is pertinent record the data'''
+    iterations_rec, ps, recorder = params
+    if it in iterations_rec:
+        recorder.record(ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"])
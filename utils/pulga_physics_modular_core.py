@@ -16,6 +16,8 @@ from sverchok.utils.surface.freecad import is_solid_face_surface
 from sverchok.dependencies import scipy
 from sverchok.utils.sv_mesh_utils import polygons_to_edges_np
 from sverchok.utils.modules.edge_utils import adjacent_faces_number
+from sverchok.utils.spatial_grid import close_pairs
+from sverchok.utils.pulga_recorder import PulgaRecorder, recorded_iterations
 
 def np_dot(u, v, axis=1):
     return np.sum(u * v, axis=axis)
@@ -25,23 +27,6 @@ def reflect(v1, mirror):
     dot2 = 2 * np.sum(mirror * v1, axis=1)
     return v1 - (dot2[:, np.newaxis] * mirror)
 
-def cross_indices3(n):
-    '''create crossed indices'''
-
-    nu = np.sum(np.arange(n, dtype=np.int64))
-    ind = np.zeros((nu, 2), dtype=np.int16)
-    c = 0
-    for i in range(n-1):
-        l = n-i-1
-        np_i = np.full(n-i-1, i, dtype=np.int32)
-        np_j = np.arange(i+1, n, dtype=np.int32)
-        np_a = np.stack((np_i, np_j), axis=-1)
-        ind[c:c+l, :] = np_a
-        c += l
-
-    return ind
-
-
 def numpy_match_long_repeat(p):
     '''match list length by repeating last one'''
     q = []
@@ -710,6 +695,8 @@ class SvAttractionForce():
         ps.aware = True
         for need in self.needs:
             ps.relations.needed[need] = True
+        if not self.use_kdtree:
+            ps.relations.max_distance = max(ps.relations.max_distance, self.max_distance)
         if self.uniform_magnitude:
             self.f_magnitude = self.magnitude
         else:
@@ -792,6 +779,8 @@ class SvAlignForce():
         ps.aware = True
         for need in self.needs:
             ps.relations.needed[need] = True
+        if not self.use_kdtree:
+            ps.relations.max_distance = max(ps.relations.max_distance, self.max_distance)
         if self.uniform_strength:
             self.f_strength = self.strength
         else:
@@ -868,7 +857,7 @@ class SvFitForce():
 
     def setup(self, ps):
         ps.aware = True
-        self.all_range = np.arange(ps.v_len, dtype=np.int16)
+        self.all_range = np.arange(ps.v_len)
 
         for need in self.needs:
             ps.relations.needed[need] = True
@@ -1404,6 +1393,7 @@ class PulgaSystem():
         self.goal_pins = True
         self.relations = lambda: None
         self.relations.needed = {}
+        self.relations.max_distance = 0.0
         for force in self.forces:
             if hasattr(force, 'pin_force'):
                 self.pinned = True
@@ -1423,15 +1413,8 @@ class PulgaSystem():
 
 
     def relations_setup(self):
-        if 'indexes' in self.relations.needed:
-            self.relations.indexes = cross_indices3(self.v_len)
         if 'cross_matrix' in self.relations.needed:
             self.relations.result = np.zeros((self.v_len, self.v_len, 3), dtype=np.float64)
-        if not self.size_change:
-            if 'sum_rad' in self.relations.needed:
-                self.relations.sum_rad = self.rads[self.relations.indexes[:, 0]] + self.rads[self.relations.indexes[:, 1]]
-            if 'mass_product' in self.relations.needed:
-                self.relations.mass_product = self.mass[self.relations.indexes[:, 0]] * self.mass[self.relations.indexes[:, 1]]
 
     def relations_update(self):
         if 'max_radius' in self.relations.needed:
@@ -1446,11 +1429,16 @@ class PulgaSystem():
                 self.relations.kd_sum_rad = self.rads[indexes[:, 0]] + self.rads[indexes[:, 1]]
                 self.relations.kd_dist = np.linalg.norm(self.relations.kd_dif_v, axis=1)
                 self.relations.kd_mask = self.relations.kd_dist < self.relations.kd_sum_rad
-        if self.size_change:
+        if 'indexes' in self.relations.needed:
+            # pairs which can collide or are closer than max distance of attraction or alignment
+            distance = self.relations.max_distance
             if 'sum_rad' in self.relations.needed:
-                self.relations.sum_rad = self.rads[self.relations.indexes[:, 0]] + self.rads[self.relations.indexes[:, 1]]
-            if 'mass_product' in self.relations.needed:
-                self.relations.mass_product = self.mass[self.relations.indexes[:, 0]] * self.mass[self.relations.indexes[:, 1]]
+                distance = max(distance, 2 * np.amax(self.rads))
+            self.relations.indexes = close_pairs(self.verts, distance)
+        if 'sum_rad' in self.relations.needed:
+            self.relations.sum_rad = self.rads[self.relations.indexes[:, 0]] + self.rads[self.relations.indexes[:, 1]]
+        if 'mass_product' in self.relations.needed:
+            self.relations.mass_product = self.mass[self.relations.indexes[:, 0]] * self.mass[self.relations.indexes[:, 1]]
 
 
         if 'dif_v' in self.relations.needed:
@@ -1573,14 +1561,16 @@ def pulga_system_init(parameters, gates, out_lists, cache):
 
     iterations = parameters[1]
     iterations_max = max(iterations)
-    iterations_rec = [i-1 for i in iterations]
-    out_params = [iterations_rec, ps, gates["output"], out_lists]
+    iterations_rec = recorded_iterations(iterations, gates.get("record_step", 0))
+    recorder = PulgaRecorder(len(iterations_rec), gates.get("frames_on_disk", False), gates.get("max_frames", 0))
+    out_params = [set(iterations_rec), ps, recorder]
     ps.setup_forces()
 
     if gates["accumulate"] and len(cache) > 0:
         ps.hard_update_list(cache)
 
     iterate(iterations_max, out_params)
+    recorder.output(out_lists, gates["output"])
 
     return ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"][np.invert(ps.params['unpinned'])]
 
@@ -1595,28 +1585,7 @@ def iterate(iterations_max, out_params):
 
 
 def output_data(it, params):
-    '''if is pertinent output the data'''
-    iterations_rec, ps, gate, out_lists = params
-    record_iteration = it in iterations_rec
-    if record_iteration:
-        data_out = prepare_output_data(ps, gate)
-        record_data(data_out, out_lists)
-
-
-def prepare_output_data(ps, use_numpy_out):
-    '''prepare data to output'''
-
-    if use_numpy_out:
-        return [ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"][np.invert(ps.params['unpinned'])]]
-
-    return [ps.verts.tolist(), ps.rads.tolist(), ps.vel.tolist(), ps.params["Pins Reactions"][np.invert(ps.params['unpinned'])].tolist()]
-
-
-def record_data(data_out, out_lists):
-    '''save data to main list'''
-    verts_out, rads_out, velocity_out, reactions_out = out_lists
-    new_verts, new_rad, new_vel, new_react = data_out
-    verts_out.append(new_verts)
-    rads_out.append(new_rad)
-    velocity_out.append(new_vel)
-    reactions_out.append(new_react)
+    '''if is pertinent record the data'''
+    iterations_rec, ps, recorder = params
+    if it in iterations_rec:
+        recorder.record(ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"][np.invert(ps.params['unpinned'])])
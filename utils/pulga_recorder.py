@@ -0,0 +1,101 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Recording of states of Pulga particle systems. Recorded iterations are
+written into arrays of shape (frames, particles, ...) allocated before the
+simulation starts, optionally memory-mapped .npy files in the temporary
+folder, so a long simulation does not keep a Python copy of each recorded
+iteration. With max_frames the arrays work as a ring buffer which keeps
+only the last recorded iterations. The frames are given to the node as
+views of the arrays.
+"""
+
+import os
+import tempfile
+import weakref
+from collections import deque
+
+import numpy as np
+
+
+def recorded_iterations(iterations, record_step=0):
+    """
+    Indexes (from 0) of iterations to record: the given iterations (from 1),
+    and each record_step-th iteration if record_step > 0.
+    """
+    recorded = set(i - 1 for i in iterations)
+    if record_step > 0:
+        recorded.update(range(record_step - 1, max(iterations), record_step))
+    return sorted(recorded)
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _empty_frames(shape, on_disk):
+    if not on_disk:
+        return np.empty(shape, dtype=np.float64)
+    handle, path = tempfile.mkstemp(prefix='sverchok_pulga_', suffix='.npy')
+    os.close(handle)
+    frames = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=shape)
+    # the file is not needed any more when the last view of it is released
+    weakref.finalize(frames, _remove_file, path)
+    return frames
+
+
+class PulgaRecorder():
+    '''Store recorded states'''
+    def __init__(self, n_frames, on_disk=False, max_frames=0):
+        self.capacity = min(n_frames, max_frames) if max_frames > 0 else n_frames
+        self.on_disk = on_disk
+        self.count = 0
+        self.verts = self.rads = self.vel = None
+        # the number of pins may change between iterations, so reactions
+        # are stored as separate arrays
+        self.reactions = deque(maxlen=self.capacity)
+
+    def record(self, verts, rads, vel, reactions):
+        '''copy state of the system into the next frame'''
+        if self.capacity == 0:
+            return
+        if self.verts is None:
+            self.verts = _empty_frames((self.capacity,) + verts.shape, self.on_disk)
+            self.rads = _empty_frames((self.capacity,) + rads.shape, self.on_disk)
+            self.vel = _empty_frames((self.capacity,) + vel.shape, self.on_disk)
+        i = self.count % self.capacity
+        self.verts[i] = verts
+        self.rads[i] = rads
+        self.vel[i] = vel
+        self.reactions.append(np.array(reactions, dtype=np.float64))
+        self.count += 1
+
+    def frames(self):
+        '''indexes of recorded frames, from the oldest one'''
+        if self.count <= self.capacity:
+            return list(range(self.count))
+        start = self.count % self.capacity
+        return [(start + i) % self.capacity for i in range(self.capacity)]
+
+    def output(self, out_lists, use_numpy_out):
+        '''append recorded frames to lists of output data'''
+        verts_out, rads_out, velocity_out, reactions_out = out_lists
+        for i, reactions in zip(self.frames(), self.reactions):
+            if use_numpy_out:
+                verts_out.append(self.verts[i])
+                rads_out.append(self.rads[i])
+                velocity_out.append(self.vel[i])
+                reactions_out.append(reactions)
+            else:
+                verts_out.append(self.verts[i].tolist())
+                rads_out.append(self.rads[i].tolist())
+                velocity_out.append(self.vel[i].tolist())
+                reactions_out.append(reactions.tolist())
@@ -6,17 +6,13 @@
 # License-Filename: LICENSE
 
 import numpy as np
-from collections import defaultdict
-from math import sqrt
+from itertools import chain
 
-import bmesh
-import mathutils
 from mathutils.bvhtree import BVHTree
 
 from sverchok.data_structure import repeat_last_for_length
 from sverchok.utils.sv_mesh_utils import polygons_to_edges
-from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata
-from sverchok.utils.geom import center, linear_approximation
+from sverchok.utils.bvh_tree import bvh_find_nearest_array
 
 NONE = 'NONE'
 BVH = 'BVH'
@@ -27,104 +23,157 @@ MINIMUM = 'MIN'
 MAXIMUM = 'MAX'
 AVERAGE = 'MEAN'
 
-def mask_axes(src_vert, dst_vert, axes):
-    if axes == {0,1,2}:
-        return dst_vert
-    result = []
-    for axis in range(3):
-        if axis in axes:
-            result.append(dst_vert[axis])
-        else:
-            result.append(src_vert[axis])
-    return result
+def normalized(vecs):
+    """Unit vectors of the same directions, zero vectors stay zero"""
+    norms = np.sqrt(np.einsum('ij,ij->i', vecs, vecs))[np.newaxis].T
+    return np.divide(vecs, norms, out=np.zeros_like(vecs), where=norms > 0)
+
+def sums_by_index(indexes, values, n):
+    """Sums of values (array of shape (m,) or (m, k)) with equal indexes"""
+    if values.ndim == 1:
+        return np.bincount(indexes, weights=values, minlength=n)
+    return np.stack([np.bincount(indexes, weights=values[:,i], minlength=n) for i in range(values.shape[1])], axis=1)
+
+class MeshTopology(object):
+    """
+    Adjacency of mesh vertices and faces as flat index arrays. Faces are
+    stored by corners (pairs of a face and one of its vertices), sorted by
+    faces: a value of each face is a segment reduction of values of its
+    corners, and a value of each vertex is a sum of values of its corners
+    grouped by vertex index. The arrays are built once, so each iteration of
+    relaxation is a few NumPy calls instead of a loop over BMesh elements.
+    """
+    def __init__(self, n_verts, faces):
+        self.n_verts = n_verts
+        self.n_faces = len(faces)
+        self.face_sizes = np.array([len(face) for face in faces], dtype=np.int64)
+        self.face_starts = np.cumsum(self.face_sizes) - self.face_sizes
+        n_corners = self.face_sizes.sum()
+        self.corner_verts = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=n_corners)
+        self.corner_faces = np.repeat(np.arange(self.n_faces), self.face_sizes)
+        starts = self.face_starts[self.corner_faces]
+        sizes = self.face_sizes[self.corner_faces]
+        local = np.arange(n_corners) - starts
+        self.corner_next = starts + (local + 1) % sizes
+        self.corner_prev = starts + (local - 1) % sizes
+        self.vert_faces_count = np.bincount(self.corner_verts, minlength=n_verts)
+
+        # an edge is on the boundary if it belongs to exactly one face
+        v1 = self.corner_verts
+        v2 = self.corner_verts[self.corner_next]
+        edge_keys = np.minimum(v1, v2) * n_verts + np.maximum(v1, v2)
+        edge_keys, counts = np.unique(edge_keys, return_counts=True)
+        boundary_keys = edge_keys[counts == 1]
+        self.is_boundary = np.zeros(n_verts, dtype=bool)
+        self.is_boundary[boundary_keys // n_verts] = True
+        self.is_boundary[boundary_keys % n_verts] = True
+
+    def face_sums(self, corner_values):
+        if self.n_faces == 0:
+            return np.zeros((0,) + corner_values.shape[1:])
+        return np.add.reduceat(corner_values, self.face_starts, axis=0)
+
+    def vert_sums(self, corner_values):
+        return sums_by_index(self.corner_verts, corner_values, self.n_verts)
+
+    def face_centers(self, verts):
+        return self.face_sums(verts[self.corner_verts]) / self.face_sizes[np.newaxis].T
+
+    def face_area_normals(self, verts):
+        """Normals of faces by Newell's method, their lengths are doubled areas of faces"""
+        corner_cos = verts[self.corner_verts]
+        return self.face_sums(np.cross(corner_cos, corner_cos[self.corner_next]))
+
+    def vert_normals(self, verts):
+        """Vertex normals as calculated by BMesh: face normals weighted by angles of corners"""
+        corner_cos = verts[self.corner_verts]
+        to_next = normalized(corner_cos[self.corner_next] - corner_cos)
+        to_prev = -to_next[self.corner_prev]
+        angles = np.arccos(np.clip(np.einsum('ij,ij->i', to_next, to_prev), -1.0, 1.0))
+        face_normals = normalized(self.face_area_normals(verts))
+        normals = self.vert_sums(face_normals[self.corner_faces] * angles[np.newaxis].T)
+        loose = self.vert_faces_count == 0
+        normals[loose] = verts[loose]
+        return normalized(normals)
+
+    def movable_verts(self, mask, skip_boundary):
+        movable = np.ones(self.n_verts, dtype=bool)
+        if skip_boundary:
+            movable &= ~self.is_boundary
+        if mask is not None:
+            movable &= np.array(repeat_last_for_length(mask, self.n_verts), dtype=bool)
+        return movable
 
 def map_mask_axes(src_verts, dst_verts, axes):
     if axes == {0,1,2}:
         return dst_verts
-    result = np.asarray(src_verts).copy()
+    result = np.array(src_verts, dtype=np.float64)
     dst = np.asarray(dst_verts)
     for i in range(3):
         if i in axes:
             result[:,i] = dst[:,i]
-    return result.tolist()
+    return result
+
+def project_on_tangent_planes(verts, targets, normals):
+    """Move verts towards targets only along planes orthogonal to normals"""
+    dvs = targets - verts
+    dvs -= normals * np.einsum('ij,ij->i', dvs, normals)[np.newaxis].T
+    return verts + dvs
 
 def lloyd_relax(vertices, faces, iterations, mask=None, method=NORMAL, skip_boundary=True, use_axes={0,1,2}):
     """
     supported shape preservation methods: NONE, NORMAL, LINEAR, BVH
     """
 
-    def do_iteration(bvh, bm):
-        verts_out = []
-        face_centers = np.array([face.calc_center_median() for face in bm.faces])
-        n_verts = len(bm.verts)
-        n_link_faces = np.array([len(v.link_faces) for v in bm.verts])
-        max_link_faces = n_link_faces.max()
-        n_link_faces = n_link_faces[np.newaxis].T
-        face_centers_by_vert = np.zeros((n_verts, max_link_faces, 3))
-        for bm_vert in bm.verts:
-            face_idxs = np.array([face.index for face in bm_vert.link_faces])
-            n = len(face_idxs)
-            face_centers_by_vert[bm_vert.index, :n] = face_centers[face_idxs]
-        face_center_sums = face_centers_by_vert.sum(axis=1)
-        face_center_means = face_center_sums / n_link_faces
-        for bm_vert in bm.verts:
-            co = bm_vert.co
-            if (skip_boundary and bm_vert.is_boundary) or (mask is not None and not mask[bm_vert.index]):
-                new_vert = tuple(co)
-            else:    
-                if method == NONE:
-                    new_vert = face_center_means[bm_vert.index]
-                elif method == NORMAL:
-                    median = mathutils.Vector(face_center_means[bm_vert.index])
-                    dv = median - co
-                    dv = dv - dv.project(bm_vert.normal)
-                    new_vert = co + dv
-                elif method == LINEAR:
-                    cs = np.array([face_centers[face.index] for face in bm_vert.link_faces])
-                    approx = linear_approximation(cs)
-                    median = mathutils.Vector(approx.center)
-                    plane = approx.most_similar_plane()
-                    dist = plane.distance_to_point(bm_vert.co)
-                    new_vert = median + plane.normal.normalized() * dist
-                elif method == BVH:
-                    median = mathutils.Vector(face_center_means[bm_vert.index])
-                    new_vert, _normal, idx, dist = bvh.find_nearest(median)
-                else:
-                    raise Exception("Unsupported volume preservation method")
-                
-                new_vert = tuple(new_vert)
-                new_vert = mask_axes(tuple(co), new_vert, use_axes)
-                
-            verts_out.append(new_vert)
-
-        return verts_out
-
-    if mask is not None:
-        mask = repeat_last_for_length(mask, len(vertices))
+    def do_iteration(bvh, verts):
+        face_centers = topology.face_centers(verts)
+        corner_centers = face_centers[topology.corner_faces]
+        medians = topology.vert_sums(corner_centers) / n_link_faces
+        cos = verts[movable]
+        if method == NONE:
+            new_verts = medians[movable]
+        elif method == NORMAL:
+            normals = topology.vert_normals(verts)
+            new_verts = project_on_tangent_planes(cos, medians[movable], normals[movable])
+        elif method == LINEAR:
+            # plane which approximates centers of faces around each vertex
+            centers_0 = corner_centers - medians[topology.corner_verts]
+            products = (centers_0[:,:,np.newaxis] * centers_0[:,np.newaxis,:]).reshape((-1, 9))
+            covariances = topology.vert_sums(products).reshape((-1, 3, 3))
+            _, eigenvectors = np.linalg.eigh(covariances[movable])
+            plane_normals = eigenvectors[:,:,0]
+            dists = ((cos - medians[movable]) * plane_normals).sum(axis=1)
+            new_verts = medians[movable] + plane_normals * dists[np.newaxis].T
+        elif method == BVH:
+            new_verts, _, _, _ = bvh_find_nearest_array(bvh, medians[movable])
+        else:
+            raise Exception("Unsupported volume preservation method")
+
+        verts = verts.copy()
+        verts[movable] = map_mask_axes(cos, new_verts, use_axes)
+        return verts
+
+    verts = np.array(vertices, dtype=np.float64)
+    topology = MeshTopology(len(verts), faces)
+    # vertices without faces have nothing to be relaxed to
+    movable = topology.movable_verts(mask, skip_boundary) & (topology.vert_faces_count > 0)
+    n_link_faces = np.maximum(topology.vert_faces_count, 1)[np.newaxis].T
 
     if method == BVH:
         bvh = BVHTree.FromPolygons(vertices, faces)
     else:
         bvh = None
-    recalc_normals = (method == NORMAL)
-    bm = bmesh_from_pydata(vertices, [], faces, normal_update=recalc_normals)
     for i in range(iterations):
-        vertices = do_iteration(bvh, bm)
-        for bm_vert, v in zip(bm.verts, vertices):
-            bm_vert.co = mathutils.Vector(v)
-        if recalc_normals:
-            bm.normal_update()
-    bm.free()
+        verts = do_iteration(bvh, verts)
 
-    return vertices
+    return verts.tolist()
 
 def edges_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, target=AVERAGE, skip_boundary=True, use_axes={0,1,2}):
     """
     supported shape preservation methods: NONE, NORMAL, BVH
     """
 
-    def do_iteration(bvh, bm, verts):
-        verts = np.asarray(verts)
+    def do_iteration(bvh, verts):
         v1s = verts[edges[:,0]]
         v2s = verts[edges[:,1]]
         edge_vecs = v2s - v1s
@@ -139,71 +188,50 @@ def edges_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
         else:
             raise Exception("Unsupported target edge length type")
 
-        forces = defaultdict(lambda: np.zeros((3,)))
-        counts = defaultdict(int)
-        for edge_idx, (v1_idx, v2_idx) in enumerate(edges):
-            edge_vec = edge_vecs[edge_idx]
-            edge_len = edge_lens[edge_idx]
-            d_len = (edge_len - target_len)/2.0
-            dv1 =   d_len * edge_vec
-            dv2 = - d_len * edge_vec
-            forces[v1_idx] += dv1
-            forces[v2_idx] += dv2
-            counts[v1_idx] += 1
-            counts[v2_idx] += 1
-        
+        d_lens = (edge_lens - target_len)/2.0
+        dvs = d_lens[np.newaxis].T * edge_vecs
+        forces = sums_by_index(edges[:,0], dvs, len(verts)) - sums_by_index(edges[:,1], dvs, len(verts))
+
         target_verts = verts.copy()
-        for v_idx in range(len(verts)):
-            if skip_boundary and bm.verts[v_idx].is_boundary:
-                continue
-            if mask is not None and not mask[v_idx]:
-                continue
-            count = counts[v_idx]
-            if count:
-                forces[v_idx] /= count
-            target_verts[v_idx] += k*forces[v_idx]
+        target_verts[movable] += k * forces[movable] / counts[movable]
 
         if method == NONE:
-            verts_out = target_verts.tolist()
+            verts_out = target_verts
         elif method == NORMAL:
-            verts_out = []
-            for bm_vert in bm.verts:
-                normal = bm_vert.normal
-                dv = mathutils.Vector(target_verts[bm_vert.index]) - bm_vert.co
-                dv = dv - dv.project(normal)
-                new_vert = tuple(bm_vert.co + dv)
-                verts_out.append(new_vert)
+            verts_out = project_on_tangent_planes(verts, target_verts, topology.vert_normals(verts))
         elif method == BVH:
-            verts_out = []
-            for vert in target_verts:
-                new_vert, normal, idx, dist = bvh.find_nearest(vert)
-                verts_out.append(tuple(new_vert))
+            nearest, _, _, _ = bvh_find_nearest_array(bvh, target_verts[movable])
+            verts_out = target_verts
+            verts_out[movable] = nearest
         else:
             raise Exception("Unsupported shape preservation method")
-        
+
         return map_mask_axes(verts, verts_out, use_axes)
 
     if not edges or not edges[0]:
         edges = polygons_to_edges([faces], unique_edges=True)[0]
-    edges = np.array(edges)
-    if mask is not None:
-        mask = repeat_last_for_length(mask, len(vertices))
-    bvh = BVHTree.FromPolygons(vertices, faces)
+    edges = np.array(edges, dtype=np.int64).reshape((-1, 2))
+    verts = np.array(vertices, dtype=np.float64)
+    topology = MeshTopology(len(verts), faces)
+    movable = topology.movable_verts(mask, skip_boundary)
+    counts = np.maximum(np.bincount(edges.ravel(), minlength=len(verts)), 1)[np.newaxis].T
+
+    if method == BVH:
+        bvh = BVHTree.FromPolygons(vertices, faces)
+    else:
+        bvh = None
     for i in range(iterations):
-        bm = bmesh_from_pydata(vertices, edges, faces, normal_update=True)
-        vertices = do_iteration(bvh, bm, vertices)
-        bm.free()
+        verts = do_iteration(bvh, verts)
 
-    return vertices
+    return verts.tolist()
 
 def faces_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, target=AVERAGE, skip_boundary=True, use_axes={0,1,2}):
     """
     supported shape preservation methods: NONE, NORMAL, BVH
     """
 
-    def do_iteration(bvh, bm):
-        areas = np.array([face.calc_area() for face in bm.faces])
-        vert_cos = np.array([tuple(vert.co) for vert in bm.verts])
+    def do_iteration(bvh, verts):
+        areas = np.linalg.norm(topology.face_area_normals(verts), axis=1) / 2.0
         if target == MINIMUM:
             target_area = areas.min()
         elif target == MAXIMUM:
@@ -213,66 +241,39 @@ def faces_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
         else:
             raise Exception("Unsupported target face area type")
 
-        forces = defaultdict(lambda: np.zeros((3,)))
-        counts = defaultdict(int)
-        for bm_face in bm.faces:
-            face_vert_idxs = [vert.index for vert in bm_face.verts]
-            face_verts = vert_cos[face_vert_idxs]
-            mean = face_verts.mean(axis=0)
-            face_verts_0 = face_verts - mean
-            src_area = areas[bm_face.index]
-            scale = sqrt(target_area / src_area)
-            dvs = (scale - 1) * face_verts_0
-            for vert_idx, dv in zip(face_vert_idxs, dvs):
-                forces[vert_idx] += dv
-                counts[vert_idx] += 1
-        
-        target_verts = vert_cos.copy()
-        for bm_vert in bm.verts:
-            idx = bm_vert.index
-            if skip_boundary and bm_vert.is_boundary:
-                continue
-            if mask is not None and not mask[idx]:
-                continue
-            count = counts[idx]
-            if count:
-                forces[idx] /= count
-            force = forces[idx]
-            target_verts[idx] += k*force
+        # scale each face around its center to the target area
+        centers = topology.face_centers(verts)
+        scales = np.sqrt(target_area / areas)
+        corner_cos_0 = verts[topology.corner_verts] - centers[topology.corner_faces]
+        dvs = (scales - 1)[topology.corner_faces][np.newaxis].T * corner_cos_0
+        forces = topology.vert_sums(dvs)
+
+        target_verts = verts.copy()
+        target_verts[movable] += k * forces[movable] / counts[movable]
 
         if method == NONE:
-            verts_out = target_verts.tolist()
+            verts_out = target_verts
         elif method == NORMAL:
-            verts_out = []
-            for bm_vert in bm.verts:
-                idx = bm_vert.index
-                dv = mathutils.Vector(target_verts[idx]) - bm_vert.co
-                normal = bm_vert.normal
-                dv = dv - dv.project(normal)
-                new_vert = tuple(bm_vert.co + dv)
-                verts_out.append(new_vert)
-
+            verts_out = project_on_tangent_planes(verts, target_verts, topology.vert_normals(verts))
         elif method == BVH:
-            verts_out = []
-            for bm_vert in bm.verts:
-                new_vert, normal, idx, dist = bvh.find_nearest(bm_vert.co)
-                verts_out.append(tuple(new_vert))
-
+            nearest, _, _, _ = bvh_find_nearest_array(bvh, target_verts[movable])
+            verts_out = target_verts
+            verts_out[movable] = nearest
         else:
             raise Exception("Unsupported shape preservation method")
 
-        return map_mask_axes(vert_cos, verts_out, use_axes)
+        return map_mask_axes(verts, verts_out, use_axes)
 
-    if mask is not None:
-        mask = repeat_last_for_length(mask, len(vertices))
-    if not edges or not edges[0]:
-        edges = polygons_to_edges([faces], unique_edges=True)[0]
+    verts = np.array(vertices, dtype=np.float64)
+    topology = MeshTopology(len(verts), faces)
+    movable = topology.movable_verts(mask, skip_boundary)
+    counts = np.maximum(topology.vert_faces_count, 1)[np.newaxis].T
 
-    bvh = BVHTree.FromPolygons(vertices, faces)
+    if method == BVH:
+        bvh = BVHTree.FromPolygons(vertices, faces)
+    else:
+        bvh = None
     for i in range(iterations):
-        bm = bmesh_from_pydata(vertices, edges, faces, normal_update=True)
-        vertices = do_iteration(bvh, bm)
-        bm.free()
-
-    return vertices
+        verts = do_iteration(bvh, verts)
 
+    return verts.tolist()
@@ -0,0 +1,94 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Search of close pairs of points with a uniform grid (cell list). Points are
+sorted by the cell which contains them, and only points of neighbour cells
+are compared, so the number of tested pairs is proportional to the number
+of points rather than to its square. The grid is cheap to build, so it can
+be rebuilt each time the points move (e.g. each iteration of a simulation).
+"""
+
+import numpy as np
+
+# cells of the grid which are compared with a cell: the cell itself and half
+# of its neighbours, the other half is compared from the other side
+HALF_NEIGHBOURS = np.array([[i, j, k] for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)
+                            if (i, j, k) > (0, 0, 0)])
+
+# max number of cells along one axis, so that cell keys fit into int64
+MAX_CELLS = 1 << 20
+
+
+def all_pairs(n):
+    """Indexes of all pairs (i, j), i < j, of n items, array of shape (m, 2)"""
+    return np.stack(np.triu_indices(n, 1), axis=-1)
+
+
+def _cell_pairs(starts, counts, cell_a, cell_b, same):
+    """Indexes (in sorted order) of pairs of points of pairs of cells"""
+    counts_a, counts_b = counts[cell_a], counts[cell_b]
+    sizes = counts_a * counts_b
+    total = sizes.sum()
+    if total == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    pair_of_cells = np.repeat(np.arange(len(sizes)), sizes)
+    local = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    local_b = counts_b[pair_of_cells]
+    i = local // local_b
+    j = local % local_b
+    if same:
+        good = i < j
+        pair_of_cells, i, j = pair_of_cells[good], i[good], j[good]
+    return np.stack((starts[cell_a][pair_of_cells] + i, starts[cell_b][pair_of_cells] + j), axis=-1)
+
+
+def close_pairs(verts, radius):
+    """
+    Pairs of points which are closer than radius.
+
+    inputs:
+    * verts - np.array of shape (n, 3)
+    * radius - float
+
+    output: np.array of shape (m, 2) with indexes (i, j), i < j, of points,
+    in no particular order.
+    """
+    verts = np.asarray(verts, dtype=np.float64)
+    n = len(verts)
+    if n < 2 or not radius > 0:
+        return np.zeros((0, 2), dtype=np.int64)
+
+    low = verts.min(axis=0)
+    extent = verts.max(axis=0) - low
+    if radius * radius > np.dot(extent, extent):
+        candidates = all_pairs(n)
+    else:
+        # cells can't be smaller than radius; in very sparse sets they are
+        # bigger, which is slower but still correct
+        cell_size = np.maximum(radius, extent / (MAX_CELLS - 2))
+        cells = (np.floor((verts - low) / cell_size)).astype(np.int64) + 1
+        dims = cells.max(axis=0) + 2
+        keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+
+        order = np.argsort(keys, kind='stable')
+        cell_keys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+        n_cells = len(cell_keys)
+
+        pairs = [_cell_pairs(starts, counts, np.arange(n_cells), np.arange(n_cells), same=True)]
+        for offset in HALF_NEIGHBOURS:
+            neighbour_keys = cell_keys + (offset[0] * dims[1] + offset[1]) * dims[2] + offset[2]
+            found = np.searchsorted(cell_keys, neighbour_keys)
+            found = np.minimum(found, n_cells - 1)
+            exists = cell_keys[found] == neighbour_keys
+            pairs.append(_cell_pairs(starts, counts, np.flatnonzero(exists), found[exists], same=False))
+        candidates = order[np.concatenate(pairs)]
+
+    dif_v = verts[candidates[:, 0]] - verts[candidates[:, 1]]
+    close = np.einsum('ij,ij->i', dif_v, dif_v) < radius * radius
+    candidates = candidates[close]
+    return np.sort(candidates, axis=1)
@@ -349,6 +349,23 @@ class SvRevolutionSurface(SvSurface):
             result = result + self.point
         return result
 
+    def derivatives_array(self, us, vs, order=1):
+        # derivative of rotation by angle v around unit vector k:
+        # d/dv (R(v) x) = k x R(v) x
+        k = np.array(self.direction) / np.linalg.norm(self.direction)
+        curve_derivatives = self.curve.derivatives_array(order, us)
+        dvs = self.curve.evaluate_array(us) - self.point
+        rotated = rotate_vector_around_vector_np(dvs, self.direction, vs)
+        points = rotated if self.global_origin else rotated + self.point
+        du = rotate_vector_around_vector_np(curve_derivatives[0], self.direction, vs)
+        dv = np.cross(k, rotated)
+        if order < 2:
+            return SurfaceDerivativesData(points, du, dv)
+        duu = rotate_vector_around_vector_np(curve_derivatives[1], self.direction, vs)
+        duv = np.cross(k, du)
+        dvv = np.cross(k, dv)
+        return SurfaceDerivativesData(points, du, dv, duu, duv, dvv)
+
     def get_u_min(self):
         return self.curve.get_u_bounds()[0]
 
@@ -385,6 +402,16 @@ class SvExtrudeCurveVectorSurface(SvSurface):
         points_on_curve = self.curve.evaluate_array(us)
         return points_on_curve + vs[np.newaxis].T * self.vector
 
+    def derivatives_array(self, us, vs, order=1):
+        curve_derivatives = self.curve.derivatives_array(order, us)
+        points = self.evaluate_array(us, vs)
+        du = curve_derivatives[0]
+        dv = np.tile(self.vector, (len(us), 1))
+        if order < 2:
+            return SurfaceDerivativesData(points, du, dv)
+        zeros = np.zeros_like(du)
+        return SurfaceDerivativesData(points, du, dv, curve_derivatives[1], zeros, zeros)
+
     def get_u_min(self):
         return self.curve.get_u_bounds()[0]
 
@@ -487,6 +514,16 @@ class SvExtrudeCurveCurveSurface(SvSurface):
             result = u_points + (v_points - v0)
         return result
 
+    def derivatives_array(self, us, vs, order=1):
+        u_derivatives = self.u_curve.derivatives_array(order, us)
+        v_derivatives = self.v_curve.derivatives_array(order, vs)
+        points = self.evaluate_array(us, vs)
+        du, dv = u_derivatives[0], v_derivatives[0]
+        if order < 2:
+            return SurfaceDerivativesData(points, du, dv)
+        return SurfaceDerivativesData(points, du, dv,
+                    u_derivatives[1], np.zeros_like(du), v_derivatives[1])
+
     def get_u_min(self):
         return self.u_curve.get_u_bounds()[0]
 
@@ -875,6 +912,25 @@ class SvCurveLerpSurface(SvSurface):
         points = (1.0 - vs)*c1_points + vs*c2_points
         return points
 
+    def derivatives_array(self, us, vs, order=1):
+        scale1 = self.c1_max - self.c1_min
+        scale2 = self.c2_max - self.c2_min
+        us1 = scale1 * us + self.c1_min
+        us2 = scale2 * us + self.c2_min
+        c1_points = self.curve1.evaluate_array(us1)
+        c2_points = self.curve2.evaluate_array(us2)
+        c1_derivatives = self.curve1.derivatives_array(order, us1)
+        c2_derivatives = self.curve2.derivatives_array(order, us2)
+        vs = vs[np.newaxis].T
+        points = (1.0 - vs)*c1_points + vs*c2_points
+        du = (1.0 - vs)*scale1*c1_derivatives[0] + vs*scale2*c2_derivatives[0]
+        dv = c2_points - c1_points
+        if order < 2:
+            return SurfaceDerivativesData(points, du, dv)
+        duu = (1.0 - vs)*scale1**2*c1_derivatives[1] + vs*scale2**2*c2_derivatives[1]
+        duv = scale2*c2_derivatives[0] - scale1*c1_derivatives[0]
+        return SurfaceDerivativesData(points, du, dv, duu, duv, np.zeros_like(du))
+
     def get_u_min(self):
         return self.u_bounds[0]
 
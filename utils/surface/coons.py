@@ -15,6 +15,7 @@ from sverchok.utils.curve.nurbs import SvNurbsCurve
 from sverchok.utils.curve.algorithms import reverse_curve, reparametrize_curve, unify_curves_degree
 from sverchok.utils.curve.nurbs_algorithms import unify_curves, unify_two_curves
 from sverchok.utils.surface.core import SvSurface
+from sverchok.utils.surface.data import SurfaceDerivativesData
 from sverchok.utils.surface.nurbs import SvNurbsSurface
 from sverchok.utils.surface.algorithms import SvCurveLerpSurface, unify_nurbs_surfaces
 
@@ -67,6 +68,27 @@ class SvCoonsSurface(SvSurface):
     def evaluate_array(self, us, vs):
         return self.linear1.evaluate_array(1-us, 1-vs) + self.linear2.evaluate_array(1-vs, us) - self._calc_b(1-us, 1-vs, True)
 
+    def derivatives_array(self, us, vs, order=1):
+        # S(u, v) = L1(1-u, 1-v) + L2(1-v, u) - B(1-u, 1-v)
+        d1 = self.linear1._derivatives_array(1-us, 1-vs, order)
+        d2 = self.linear2._derivatives_array(1-vs, us, order)
+        corner1, corner2, corner3, corner4 = self.corner1, self.corner2, self.corner3, self.corner4
+        u = (1-us)[np.newaxis].T
+        v = (1-vs)[np.newaxis].T
+        # partial derivatives of B by its arguments
+        b_u = (corner2 - corner1) * (1 - v) + (corner4 - corner3) * v
+        b_v = (corner3 - corner1) * (1 - u) + (corner4 - corner2) * u
+        points = d1.points + d2.points - self._calc_b(1-us, 1-vs, True)
+        du = - d1.du + d2.dv + b_u
+        dv = - d1.dv - d2.du + b_v
+        if order < 2:
+            return SurfaceDerivativesData(points, du, dv)
+        b_uv = corner1 - corner2 - corner3 + corner4
+        duu = d1.duu + d2.dvv
+        duv = d1.duv - d2.duv - b_uv
+        dvv = d1.dvv + d2.duu
+        return SurfaceDerivativesData(points, du, dv, duu, duv, dvv)
+
 GENERIC = 'GENERIC'
 NURBS_ONLY = 'NURBS'
 NURBS_IF_POSSIBLE = 'NURBS_OPTION'
@@ -42,6 +42,8 @@ class SvSurface(object):
         return normal
 
     def normal_array(self, us, vs):
+        if hasattr(self, 'derivatives_array'):
+            return self.derivatives_array(us, vs, 1).unit_normals()
         surf_vertices = self.evaluate_array(us, vs)
         u_plus = self.evaluate_array(us + self.normal_delta, vs)
         v_plus = self.evaluate_array(us, vs + self.normal_delta)
@@ -56,54 +58,49 @@ class SvSurface(object):
         #self.info("Normals: %s", normal)
         return normal
 
-    def derivatives_data_array(self, us, vs):
+    # Surfaces which can calculate exact partial derivatives cheaply
+    # should implement method
+    #
+    #     def derivatives_array(self, us, vs, order=1):
+    #
+    # which returns SurfaceDerivativesData with the points, first partial
+    # derivatives and, if order is 2, second partial derivatives.
+    # normal_array, derivatives_data_array and curvature_calculator use it
+    # instead of finite differences.
+
+    def _derivatives_array(self, us, vs, order=1):
+        """Exact derivatives if the surface implements derivatives_array
+        method, otherwise they are estimated by finite differences"""
+        if hasattr(self, 'derivatives_array'):
+            return self.derivatives_array(us, vs, order)
         if hasattr(self, 'normal_delta'):
             h = self.normal_delta
         else:
             h = 0.0001
+
         surf_vertices = self.evaluate_array(us, vs)
         u_plus = self.evaluate_array(us + h, vs)
         v_plus = self.evaluate_array(us, vs + h)
-        du = (u_plus - surf_vertices) / h
-        dv = (v_plus - surf_vertices) / h
-        return SurfaceDerivativesData(surf_vertices, du, dv)
+        fu = (u_plus - surf_vertices) / h
+        fv = (v_plus - surf_vertices) / h
+        if order < 2:
+            return SurfaceDerivativesData(surf_vertices, fu, fv)
 
-    def curvature_calculator(self, us, vs, order=True):
-        if hasattr(self, 'normal_delta'):
-            h = self.normal_delta
-        else:
-            h = 0.0001
         h2 = h*h
-
-        surf_vertices = self.evaluate_array(us, vs)
-        u_plus = self.evaluate_array(us + h, vs)
-        v_plus = self.evaluate_array(us, vs + h)
         u_minus = self.evaluate_array(us - h, vs)
         v_minus = self.evaluate_array(us, vs - h)
         uv_plus = self.evaluate_array(us + h, vs + h)
-        uv_minus = self.evaluate_array(us - h, vs - h)
-
-        fu = (u_plus - surf_vertices)/h
-        fv = (v_plus - surf_vertices)/h
-        normal = np.cross(fu, fv)
-        norm = np.linalg.norm(normal, axis=1)[np.newaxis].T
-        normal = normal / norm
-
         fuu = (u_plus - 2*surf_vertices + u_minus) / h2
         fvv = (v_plus - 2*surf_vertices + v_minus) / h2
         fuv = (uv_plus - u_plus - v_plus + surf_vertices) / h2
+        return SurfaceDerivativesData(surf_vertices, fu, fv, fuu, fuv, fvv)
 
-        nuu = (fuu * normal).sum(axis=1)
-        nvv = (fvv * normal).sum(axis=1)
-        nuv = (fuv * normal).sum(axis=1)
-
-        duu = np.linalg.norm(fu, axis=1) **2
-        dvv = np.linalg.norm(fv, axis=1) **2
-        duv = (fu * fv).sum(axis=1)
+    def derivatives_data_array(self, us, vs):
+        return self._derivatives_array(us, vs, 1)
 
-        calc = SurfaceCurvatureCalculator(us, vs, order=order)
-        calc.set(surf_vertices, normal, fu, fv, duu, dvv, duv, nuu, nvv, nuv)
-        return calc
+    def curvature_calculator(self, us, vs, order=True):
+        data = self._derivatives_array(us, vs, 2)
+        return data.curvature_calculator(us, vs, order=order)
 
     def gauss_curvature_array(self, us, vs):
         calc = self.curvature_calculator(us, vs)
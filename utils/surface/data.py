@@ -19,10 +19,14 @@ class SurfaceCurvatureData(object):
         self.matrix = None
 
 class SurfaceDerivativesData(object):
-    def __init__(self, points, du, dv):
+    def __init__(self, points, du, dv, duu=None, duv=None, dvv=None):
         self.points = points
         self.du = du
         self.dv = dv
+        # second partial derivatives, only if they were requested
+        self.duu = duu
+        self.duv = duv
+        self.dvv = dvv
         self._normals = None
         self._normals_len = None
         self._unit_normals = None
@@ -75,6 +79,21 @@ class SurfaceDerivativesData(object):
         else:
             return matrices_np
 
+    def curvature_calculator(self, us, vs, order=True):
+        """Requires second partial derivatives"""
+        normal = self.unit_normals()
+        nuu = (self.duu * normal).sum(axis=1)
+        nvv = (self.dvv * normal).sum(axis=1)
+        nuv = (self.duv * normal).sum(axis=1)
+
+        duu = np.linalg.norm(self.du, axis=1) **2
+        dvv = np.linalg.norm(self.dv, axis=1) **2
+        duv = (self.du * self.dv).sum(axis=1)
+
+        calc = SurfaceCurvatureCalculator(us, vs, order=order)
+        calc.set(self.points, normal, self.du, self.dv, duu, dvv, duv, nuu, nvv, nuv)
+        return calc
+
 class SurfaceCurvatureCalculator(object):
     """
     This class contains pre-calculated first and second surface derivatives,
@@ -735,48 +735,23 @@ class SvGeomdlSurface(SvNurbsSurface):
             spline_normals = np.array( operations.normal(self.surface, uv_coords) )[:,1,:]
             return spline_normals
 
-    def derivatives_list(self, us, vs):
+    def derivatives_list(self, us, vs, order=2):
         result = []
         for u, v in zip(us, vs):
-            ds = self.surface.derivatives(u, v, order=2)
+            ds = self.surface.derivatives(u, v, order=order)
             result.append(ds)
         return np.array(result)
 
-    def curvature_calculator(self, us, vs, order=True):
-        surf_vertices = self.evaluate_array(us, vs)
-
-        derivatives = self.derivatives_list(us, vs)
-        # derivatives[i][j][k] = derivative w.r.t U j times, w.r.t. V k times, at i'th pair of (u, v)
-        fu = derivatives[:,1,0]
-        fv = derivatives[:,0,1]
-
-        normal = np.cross(fu, fv)
-        norm = np.linalg.norm(normal, axis=1, keepdims=True)
-        normal = normal / norm
-
-        fuu = derivatives[:,2,0]
-        fvv = derivatives[:,0,2]
-        fuv = derivatives[:,1,1]
-
-        nuu = (fuu * normal).sum(axis=1)
-        nvv = (fvv * normal).sum(axis=1)
-        nuv = (fuv * normal).sum(axis=1)
-
-        duu = np.linalg.norm(fu, axis=1) **2
-        dvv = np.linalg.norm(fv, axis=1) **2
-        duv = (fu * fv).sum(axis=1)
-
-        calc = SurfaceCurvatureCalculator(us, vs, order=order)
-        calc.set(surf_vertices, normal, fu, fv, duu, dvv, duv, nuu, nvv, nuv)
-        return calc
-
-    def derivatives_data_array(self, us, vs):
-        surf_vertices = self.evaluate_array(us, vs)
-        derivatives = self.derivatives_list(us, vs)
+    def derivatives_array(self, us, vs, order=1):
+        derivatives = self.derivatives_list(us, vs, order)
         # derivatives[i][j][k] = derivative w.r.t U j times, w.r.t. V k times, at i'th pair of (u, v)
+        points = derivatives[:,0,0]
         du = derivatives[:,1,0]
         dv = derivatives[:,0,1]
-        return SurfaceDerivativesData(surf_vertices, du, dv)
+        if order < 2:
+            return SurfaceDerivativesData(points, du, dv)
+        return SurfaceDerivativesData(points, du, dv,
+                    derivatives[:,2,0], derivatives[:,1,1], derivatives[:,0,2])
 
 class SvNativeNurbsSurface(SvNurbsSurface):
     def __init__(self, degree_u, degree_v, knotvector_u, knotvector_v, control_points, weights, normalize_knots=False):
@@ -1019,6 +994,19 @@ class SvNativeNurbsSurface(SvNurbsSurface):
         pu = self.degree_u
         pv = self.degree_v
         ku, kv, _ = self.control_points.shape
+        sparse_u = self.basis_u.span_derivatives(pu, ku, us, deriv_order_u)
+        sparse_v = self.basis_v.span_derivatives(pv, kv, vs, deriv_order_v)
+        if sparse_u is not None and sparse_v is not None:
+            # only (pu+1) x (pv+1) control points have effect at each point
+            idx_u, ders_u = sparse_u # (n, pu+1), (deriv_order_u+1, n, pu+1)
+            idx_v, ders_v = sparse_v # (n, pv+1), (deriv_order_v+1, n, pv+1)
+            idx_u, idx_v = idx_u[:,:,np.newaxis], idx_v[:,np.newaxis,:]
+            ns = ders_u[deriv_order_u][:,:,np.newaxis] * ders_v[deriv_order_v][:,np.newaxis,:] # (n, pu+1, pv+1)
+            coeffs = ns * self.weights[idx_u, idx_v] # (n, pu+1, pv+1)
+            numerator = np.einsum('nij,nijd->nd', coeffs, self.control_points[idx_u, idx_v]) # (n,3)
+            denominator = coeffs.sum(axis=(1,2))[np.newaxis].T # (n,1)
+            return numerator, denominator
+
         nsu = np.array([self.basis_u.derivative(i, pu, deriv_order_u)(us) for i in range(ku)]) # (ku, n)
         nsv = np.array([self.basis_v.derivative(i, pv, deriv_order_v)(vs) for i in range(kv)]) # (kv, n)
         nsu = np.transpose(nsu[np.newaxis], axes=(1,0,2)) # (ku, 1, n)
@@ -1035,6 +1023,55 @@ class SvNativeNurbsSurface(SvNurbsSurface):
 
         return numerator, denominator
 
+    def fractions(self, max_order, us, vs):
+        """
+        Numerators and denominators of all partial derivatives up to max_order
+        (inclusive), with basis functions calculated once for all of them.
+
+        output: dictionary {(deriv_order_u, deriv_order_v): (numerator, denominator)}
+        """
+        pu = self.degree_u
+        pv = self.degree_v
+        ku, kv, _ = self.control_points.shape
+        orders = [(i, j) for i in range(max_order+1) for j in range(max_order+1-i)]
+        sparse_u = self.basis_u.span_derivatives(pu, ku, us, max_order)
+        sparse_v = self.basis_v.span_derivatives(pv, kv, vs, max_order)
+        if sparse_u is None or sparse_v is None:
+            return {(i, j): self.fraction(i, j, us, vs) for i, j in orders}
+
+        idx_u, ders_u = sparse_u
+        idx_v, ders_v = sparse_v
+        idx_u, idx_v = idx_u[:,:,np.newaxis], idx_v[:,np.newaxis,:]
+        weights = self.weights[idx_u, idx_v] # (n, pu+1, pv+1)
+        controls = self.control_points[idx_u, idx_v] # (n, pu+1, pv+1, 3)
+        result = dict()
+        for i, j in orders:
+            coeffs = ders_u[i][:,:,np.newaxis] * ders_v[j][:,np.newaxis,:] * weights
+            numerator = np.einsum('nij,nijd->nd', coeffs, controls)
+            denominator = coeffs.sum(axis=(1,2))[np.newaxis].T
+            result[(i, j)] = (numerator, denominator)
+        return result
+
+    def derivatives_array(self, us, vs, order=1):
+        # See The NURBS Book, 2nd edition, p.4.5, eq. 4.20
+        fractions = self.fractions(order, us, vs)
+        numerator, denominator = fractions[(0, 0)]
+        surface = nurbs_divide(numerator, denominator)
+        numerator_u, denominator_u = fractions[(1, 0)]
+        numerator_v, denominator_v = fractions[(0, 1)]
+        surface_u = nurbs_divide(numerator_u - surface*denominator_u, denominator)
+        surface_v = nurbs_divide(numerator_v - surface*denominator_v, denominator)
+        if order < 2:
+            return SurfaceDerivativesData(surface, surface_u, surface_v)
+
+        numerator_uu, denominator_uu = fractions[(2, 0)]
+        surface_uu = nurbs_divide(numerator_uu - 2*surface_u*denominator_u - surface*denominator_uu, denominator)
+        numerator_vv, denominator_vv = fractions[(0, 2)]
+        surface_vv = nurbs_divide(numerator_vv - 2*surface_v*denominator_v - surface*denominator_vv, denominator)
+        numerator_uv, denominator_uv = fractions[(1, 1)]
+        surface_uv = nurbs_divide(numerator_uv - surface_v*denominator_u - surface_u*denominator_v - surface*denominator_uv, denominator)
+        return SurfaceDerivativesData(surface, surface_u, surface_v, surface_uu, surface_uv, surface_vv)
+
     def evaluate_array(self, us, vs):
         numerator, denominator = self.fraction(0, 0, us, vs)
         return nurbs_divide(numerator, denominator)
@@ -1043,13 +1080,8 @@ class SvNativeNurbsSurface(SvNurbsSurface):
         return self.normal_array(np.array([u]), np.array([v]))[0]
 
     def normal_array(self, us, vs):
-        numerator, denominator = self.fraction(0, 0, us, vs)
-        surface = nurbs_divide(numerator, denominator)
-        numerator_u, denominator_u = self.fraction(1, 0, us, vs)
-        numerator_v, denominator_v = self.fraction(0, 1, us, vs)
-        surface_u = nurbs_divide(numerator_u - surface*denominator_u, denominator)
-        surface_v = nurbs_divide(numerator_v - surface*denominator_v, denominator)
-        normal = np.cross(surface_u, surface_v)
+        data = self.derivatives_array(us, vs, 1)
+        normal = data.normals()
         n = np.linalg.norm(normal, axis=1, keepdims=True)
         normal = nurbs_divide(normal, n)
         return normal
@@ -1089,48 +1121,6 @@ class SvNativeNurbsSurface(SvNurbsSurface):
             else:
                 return curve
 
-    def derivatives_data_array(self, us, vs):
-        numerator, denominator = self.fraction(0, 0, us, vs)
-        surface = nurbs_divide(numerator, denominator)
-        numerator_u, denominator_u = self.fraction(1, 0, us, vs)
-        numerator_v, denominator_v = self.fraction(0, 1, us, vs)
-        surface_u = (numerator_u - surface*denominator_u) / denominator
-        surface_v = (numerator_v - surface*denominator_v) / denominator
-        return SurfaceDerivativesData(surface, surface_u, surface_v)
-
-    def curvature_calculator(self, us, vs, order=True):
-    
-        numerator, denominator = self.fraction(0, 0, us, vs)
-        surface = nurbs_divide(numerator, denominator)
-        numerator_u, denominator_u = self.fraction(1, 0, us, vs)
-        numerator_v, denominator_v = self.fraction(0, 1, us, vs)
-        surface_u = (numerator_u - surface*denominator_u) / denominator
-        surface_v = (numerator_v - surface*denominator_v) / denominator
-
-        normal = np.cross(surface_u, surface_v)
-        n = np.linalg.norm(normal, axis=1, keepdims=True)
-        normal = normal / n
-
-        numerator_uu, denominator_uu = self.fraction(2, 0, us, vs)
-        surface_uu = (numerator_uu - 2*surface_u*denominator_u - surface*denominator_uu) / denominator
-        numerator_vv, denominator_vv = self.fraction(0, 2, us, vs)
-        surface_vv = (numerator_vv - 2*surface_v*denominator_v - surface*denominator_vv) / denominator
-
-        numerator_uv, denominator_uv = self.fraction(1, 1, us, vs)
-        surface_uv = (numerator_uv - surface_v*denominator_u - surface_u*denominator_v - surface*denominator_uv) / denominator
-
-        nuu = (surface_uu * normal).sum(axis=1)
-        nvv = (surface_vv * normal).sum(axis=1)
-        nuv = (surface_uv * normal).sum(axis=1)
-
-        duu = np.linalg.norm(surface_u, axis=1) **2
-        dvv = np.linalg.norm(surface_v, axis=1) **2
-        duv = (surface_u * surface_v).sum(axis=1)
-
-        calc = SurfaceCurvatureCalculator(us, vs, order=order)
-        calc.set(surface, normal, surface_u, surface_v, duu, dvv, duv, nuu, nvv, nuv)
-        return calc
-
 def build_from_curves(curves, degree_u = None, implementation = SvNurbsSurface.NATIVE):
     curves = unify_curves(curves)
     degree_v = curves[0].get_degree()
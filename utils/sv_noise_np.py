@@ -0,0 +1,256 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+NumPy implementation of noise bases of mathutils.noise. mathutils evaluates
+noise for one point per call, so noise of big arrays of points is dominated
+by Python overhead; functions of this module evaluate whole arrays at once.
+
+The bases follow the algorithms used by Blender (gradient noise, Worley
+cellular noise, Musgrave fractals), but the lattice hashing is different, so
+the values are not equal to mathutils ones. Bases which are not implemented
+here (see NOISE_TYPES) should be evaluated by mathutils.
+
+All functions take an array of points of shape (..., 3) and return an array
+of shape (...), or (..., 3) for vector noise.
+"""
+
+import numpy as np
+
+from sverchok.utils.sv_seed_funcs import get_offset
+
+# noise bases implemented in this module
+NOISE_TYPES = {
+    'PERLIN_ORIGINAL', 'PERLIN_NEW',
+    'VORONOI_F1', 'VORONOI_F2', 'VORONOI_F3', 'VORONOI_F4',
+    'VORONOI_F2F1', 'VORONOI_CRACKLE',
+    'CELLNOISE'
+}
+
+# gradients of improved Perlin noise: middles of cube edges
+EDGE_GRADIENTS = np.array([
+    [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0],
+    [1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],
+    [0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1]], dtype=np.float64)
+
+CORNERS = np.array([[i, j, k] for k in range(2) for j in range(2) for i in range(2)])
+NEIGHBOURS = np.array([[i, j, k] for k in (-1, 0, 1) for j in (-1, 0, 1) for i in (-1, 0, 1)])
+
+def _mix(h):
+    # uint32 arithmetic of hashes overflows by design
+    with np.errstate(over='ignore'):
+        h = h ^ (h >> np.uint32(16))
+        h = h * np.uint32(0x7feb352d)
+        h = h ^ (h >> np.uint32(15))
+        h = h * np.uint32(0x846ca68b)
+        return h ^ (h >> np.uint32(16))
+
+HASH_FACTORS = (np.uint32(0x8da6b343), np.uint32(0xd8163841), np.uint32(0xcb1ab31f))
+
+def _axis_hashes(cells):
+    """Hashes of each coordinate of integer lattice points of shape (..., 3)"""
+    cells = cells.astype(np.int64).astype(np.uint32)
+    with np.errstate(over='ignore'):
+        return [cells[..., i] * factor for i, factor in enumerate(HASH_FACTORS)]
+
+def _hash(cells):
+    """uint32 hash of integer lattice points, cells is an array of shape (..., 3)"""
+    hx, hy, hz = _axis_hashes(cells)
+    return _mix(hx ^ hy ^ hz)
+
+def _unit(h):
+    """Map uint32 hash to [0, 1)"""
+    return h.astype(np.float64) / 4294967296.0
+
+def _random_gradients(h):
+    """Pseudo-random unit vectors for hashes, as a tuple of coordinates"""
+    h2 = _mix(h)
+    z = 2.0 * _unit(h) - 1.0
+    phi = 2.0 * np.pi * _unit(h2)
+    r = np.sqrt(1.0 - z*z)
+    return r * np.cos(phi), r * np.sin(phi), z
+
+def _edge_gradients(h):
+    i = h % np.uint32(12)
+    return EDGE_GRADIENTS[i, 0], EDGE_GRADIENTS[i, 1], EDGE_GRADIENTS[i, 2]
+
+def _gradient_noise(points, fade, gradients):
+    cells = np.floor(points)
+    fracs = points - cells
+    fx, fy, fz = fracs[..., 0], fracs[..., 1], fracs[..., 2]
+    with np.errstate(over='ignore'):
+        hx, hy, hz = [(h, h + factor) for h, factor in zip(_axis_hashes(cells), HASH_FACTORS)]
+    values = []
+    for i, j, k in CORNERS:
+        gx, gy, gz = gradients(_mix(hx[i] ^ hy[j] ^ hz[k]))
+        values.append(gx * (fx - i) + gy * (fy - j) + gz * (fz - k))
+    # trilinear interpolation: x, then y, then z
+    tx, ty, tz = fade(fx), fade(fy), fade(fz)
+    xs = [v0 + tx * (v1 - v0) for v0, v1 in zip(values[0::2], values[1::2])]
+    ys = [v0 + ty * (v1 - v0) for v0, v1 in zip(xs[0::2], xs[1::2])]
+    return ys[0] + tz * (ys[1] - ys[0])
+
+def perlin_original(points):
+    """Classic Perlin noise: random unit gradients, cubic easing. Values are about [-1, 1]"""
+    fade = lambda t: t * t * (3.0 - 2.0 * t)
+    return 1.5 * _gradient_noise(points, fade, _random_gradients)
+
+def perlin_new(points):
+    """Improved Perlin noise: edge gradients, quintic easing. Values are about [-1, 1]"""
+    fade = lambda t: t * t * t * (t * (6.0 * t - 15.0) + 10.0)
+    return _gradient_noise(points, fade, _edge_gradients)
+
+def cell_noise(points):
+    """Random value of each unit cell. Values in [0, 1)"""
+    return _unit(_hash(np.floor(points)))
+
+def voronoi(points):
+    """
+    Worley noise with one feature point per unit cell.
+    Returns distances to four nearest feature points, array of shape (4, ...).
+    """
+    cells = np.floor(points)
+    fracs = points - cells
+    # hashes of neighbour cells are combined from hashes of their coordinates
+    with np.errstate(over='ignore'):
+        axis_hashes = [(h - factor, h, h + factor) for h, factor in zip(_axis_hashes(cells), HASH_FACTORS)]
+    # sorted squared distances to the nearest feature points
+    nearest = [np.full(points.shape[:-1], np.inf) for i in range(4)]
+    for ox, oy, oz in NEIGHBOURS + 1:
+        h = _mix(axis_hashes[0][ox] ^ axis_hashes[1][oy] ^ axis_hashes[2][oz])
+        h2 = _mix(h)
+        h3 = _mix(h2)
+        dx = _unit(h) + (ox - 1) - fracs[..., 0]
+        dy = _unit(h2) + (oy - 1) - fracs[..., 1]
+        dz = _unit(h3) + (oz - 1) - fracs[..., 2]
+        d = dx*dx + dy*dy + dz*dz
+        for i in range(4):
+            d, nearest[i] = np.maximum(d, nearest[i]), np.minimum(d, nearest[i])
+    return np.sqrt(np.array(nearest))
+
+def generic_noise(points, noise_type):
+    """Unsigned noise, as BLI_noise_generic_noise. Values in [0, 1] for most bases"""
+    if noise_type == 'PERLIN_ORIGINAL':
+        return 0.5 + 0.5 * perlin_original(points)
+    if noise_type == 'PERLIN_NEW':
+        return 0.5 + 0.5 * perlin_new(points)
+    if noise_type == 'CELLNOISE':
+        return cell_noise(points)
+    if noise_type.startswith('VORONOI_'):
+        da = voronoi(points)
+        if noise_type == 'VORONOI_F2F1':
+            return da[1] - da[0]
+        if noise_type == 'VORONOI_CRACKLE':
+            return np.minimum(10.0 * (da[1] - da[0]), 1.0)
+        return da[int(noise_type[-1]) - 1]
+    raise Exception("Unsupported noise type: {}".format(noise_type))
+
+def noise(points, noise_type):
+    """Signed noise, as mathutils.noise.noise"""
+    return 2.0 * generic_noise(np.asarray(points, dtype=np.float64), noise_type) - 1.0
+
+def seed_offsets(seed):
+    """
+    Offsets of the points for each component of vector noise. They are
+    offsets of sv_seed_funcs for seed, seed + 1 and seed + 2, so the seed
+    shifts the points as in other noise nodes rather than changes the noise.
+    """
+    return np.array([get_offset(seed + i) for i in range(3)], dtype=np.float64)
+
+def noise_vector(points, noise_type, seed=0):
+    """Vector noise, as mathutils.noise.noise_vector"""
+    points = np.asarray(points, dtype=np.float64)
+    if points.shape[-1:] != (3,):  # e.g. empty list
+        points = points.reshape((-1, 3))
+    return np.stack([noise(points + offset, noise_type) for offset in seed_offsets(seed)], axis=-1)
+
+def _octaves(octaves):
+    return int(octaves), octaves - int(octaves)
+
+def fractal(points, h_factor, lacunarity, octaves, noise_type):
+    """Fractal Brownian motion, as mathutils.noise.fractal"""
+    points = np.asarray(points, dtype=np.float64)
+    n, rmd = _octaves(octaves)
+    pw_hl = lacunarity ** -h_factor
+    pwr = 1.0
+    value = np.zeros(points.shape[:-1])
+    for i in range(n):
+        value += noise(points, noise_type) * pwr
+        pwr *= pw_hl
+        points = points * lacunarity
+    if rmd != 0.0:
+        value += rmd * noise(points, noise_type) * pwr
+    return value
+
+def multi_fractal(points, h_factor, lacunarity, octaves, noise_type):
+    """Multifractal noise, as mathutils.noise.multi_fractal"""
+    points = np.asarray(points, dtype=np.float64)
+    n, rmd = _octaves(octaves)
+    pw_hl = lacunarity ** -h_factor
+    pwr = 1.0
+    value = np.ones(points.shape[:-1])
+    for i in range(n):
+        value *= pwr * noise(points, noise_type) + 1.0
+        pwr *= pw_hl
+        points = points * lacunarity
+    if rmd != 0.0:
+        value *= rmd * noise(points, noise_type) * pwr + 1.0
+    return value
+
+def hetero_terrain(points, h_factor, lacunarity, octaves, offset, noise_type):
+    """Heterogenous terrain, as mathutils.noise.hetero_terrain"""
+    points = np.asarray(points, dtype=np.float64)
+    n, rmd = _octaves(octaves)
+    pw_hl = lacunarity ** -h_factor
+    pwr = pw_hl
+    value = offset + noise(points, noise_type)
+    points = points * lacunarity
+    for i in range(1, n):
+        value += (noise(points, noise_type) + offset) * pwr * value
+        pwr *= pw_hl
+        points = points * lacunarity
+    if rmd != 0.0:
+        value += rmd * (noise(points, noise_type) + offset) * pwr * value
+    return value
+
+def hybrid_multi_fractal(points, h_factor, lacunarity, octaves, offset, gain, noise_type):
+    """Hybrid multifractal, as mathutils.noise.hybrid_multi_fractal"""
+    points = np.asarray(points, dtype=np.float64)
+    n, rmd = _octaves(octaves)
+    pw_hl = lacunarity ** -h_factor
+    pwr = pw_hl
+    result = noise(points, noise_type) + offset
+    weight = gain * result
+    points = points * lacunarity
+    # Blender stops adding octaves to a point as soon as its weight is small
+    active = np.ones(result.shape, dtype=bool)
+    for i in range(1, n):
+        active &= weight > 0.001
+        weight = np.minimum(weight, 1.0)
+        signal = (noise(points, noise_type) + offset) * pwr
+        pwr *= pw_hl
+        result = np.where(active, result + weight * signal, result)
+        weight = np.where(active, weight * gain * signal, weight)
+        points = points * lacunarity
+    if rmd != 0.0:
+        result += rmd * (noise(points, noise_type) + offset) * pwr
+    return result
+
+def ridged_multi_fractal(points, h_factor, lacunarity, octaves, offset, gain, noise_type):
+    """Ridged multifractal, as mathutils.noise.ridged_multi_fractal"""
+    points = np.asarray(points, dtype=np.float64)
+    pw_hl = lacunarity ** -h_factor
+    pwr = pw_hl
+    signal = (offset - np.abs(noise(points, noise_type))) ** 2
+    result = signal
+    for i in range(1, int(octaves)):
+        points = points * lacunarity
+        weight = np.clip(signal * gain, 0.0, 1.0)
+        signal = weight * (offset - np.abs(noise(points, noise_type))) ** 2
+        result = result + signal * pwr
+        pwr *= pw_hl
+    return result
@@ -20,6 +20,12 @@ noise_options = [
     ('CELLNOISE', 14)
 ]
 
+# Implementations of Blender noise types. NumPy is much faster but gives other
+# patterns, so Mathutils is the default and node trees keep their results
+implementation_modes = [
+    ("NumPy", "NumPy", "NumPy (mathutils for noise types not implemented in NumPy)", 0),
+    ("Mathutils", "Mathutils", "Mathutils", 1)]
+
 def get_noise_type(name):
     return dict(noise_options)[name]
 
@@ -1,12 +1,19 @@
+from threading import RLock
+
 from mathutils import noise
 
+# the seed of mathutils noise is global, code which can be run in worker
+# threads should hold the lock from setting the seed till getting the noise
+noise_lock = RLock()
+
 
 def get_offset(seed):
     if seed == 0:
         offset = [0.0, 0.0, 0.0]
     else:
-        noise.seed_set(seed)
-        offset = noise.random_unit_vector() * 10.0
+        with noise_lock:
+            noise.seed_set(seed)
+            offset = noise.random_unit_vector() * 10.0
     return offset
 
 
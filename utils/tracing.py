@@ -0,0 +1,147 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Tracing of tree evaluation. Unlike profiling it records only events of nodes
+(when they start and finish, how much data they get etc.), so it's cheap
+enough to keep it on during ordinary work. The records can be saved in
+Chrome trace event format (can be opened in chrome://tracing or
+https://ui.perfetto.dev) or aggregated into per node histogram. Usage:
+
+    from sverchok.utils import tracing
+    tracing.start()
+    ...  # update trees
+    tracing.tracer.save_chrome_trace("/path/to/trace.json")
+    tracing.tracer.save_histogram("/path/to/histogram.csv")
+    tracing.stop()
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import sys
+import threading
+from collections import deque, defaultdict
+from time import perf_counter
+from typing import Optional
+
+import numpy as np
+
+from sverchok.utils.logging import info
+
+# kinds of events
+NODE = 'node'  # execution of process method
+INPUTS = 'inputs'  # reading and conversion input data
+CACHE_HIT = 'cache hit'  # result was taken from a cache
+SKIPPED = 'skipped'  # input data was not changed
+
+# upper bounds of histogram bins in milliseconds
+HISTOGRAM_BINS = (0.1, 0.3, 1, 3, 10, 30, 100, 300, 1000, 3000, float('inf'))
+
+
+class Tracer:
+    """Keeps the last events of tree evaluation. Each event is a tuple of
+    (kind, tree name, node name, start, end, thread id, arguments). Time is in
+    seconds from the beginning of the tracing"""
+    def __init__(self, max_events: int = 1_000_000):
+        self.events: deque[tuple] = deque(maxlen=max_events)
+        self._start = perf_counter()
+
+    def add(self, kind: str, tree_name: str, node_name: str, start: float, end: float = None,
+            args: dict = None, tid: int = None):
+        """If end is None the event is instant. It does not read Blender data,
+        so names of a node should be taken by the caller in the main thread
+        :tid: id of the thread where the event happened, current by default"""
+        self.events.append((kind, tree_name, node_name, start - self._start,
+                            None if end is None else end - self._start,
+                            threading.get_ident() if tid is None else tid, args))
+
+    def chrome_trace(self) -> dict:
+        """Events in Chrome trace event format"""
+        pid = os.getpid()
+        trace = []
+        for kind, tree_name, node_name, start, end, tid, args in list(self.events):
+            event = {"name": node_name if kind == NODE else f"{kind}: {node_name}",
+                     "cat": kind, "pid": pid, "tid": tid, "ts": start * 1e6}
+            if end is None:
+                event.update({"ph": "i", "s": "t"})
+            else:
+                event.update({"ph": "X", "dur": (end - start) * 1e6})
+            event["args"] = {"tree": tree_name, **(args or {})}
+            trace.append(event)
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, file_path: str):
+        with open(file_path, 'w') as file:
+            json.dump(self.chrome_trace(), file)
+        info(f"Trace with {len(self.events)} events is saved to {file_path}")
+
+    def histogram(self) -> dict[tuple[str, str], dict]:
+        """Aggregated statistics of execution time of nodes. Keys are tree
+        and node names"""
+        times = defaultdict(list)
+        hits = defaultdict(int)
+        for kind, tree_name, node_name, start, end, *_ in list(self.events):
+            if kind == NODE:
+                times[tree_name, node_name].append(end - start)
+            elif kind in {CACHE_HIT, SKIPPED}:
+                hits[tree_name, node_name] += 1
+
+        result = dict()
+        for key in times.keys() | hits.keys():
+            durations = np.array(times.get(key, []), dtype=float) * 1000
+            counts = np.zeros(len(HISTOGRAM_BINS), dtype=int)
+            if len(durations):
+                np.add.at(counts, np.searchsorted(HISTOGRAM_BINS, durations), 1)
+            result[key] = {
+                'calls': len(durations),
+                'total_ms': float(durations.sum()),
+                'mean_ms': float(durations.mean()) if len(durations) else 0.,
+                'max_ms': float(durations.max()) if len(durations) else 0.,
+                'hits': hits.get(key, 0),
+                'bins': counts.tolist(),
+            }
+        return result
+
+    def save_histogram(self, file_path: str):
+        """Saves the histogram in CSV format, nodes are sorted by total time"""
+        histogram = self.histogram()
+        with open(file_path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['tree', 'node', 'calls', 'total_ms', 'mean_ms', 'max_ms', 'hits']
+                            + [f'<{b}ms' for b in HISTOGRAM_BINS[:-1]] + [f'>{HISTOGRAM_BINS[-2]}ms'])
+            for (tree_name, node_name), stat in sorted(
+                    histogram.items(), key=lambda i: i[1]['total_ms'], reverse=True):
+                writer.writerow([tree_name, node_name, stat['calls'], f"{stat['total_ms']:.3f}",
+                                 f"{stat['mean_ms']:.3f}", f"{stat['max_ms']:.3f}", stat['hits']]
+                                + stat['bins'])
+        info(f"Histogram of {len(histogram)} nodes is saved to {file_path}")
+
+
+tracer: Optional[Tracer] = None  # None means tracing is off
+
+
+def start(max_events: int = 1_000_000):
+    global tracer
+    tracer = Tracer(max_events)
+
+
+def stop():
+    global tracer
+    tracer = None
+
+
+def data_size(data) -> int:
+    """Rough size of socket data in bytes. Only the first item of each nesting
+    level is measured, so it's cheap for big data"""
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    if isinstance(data, (list, tuple)) and data:
+        return sys.getsizeof(data) + len(data) * data_size(data[0])
+    return sys.getsizeof(data)
@@ -117,8 +117,9 @@ from mathutils.kdtree import KDTree
 
 from sverchok.utils.logging import debug, info, error
 from sverchok.utils.geom import center, LineEquation2D, CircleEquation2D
-from sverchok.utils.math import weighted_center
+from sverchok.utils.math import weighted_centers
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata
+from sverchok.utils.voronoi3d import lloyd_iterations
 
 TOLERANCE = 1e-9
 BIG_FLOAT = 1e38
@@ -1300,7 +1301,7 @@ def unique_points(points, eps=1e-4):
                 repeating.append(p)
     return mask, unique, repeating
 
-def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None):
+def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None, stop_tolerance=0.0, history=None):
     bounds = Bounds.new(bound_mode)
     bounds.init_from_sites(verts)
 
@@ -1330,11 +1331,7 @@ def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None):
                     make_faces = True,
                     ordered_faces = True,
                     max_sides = 20)
-        centers = []
-        for face in voronoi_faces[:n]:
-            face_verts = np.array([voronoi_verts[i] for i in face])
-            new_pt = weighted_center(face_verts, weight_field)
-            centers.append(tuple(new_pt))
+        centers = [tuple(center) for center in weighted_centers(voronoi_verts, voronoi_faces[:n], weight_field).tolist()]
 
         result = []
         i = 0
@@ -1351,9 +1348,5 @@ def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None):
     def restrict(pts):
         return [bounds.restrict(pt) for pt in pts]
 
-    points = restrict(verts)
-    for i in range(n_iterations):
-        points = iteration(points)
-        points = restrict(points)
-    return points
+    return lloyd_iterations(restrict(verts), iteration, restrict, n_iterations, stop_tolerance, history)
 
@@ -29,7 +29,8 @@ from sverchok.data_structure import repeat_last_for_length
 from sverchok.utils.sv_mesh_utils import mask_vertices, polygons_to_edges, point_inside_mesh
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, pydata_from_bmesh, bmesh_clip
 from sverchok.utils.geom import calc_bounds, bounding_sphere, PlaneEquation
-from sverchok.utils.math import project_to_sphere, weighted_center
+from sverchok.utils.math import weighted_centers, np_normalized_vectors
+from sverchok.utils.bvh_tree import bvh_find_nearest_array
 from sverchok.dependencies import scipy, FreeCAD
 
 if scipy is not None:
@@ -39,76 +40,155 @@ if FreeCAD is not None:
     from FreeCAD import Base
     import Part
 
-def voronoi3d_regions(sites, closed_only=True, recalc_normals=True, do_clip=False, clipping=1.0):
-    diagram = Voronoi(sites)
-    faces_per_site = defaultdict(list)
-    nsites = len(diagram.point_region)
-    nridges = len(diagram.ridge_points)
-    open_sites = set()
-    for ridge_idx in range(nridges):
-        site_idx_1, site_idx_2 = diagram.ridge_points[ridge_idx]
-        face = diagram.ridge_vertices[ridge_idx]
-        if -1 in face:
-            open_sites.add(site_idx_1)
-            open_sites.add(site_idx_2)
+def _split(items, sizes):
+    """Split list into consecutive sublists of given sizes"""
+    ends = np.cumsum(sizes).tolist()
+    return [items[i:j] for i, j in zip([0] + ends[:-1], ends)]
+
+def _clip_convex_cell(verts, faces, bounds):
+    """
+    Clip convex polyhedron with outwards oriented faces by a box.
+    Returns new vertices and faces; the box faces are filled.
+    """
+    x_min, x_max, y_min, y_max, z_min, z_max = bounds
+    planes = [(0, -1.0, -x_min), (0, 1.0, x_max),
+              (1, -1.0, -y_min), (1, 1.0, y_max),
+              (2, -1.0, -z_min), (2, 1.0, z_max)]
+    verts = list(map(tuple, verts))
+    for axis, sign, offset in planes:
+        # signed distances to the plane, positive outside
+        distances = [sign * v[axis] - offset for v in verts]
+        if max(distances) <= 0:
             continue
-        faces_per_site[site_idx_1].append(face)
-        faces_per_site[site_idx_2].append(face)
-
-    new_verts = []
-    new_edges = []
-    new_faces = []
-
-    for site_idx in sorted(faces_per_site.keys()):
-        if closed_only and site_idx in open_sites:
-            continue
-        done_verts = dict()
-        bm = bmesh.new()
-        add_vert = bm.verts.new
-        add_face = bm.faces.new
-        for face in faces_per_site[site_idx]:
-            face_bm_verts = []
-            for vertex_idx in face:
-                if vertex_idx not in done_verts:
-                    bm_vert = add_vert(diagram.vertices[vertex_idx])
-                    done_verts[vertex_idx] = bm_vert
-                else:
-                    bm_vert = done_verts[vertex_idx]
-                face_bm_verts.append(bm_vert)
-            add_face(face_bm_verts)
-        bm.verts.index_update()
-        bm.verts.ensure_lookup_table()
-        bm.faces.index_update()
-        bm.edges.index_update()
-
-        if closed_only and any (v.is_boundary for v in bm.verts):
-            bm.free()
-            continue
-
-        if recalc_normals:
-            bm.normal_update()
-            bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
+        new_verts = []
+        vert_index = dict()
+        def add_vert(key, co):
+            if key not in vert_index:
+                vert_index[key] = len(new_verts)
+                new_verts.append(co)
+            return vert_index[key]
+
+        new_faces = []
+        cap = set()
+        for face in faces:
+            new_face = []
+            for i, j in zip(face, face[1:] + face[:1]):
+                d_i, d_j = distances[i], distances[j]
+                if d_i <= 0:
+                    new_face.append(add_vert(i, verts[i]))
+                    if d_i == 0:
+                        cap.add(new_face[-1])
+                if (d_i <= 0) != (d_j <= 0):
+                    t = d_i / (d_i - d_j)
+                    co = tuple(a + t * (b - a) for a, b in zip(verts[i], verts[j]))
+                    new_face.append(add_vert((min(i, j), max(i, j)), co))
+                    cap.add(new_face[-1])
+            if len(new_face) >= 3:
+                new_faces.append(new_face)
+        if len(new_faces) == 0:
+            return [], []
+
+        if len(cap) >= 3:
+            # order points of the cap counterclockwise when seen from outside
+            cap = list(cap)
+            cap_verts = np.array([new_verts[i] for i in cap])
+            u_axis, v_axis = [a for a in range(3) if a != axis]
+            rel = cap_verts - cap_verts.mean(axis=0)
+            angles = np.arctan2(sign * rel[:, v_axis], rel[:, u_axis])
+            if axis == 1:
+                angles = -angles
+            new_faces.append([cap[i] for i in np.argsort(angles)])
+        verts, faces = new_verts, new_faces
+    return [list(v) for v in verts], faces
 
-        region_verts, region_edges, region_faces = pydata_from_bmesh(bm)
-        bm.free()
-        new_verts.append(region_verts)
-        new_edges.append(region_edges)
-        new_faces.append(region_faces)
+def voronoi3d_regions(sites, closed_only=True, recalc_normals=True, do_clip=False, clipping=1.0):
+    diagram = Voronoi(sites)
+    sites = diagram.points
+    nverts = len(diagram.vertices)
+    ridge_points = diagram.ridge_points
+    ridge_sizes = np.array([len(face) for face in diagram.ridge_vertices])
+    ridge_starts = np.cumsum(ridge_sizes) - ridge_sizes
+    ridge_verts = np.fromiter(itertools.chain.from_iterable(diagram.ridge_vertices),
+                              dtype=np.int64, count=ridge_sizes.sum())
+
+    open_ridges = np.add.reduceat(ridge_verts == -1, ridge_starts) > 0
+    open_sites = np.zeros(len(sites), dtype=bool)
+    open_sites[ridge_points[open_ridges].ravel()] = True
+
+    # Each finite ridge is a face of both cells it separates;
+    # faces of each cell are in the order of ridges.
+    face_sites = ridge_points.ravel().astype(np.int64)
+    face_others = ridge_points[:, ::-1].ravel()
+    face_ridges = np.repeat(np.arange(len(ridge_points)), 2)
+    good = ~open_ridges[face_ridges]
+    if closed_only:
+        good &= ~open_sites[face_sites]
+    order = np.argsort(face_sites[good], kind='stable')
+    face_sites = face_sites[good][order]
+    face_others = face_others[good][order]
+    face_ridges = face_ridges[good][order]
+    if len(face_sites) == 0:
+        return [], [], []
+
+    # index of each corner of each face in ridge_verts
+    face_sizes = ridge_sizes[face_ridges]
+    face_starts = np.cumsum(face_sizes) - face_sizes
+    corner_faces = np.repeat(np.arange(len(face_sites)), face_sizes)
+    corner_pos = np.arange(face_sizes.sum()) - face_starts[corner_faces]
+    corner_sizes = face_sizes[corner_faces]
+
+    if recalc_normals or do_clip:
+        # Newell normals of ridges; a face is oriented outwards
+        # if its normal points from the site to the neighbour site.
+        ridge_corners = np.repeat(ridge_starts, ridge_sizes)
+        ridge_pos = np.arange(len(ridge_verts)) - ridge_corners
+        next_verts = ridge_verts[ridge_corners + (ridge_pos + 1) % np.repeat(ridge_sizes, ridge_sizes)]
+        crosses = np.cross(diagram.vertices[ridge_verts], diagram.vertices[next_verts])
+        ridge_normals = np.add.reduceat(crosses, ridge_starts)
+        directions = sites[face_others] - sites[face_sites]
+        flip = (ridge_normals[face_ridges] * directions).sum(axis=1) < 0
+        corner_pos = np.where(flip[corner_faces], corner_sizes - 1 - corner_pos, corner_pos)
+
+    corner_ridge_idxs = ridge_starts[face_ridges][corner_faces] + corner_pos
+    corner_verts = ridge_verts[corner_ridge_idxs]
+    corner_sites = face_sites[corner_faces]
+
+    # Vertices of each cell in the order of their first appearance in faces
+    keys, first, inverse = np.unique(corner_sites * nverts + corner_verts, return_index=True, return_inverse=True)
+    new_order = np.argsort(first)
+    new_index = np.empty_like(new_order)
+    new_index[new_order] = np.arange(len(new_order))
+    corner_global = new_index[inverse.ravel()]
+    vert_sites = keys[new_order] // nverts
+    cell_sites, cell_vert_starts, cell_nverts = np.unique(vert_sites, return_index=True, return_counts=True)
+    corner_local = corner_global - cell_vert_starts[np.searchsorted(cell_sites, corner_sites)]
+
+    # Edges of each cell in the order of their first appearance in faces
+    corner_face_starts = face_starts[corner_faces]
+    next_corner = corner_face_starts + (np.arange(len(corner_faces)) - corner_face_starts + 1) % corner_sizes
+    edge_global = np.sort(np.stack((corner_global, corner_global[next_corner])), axis=0)
+    _, first_edges = np.unique(edge_global[0] * len(keys) + edge_global[1], return_index=True)
+    first_edges.sort()
+    edges = np.stack((corner_local[first_edges], corner_local[next_corner[first_edges]]), axis=1)
+    cell_nedges = np.bincount(np.searchsorted(cell_sites, corner_sites[first_edges]), minlength=len(cell_sites))
+    cell_nfaces = np.bincount(np.searchsorted(cell_sites, face_sites), minlength=len(cell_sites))
+
+    new_verts = _split(diagram.vertices[keys[new_order] % nverts].tolist(), cell_nverts)
+    new_edges = _split(edges.tolist(), cell_nedges)
+    new_faces = _split(_split(corner_local.tolist(), face_sizes), cell_nfaces)
 
     if do_clip:
-        verts_n, edges_n, faces_n = [], [], []
         bounds = calc_bounds(sites, clipping)
-        for verts_i, edges_i, faces_i in zip(new_verts, new_edges, new_faces):
-            bm = bmesh_from_pydata(verts_i, edges_i, faces_i)
-            bmesh_clip(bm, bounds, fill=True)
-            bm.normal_update()
-            bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
-            verts_i, edges_i, faces_i = pydata_from_bmesh(bm)
-            bm.free()
-            verts_n.append(verts_i)
-            edges_n.append(edges_i)
-            faces_n.append(faces_i)
-        new_verts, new_edges, new_faces = verts_n, edges_n, faces_n
+        x_min, x_max, y_min, y_max, z_min, z_max = bounds
+        for i, verts_i in enumerate(new_verts):
+            vs = np.array(verts_i)
+            inside = (vs >= [x_min, y_min, z_min]).all() and (vs <= [x_max, y_max, z_max]).all()
+            if inside:
+                continue
+            verts_i, faces_i = _clip_convex_cell(vs, new_faces[i], bounds)
+            new_verts[i] = verts_i
+            new_edges[i] = polygons_to_edges([faces_i], True)[0]
+            new_faces[i] = faces_i
 
     return new_verts, new_edges, new_faces
 
@@ -393,37 +473,73 @@ def voronoi_on_solid(solid, sites,
         all_points.extend(bounds)
     return voronoi3d_regions(all_points, closed_only=True, do_clip=do_clip, clipping=clipping)
 
-def lloyd_on_mesh(verts, faces, sites, thickness, n_iterations, weight_field=None):
+def lloyd_iterations(points, iteration, restrict, n_iterations, stop_tolerance=0.0, history=None):
+    """
+    Common loop of Lloyd relaxation functions.
+
+    inputs:
+    * points - initial sites, already restricted to the domain
+    * iteration - function which moves sites to centers of their regions
+    * restrict - function which returns sites into the domain
+    * n_iterations - maximum number of iterations
+    * stop_tolerance - stop as soon as no site moved by more than this
+      distance during an iteration; 0 means do all iterations
+    * history - if a list is provided, maximum displacement of sites
+      at each iteration is appended to it
+
+    output: restricted sites after the last iteration.
+    """
+    for i in range(n_iterations):
+        new_points = restrict(iteration(points))
+        if len(new_points) == len(points):
+            displacement = np.linalg.norm(np.asarray(new_points) - np.asarray(points), axis=1).max(initial=0.0)
+        else:
+            displacement = np.inf
+        points = new_points
+        if history is not None:
+            history.append(displacement)
+        if displacement < stop_tolerance:
+            break
+    return points
+
+def voronoi_centers(diagram, sites, weight_field=None, vertices=None):
+    """
+    Weighted centers of Voronoi regions of the first len(sites) points of
+    scipy.spatial.Voronoi diagram. Open regions keep their sites.
+    vertices can be used to replace diagram.vertices.
+    """
+    if vertices is None:
+        vertices = diagram.vertices
+    regions = [diagram.regions[i] for i in diagram.point_region[:len(sites)]]
+    closed = np.array([len(region) > 0 and -1 not in region for region in regions], dtype=bool)
+    centers = np.array(sites, dtype=np.float64)
+    centers[closed] = weighted_centers(vertices, [r for r, ok in zip(regions, closed) if ok], weight_field)
+    return centers
+
+def lloyd_on_mesh(verts, faces, sites, thickness, n_iterations, weight_field=None, stop_tolerance=0.0, history=None):
     bvh = BVHTree.FromPolygons(verts, faces)
+    normals = None
 
-    def iteration(points):
-        n = len(points)
+    def restrict(points):
+        nonlocal normals
+        # normals are remembered for the next iteration
+        points, normals, _, _ = bvh_find_nearest_array(bvh, points)
+        normals = np_normalized_vectors(normals)
+        return points
 
-        normals = calc_bvh_normals(bvh, points)
+    def iteration(points):
         k = 0.5*thickness
-        points = np.array(points)
         plus_points = points + k*normals
         minus_points = points - k*normals
-        all_points = points.tolist() + plus_points.tolist() + minus_points.tolist()
+        all_points = np.concatenate((points, plus_points, minus_points))
 
         diagram = Voronoi(all_points)
-        centers = []
-        for site_idx in range(n):
-            region_idx = diagram.point_region[site_idx]
-            region = diagram.regions[region_idx]
-            region_verts = np.array([diagram.vertices[i] for i in region])
-            center = weighted_center(region_verts, weight_field)
-            centers.append(tuple(center))
-        return centers
-
-    points = calc_bvh_projections(bvh, sites)
-    for i in range(n_iterations):
-        points = iteration(points)
-        points = calc_bvh_projections(bvh, points)
+        return voronoi_centers(diagram, points, weight_field)
 
+    points = lloyd_iterations(restrict(sites), iteration, restrict, n_iterations, stop_tolerance, history)
     return points.tolist()
 
-def lloyd_in_mesh(verts, faces, sites, n_iterations, thickness=None, weight_field=None):
+def lloyd_in_mesh(verts, faces, sites, n_iterations, thickness=None, weight_field=None, stop_tolerance=0.0, history=None):
     bvh = BVHTree.FromPolygons(verts, faces)
 
     if thickness is None:
@@ -431,48 +547,29 @@ def lloyd_in_mesh(verts, faces, sites, n_iterations, thickness=None, weight_fiel
         thickness = max(x_max - x_min, y_max - y_min, z_max - z_min) / 4.0
 
     epsilon = 1e-8
+    on_surface = None
+    normals = None
 
     def iteration(points):
-        n = len(points)
-
-        all_points = points[:]
         k = 0.5*thickness
-        for p in points:
-            p = Vector(p)
-            loc, normal, index, distance = bvh.find_nearest(p)
-            if distance <= epsilon:
-                p1 = p + k * normal
-                all_points.append(tuple(p1))
+        all_points = np.concatenate((points, points[on_surface] + k * normals[on_surface]))
 
         diagram = Voronoi(all_points)
-        centers = []
-        for site_idx in range(n):
-            region_idx = diagram.point_region[site_idx]
-            region = diagram.regions[region_idx]
-            region_verts = np.array([diagram.vertices[i] for i in region])
-            center = weighted_center(region_verts, weight_field)
-            centers.append(tuple(center))
-        return centers
+        return voronoi_centers(diagram, points, weight_field)
 
     def restrict(points):
-        result = []
-        for p in points:
-            if point_inside_mesh(bvh, p):
-                result.append(p)
-            else:
-                loc, normal, index, distance = bvh.find_nearest(p)
-                if loc is not None:
-                    result.append(tuple(loc))
-        return result
-
-    points = restrict(sites)
-    for i in range(n_iterations):
-        points = iteration(points)
-        points = restrict(points)
-
-    return points
+        nonlocal on_surface, normals
+        points = np.asarray(points, dtype=np.float64)
+        inside = np.array([point_inside_mesh(bvh, p) for p in points.tolist()], dtype=bool)
+        nearest, normals, _, distances = bvh_find_nearest_array(bvh, points)
+        # sites on the surface are mirrored at the next iteration
+        on_surface = ~inside | (distances <= epsilon)
+        return np.where(inside[:,np.newaxis], points, nearest)
+
+    points = lloyd_iterations(restrict(sites), iteration, restrict, n_iterations, stop_tolerance, history)
+    return points.tolist()
 
-def lloyd_in_solid(solid, sites, n_iterations, tolerance=1e-4, weight_field=None):
+def lloyd_in_solid(solid, sites, n_iterations, tolerance=1e-4, weight_field=None, stop_tolerance=0.0, history=None):
     shell = solid.Shells[0]
 
     def invert(pt):
@@ -483,21 +580,14 @@ def lloyd_in_solid(solid, sites, n_iterations, tolerance=1e-4, weight_field=None
         return (dst.x, dst.y, dst.z)
 
     def iteration(pts):
-        n = len(pts)
-        all_pts = pts
+        all_pts = list(pts)
         for pt in pts:
             if solid.isInside(Base.Vector(pt), tolerance, False):
                 all_pts.append(invert(pt))
 
         diagram = Voronoi(all_pts)
-        centers = []
-        for site_idx in range(n):
-            region_idx = diagram.point_region[site_idx]
-            region = diagram.regions[region_idx]
-            region_verts = np.array([diagram.vertices[i] for i in region])
-            center = weighted_center(region_verts, weight_field)
-            centers.append(tuple(center))
-        return centers
+        centers = voronoi_centers(diagram, pts, weight_field)
+        return [tuple(center) for center in centers.tolist()]
 
     def restrict(points):
         result = []
@@ -511,13 +601,9 @@ def lloyd_in_solid(solid, sites, n_iterations, tolerance=1e-4, weight_field=None
                 result.append((v.x, v.y, v.z))
         return result
 
-    points = restrict(sites)
-    for i in range(n_iterations):
-        points = iteration(points)
-        points = restrict(points)
-    return points
+    return lloyd_iterations(restrict(sites), iteration, restrict, n_iterations, stop_tolerance, history)
 
-def lloyd_on_solid_surface(solid, sites, thickness, n_iterations, tolerance=1e-4, weight_field=None):
+def lloyd_on_solid_surface(solid, sites, thickness, n_iterations, tolerance=1e-4, weight_field=None, stop_tolerance=0.0, history=None):
     if solid.Shells:
         shell = solid.Shells[0]
     else:
@@ -526,14 +612,8 @@ def lloyd_on_solid_surface(solid, sites, thickness, n_iterations, tolerance=1e-4
     def iteration(pts):
         all_pts = pts + project_solid_normals(shell, pts, thickness)
         diagram = Voronoi(all_pts)
-        centers = []
-        for site_idx in range(len(pts)):
-            region_idx = diagram.point_region[site_idx]
-            region = diagram.regions[region_idx]
-            region_verts = np.array([diagram.vertices[i] for i in region])
-            center = weighted_center(region_verts, weight_field)
-            centers.append(tuple(center))
-        return centers
+        centers = voronoi_centers(diagram, pts, weight_field)
+        return [tuple(center) for center in centers.tolist()]
 
     def restrict(points):
         result = []
@@ -547,26 +627,15 @@ def lloyd_on_solid_surface(solid, sites, thickness, n_iterations, tolerance=1e-4
                 result.append((v.x, v.y, v.z))
         return result
 
-    points = restrict(sites)
-    for i in range(n_iterations):
-        points = iteration(points)
-        points = restrict(points)
-    return points
+    return lloyd_iterations(restrict(sites), iteration, restrict, n_iterations, stop_tolerance, history)
 
-def lloyd_on_fc_face(fc_face, sites, thickness, n_iterations, weight_field = None):
+def lloyd_on_fc_face(fc_face, sites, thickness, n_iterations, weight_field = None, stop_tolerance=0.0, history=None):
 
     def iteration(pts):
-        n = len(pts)
         all_pts = pts + project_solid_normals(fc_face, pts, thickness)
         diagram = Voronoi(all_pts)
-        centers = []
-        for site_idx in range(n):
-            region_idx = diagram.point_region[site_idx]
-            region = diagram.regions[region_idx]
-            region_verts = np.array([diagram.vertices[i] for i in region])
-            center = weighted_center(region_verts, weight_field)
-            centers.append(tuple(center))
-        return centers
+        centers = voronoi_centers(diagram, pts, weight_field)
+        return [tuple(center) for center in centers.tolist()]
 
     def project(point):
         dist, vs, infos = fc_face.distToShape(Part.Vertex(Base.Vector(point)))
@@ -586,17 +655,16 @@ def lloyd_on_fc_face(fc_face, sites, thickness, n_iterations, weight_field = Non
         projection = (pt.x, pt.y, pt.z)
         return uv, projection
 
+    uvpoints = None
+
     def restrict(points):
+        nonlocal uvpoints
         projections = [project(point) for point in points]
         uvpoints = [(uv[0], uv[1], 0) for uv,_ in projections if uv is not None]
         points = [r[1] for r in projections]
-        return uvpoints, points
-
-    uvpoints, points = restrict(sites)
-    for i in range(n_iterations):
-        points = iteration(points)
-        uvpoints, points = restrict(points)
+        return points
 
+    points = lloyd_iterations(restrict(sites), iteration, restrict, n_iterations, stop_tolerance, history)
     return uvpoints, points
 
 def lloyd_on_surface(surface, uv_sites, thickness, n_iterations, weight_field = None):
@@ -618,27 +686,20 @@ def lloyd_on_surface(surface, uv_sites, thickness, n_iterations, weight_field =
 
     return uvpoints, points
 
-def lloyd_on_sphere(center, radius, sites, n_iterations, weight_field=None):
+def lloyd_on_sphere(center, radius, sites, n_iterations, weight_field=None, stop_tolerance=0.0, history=None):
+    center = np.asarray(center, dtype=np.float64)
+
     def iteration(pts):
-        diagram = SphericalVoronoi(pts, radius=radius, center=np.array(center))
+        diagram = SphericalVoronoi(pts, radius=radius, center=center)
         diagram.sort_vertices_of_regions()
-        centers = []
-        for region in diagram.regions:
-            verts = np.array([diagram.vertices[i] for i in region])
-            new_vert = weighted_center(verts, weight_field)
-            centers.append(tuple(new_vert))
-        return centers
+        return weighted_centers(diagram.vertices, diagram.regions, weight_field)
 
     def restrict(points):
-        projections = [project_to_sphere(center, radius, pt) for pt in points]
-        return projections
-
-    points = restrict(sites)
-    for i in range(n_iterations):
-        points = iteration(points)
-        points = restrict(points)
+        dvs = np.asarray(points, dtype=np.float64) - center
+        return center + radius * dvs / np.linalg.norm(dvs, axis=1)[:,np.newaxis]
 
-    return points
+    points = lloyd_iterations(restrict(sites), iteration, restrict, n_iterations, stop_tolerance, history)
+    return points.tolist()
 
 class Bounds(object):
     @staticmethod
@@ -662,6 +723,18 @@ class Bounds(object):
     def make_mesh(self, diagram):
         raise Exception("not implemented")
 
+    # Versions of contains, restrict and invert for arrays of shape (n, 3)
+
+    def contains_array(self, points):
+        raise Exception("not implemented")
+
+    def restrict_array(self, points):
+        raise Exception("not implemented")
+
+    def invert_array(self, points):
+        projections = self.restrict_array(points)
+        return projections + 2 * (projections - points)
+
 class BoxBounds(Bounds):
     def __init__(self, points, clipping):
         points = np.array(points)
@@ -723,6 +796,16 @@ class BoxBounds(Bounds):
         #print(f"I: {point} => {projection} => {result}")
         return result
 
+    def contains_array(self, points):
+        min_pt = [self.min_x, self.min_y, self.min_z]
+        max_pt = [self.max_x, self.max_y, self.max_z]
+        return ((points >= min_pt) & (points <= max_pt)).all(axis=1)
+
+    def restrict_array(self, points):
+        min_pt = [self.min_x, self.min_y, self.min_z]
+        max_pt = [self.max_x, self.max_y, self.max_z]
+        return np.clip(points, min_pt, max_pt)
+
 class SphereBounds(Bounds):
     def __init__(self, points, clipping):
         self.center, self.radius = bounding_sphere(points)
@@ -748,41 +831,31 @@ class SphereBounds(Bounds):
         projection = self.restrict(point)
         return point + 2*(projection - point)
 
-def lloyd3d_bounded(bounds, sites, n_iterations, weight_field=None):
+    def contains_array(self, points):
+        return np.linalg.norm(points - self.center, axis=1) <= self.radius
+
+    def restrict_array(self, points):
+        dvs = points - self.center
+        return self.center + self.radius * dvs / np.linalg.norm(dvs, axis=1)[:,np.newaxis]
+
+    def invert_array(self, points):
+        projections = self.restrict_array(points)
+        return points + 2*(projections - points)
+
+def lloyd3d_bounded(bounds, sites, n_iterations, weight_field=None, stop_tolerance=0.0, history=None):
     def invert(points):
-        result = []
-        for pt in points:
-            if bounds.contains(pt):
-                r = bounds.invert(pt)
-                result.append(tuple(r))
-        return result
+        return bounds.invert_array(points[bounds.contains_array(points)])
 
     def restrict(points):
-        result = [tuple(point if bounds.contains(point) else bounds.restrict(point)) for point in points]
-        return result
+        points = np.asarray(points, dtype=np.float64)
+        inside = bounds.contains_array(points)
+        return np.where(inside[:,np.newaxis], points, bounds.restrict_array(points))
 
     def iteration(pts):
-        n = len(pts)
-        all_pts = pts + invert(pts)
+        all_pts = np.concatenate((pts, invert(pts)))
         diagram = Voronoi(all_pts)
         vertices = restrict(diagram.vertices)
-        centers = []
-        for site_idx in range(n):
-            region_idx = diagram.point_region[site_idx]
-            region = diagram.regions[region_idx]
-
-            if -1 in region:
-                site = pts[site_idx]
-                centers.append(site)
-                continue
-
-            region_verts = np.array([vertices[i] for i in region])
-            center = weighted_center(region_verts, weight_field)
-            centers.append(tuple(center))
-        return centers
+        return voronoi_centers(diagram, pts, weight_field, vertices)
 
-    points = restrict(sites)
-    for i in range(n_iterations):
-        points = iteration(points)
-        points = restrict(points)
-    return points
+    points = lloyd_iterations(restrict(sites), iteration, restrict, n_iterations, stop_tolerance, history)
+    return [tuple(point) for point in points.tolist()]